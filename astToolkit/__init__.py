@@ -11,6 +11,7 @@ Core Architecture Layers
 
 **Atomic Classes (Foundation Layer)**
 - `Be`: Type guard functions returning `TypeIs[ast.NodeType]` for safe type narrowing
+- `BeExact`: The predicates of `Be`, with a check of the exact class of the node before `isinstance`
 - `DOT`: Read-only attribute accessors with sophisticated typing support
 - `Grab`: Attribute modification functions that transform specific node attributes
 - `Make`: Factory methods for creating properly configured AST nodes
@@ -18,10 +19,26 @@ Core Architecture Layers
 **Visitor Classes (Traversal Layer)**
 - `NodeTourist`: Read-only AST traversal extending `ast.NodeVisitor`
 - `NodeChanger`: Destructive AST modification extending `ast.NodeTransformer`
+- `NodeTouristSuite`, `NodeChangerSuite`: Many `NodeTourist` or `NodeChanger` rules fused into one traversal
+- `walkPreOrder`, `walkPostOrder`: Explicit-stack traversals used by both visitor classes
+- `mapPathFilenames`, `rewritePathFilenames`: Parse-and-visit many source files in parallel processes
+- `CallGraph`: The functions of a module that each function calls, with its recursive functions and an order for inlining
+- `TreeIndex`: Parent, field name, and `list` index of every node, built in one traversal
+- `DescendantMatchIndex`: Whether any descendant of each node matches a predicate, built bottom-up once
+- `IdentifierIndex`: The nodes that bind or reference each identifier, by role, such as `'load'`, `'call'`, or `'def'`
+- `NodeClassIndex`: The nodes of each `ast` class in document order, rebuilt after a watched `NodeChanger` changes the tree
+- `ScopeAnalysis`, `Scope`: The names that each module, function, lambda, class, and comprehension binds, its free names, and its def-use chains
+- `ProfilerOfRules`: Opt-in call counts, match counts, and time of `findThis` and `doThat` per rule
+- `StructuralHasher`, `structuralHash`, `areStructurallyEqual`: Compare trees by structure, ignoring positions, without unparsing
+- `UnparseCache`: The `ast.unparse` code of each node, computed once per node until a watched `NodeChanger` changes it
 
 **Composable APIs (Predicate/Action Layer)**
 - `IfThis`: Predicate functions for node identification and pattern matching
 - `Then`: Action functions for matched nodes including collection, transformation, and extraction
+- `metadataOfPredicate`: The candidate classes, attribute, and child predicates of a `Be` or `IfThis` predicate
+- `compilePredicate`: One flat, generated function for a predicate composed of `Be` and `IfThis` predicates
+- `CodeTemplate`: Match Python source code with `$placeholders`, such as `'$a + $b * $a'`, bind the placeholders, and fill other templates
+- `Find`: A predicate written as a path in dot notation, such as `Find.Assign.targets.at(0).Name.id.equal('x')`, compiled once
 
 **Container Classes (High-Level Layer)**
 - `IngredientsFunction`: Function representation with dependencies and metadata
@@ -113,12 +130,30 @@ if (3, 14) <= sys.version_info:
 from astToolkit._theSSOT import packageSettings  # pyright: ignore[reportUnusedImport]
 
 # isort: split
-from astToolkit._toolkitNodeVisitor import NodeChanger as NodeChanger, NodeTourist as NodeTourist
+from astToolkit._toolkitNodeVisitor import (
+	NodeChanger as NodeChanger, NodeChangerSuite as NodeChangerSuite, NodeTourist as NodeTourist,
+	NodeTouristSuite as NodeTouristSuite, StopTraversal as StopTraversal, walkPostOrder as walkPostOrder,
+	walkPreOrder as walkPreOrder)
+
+# isort: split
+from astToolkit._toolkitCallGraph import CallGraph as CallGraph
+from astToolkit._toolkitCodeTemplate import CodeTemplate as CodeTemplate
+from astToolkit._toolkitIndex import (
+	DescendantMatchIndex as DescendantMatchIndex, IdentifierIndex as IdentifierIndex, NodeClassIndex as NodeClassIndex,
+	rolesIdentifier as rolesIdentifier, TreeIndex as TreeIndex)
+from astToolkit._toolkitPredicateMetadata import metadataOfPredicate as metadataOfPredicate, PredicateMetadata as PredicateMetadata
+from astToolkit._toolkitStructuralHash import (
+	areStructurallyEqual as areStructurallyEqual, StructuralHasher as StructuralHasher, structuralHash as structuralHash)
+from astToolkit._toolkitProfiler import ProfilerOfRules as ProfilerOfRules
+from astToolkit._toolkitScope import Scope as Scope, ScopeAnalysis as ScopeAnalysis
+from astToolkit._toolkitUnparseCache import UnparseCache as UnparseCache
 
 # isort: split
 from astToolkit._dumpHandmade import dump as dump
 from astToolkit._toolBe import Be as Be
+from astToolkit._toolBeExact import BeExact as BeExact
 from astToolkit._toolDOT import DOT as DOT
+from astToolkit._toolFind import Find as Find
 from astToolkit._toolGrab import Grab as Grab
 from astToolkit._toolMake import Make as Make
 
@@ -126,8 +161,14 @@ from astToolkit._toolMake import Make as Make
 from astToolkit._toolIfThis import IfThis as IfThis
 from astToolkit._toolThen import Then as Then
 
+# isort: split
+from astToolkit._toolkitPredicateCompiler import compilePredicate as compilePredicate
+
 # isort: split
 from astToolkit._namespaceUncertainty import (
 	extractClassDef as extractClassDef, extractFunctionDef as extractFunctionDef, parseLogicalPath2astModule as parseLogicalPath2astModule,
 	parsePathFilename2astModule as parsePathFilename2astModule)
 import astToolkit._namespaceUncertainty  # pyright: ignore[reportUnusedImport]
+
+# isort: split
+from astToolkit._toolkitBatch import mapPathFilenames as mapPathFilenames, rewritePathFilenames as rewritePathFilenames
@@ -1,7 +1,9 @@
 """IDK how I want to organize the namespace."""
 from __future__ import annotations
 
-from astToolkit import Be, DOT, Grab, identifierDotAttribute, IfThis, Make, NodeChanger, NodeTourist, Then
+from astToolkit import (
+	Be, CallGraph, DOT, Grab, identifierDotAttribute, IfThis, Make, NodeChanger, NodeTourist, Scope, ScopeAnalysis, Then, UnparseCache)
+from astToolkit._toolkitStructuralHash import _classStructural, areStructurallyEqual, StructuralHasher
 from copy import deepcopy
 from hunterMakesPy import raiseIfNone
 from hunterMakesPy.filesystemToolkit import settings_autoflakeDEFAULT, writePython
@@ -16,7 +18,7 @@ if TYPE_CHECKING:
 	from os import PathLike
 	from pathlib import PurePath
 	from types import ModuleType
-	from typing import Any, Literal, Unpack
+	from typing import Any, Final, Literal, Unpack
 	import io
 
 def makeDictionaryAsyncFunctionDef(astAST: ast.AST) -> dict[str, ast.AsyncFunctionDef]:
@@ -167,6 +169,9 @@ def inlineFunctionDef(identifierToInline: str, astModule: ast.Module) -> ast.Fun
 	`inlineFunctionDef` repeats the inlining process until no more locally defined functions remain
 	to be inlined. Functions not called directly by `identifierToInline` in the original `astModule`
 	may therefore be inlined if they are called by an already-inlined function.
+	To inline many functions of the same module, use `Inliner`, which analyzes the module once. If
+	`identifierToInline` does not match any `ast.FunctionDef.name` in `astModule`,
+	`inlineFunctionDef` raises `ValueError`.
 
 	Parameters
 	----------
@@ -192,11 +197,6 @@ def inlineFunctionDef(identifierToInline: str, astModule: ast.Module) -> ast.Fun
 		If any function transitively reachable from `identifierToInline` calls back to
 		`identifierToInline`, it is not inlined.
 
-	Raises
-	------
-	ValueError
-		If `identifierToInline` does not match any `ast.FunctionDef.name` in `astModule`.
-
 	References
 	----------
 	[1] ast.FunctionDef - Python documentation
@@ -208,56 +208,157 @@ def inlineFunctionDef(identifierToInline: str, astModule: ast.Module) -> ast.Fun
 	[4] astToolkit - Context7
 		https://context7.com/hunterhogan/asttoolkit
 	"""
-	dictionaryFunctionDef: dict[str, ast.FunctionDef] = makeDictionaryFunctionDef(astModule)
-	try:
-		FunctionDefToInline = dictionaryFunctionDef[identifierToInline]
-	except KeyError as 拦message:
-		message: str = f"I was unable to find an `ast.FunctionDef` with name {identifierToInline = } in {astModule = }."
-		raise ValueError(message) from 拦message
-
-	listIdentifiersCalledFunctions: list[str] = []
-	findIdentifiersToInline = NodeTourist[ast.Call, ast.Call](IfThis.isCallToName
-		, Grab.funcAttribute(Grab.idAttribute(Then.appendTo(listIdentifiersCalledFunctions))))
-	findIdentifiersToInline.visit(FunctionDefToInline)
-
-	dictionary4Inlining: dict[str, ast.FunctionDef] = {}
-	for identifier in sorted(set(listIdentifiersCalledFunctions).intersection(dictionaryFunctionDef.keys())):
-		if NodeTourist(IfThis.matchesMeButNotAnyDescendant(IfThis.isCallIdentifier(identifier)), Then.extractIt).captureLastMatch(astModule) is not None:
-			dictionary4Inlining[identifier] = dictionaryFunctionDef[identifier]
-
-	keepGoing = True
-	while keepGoing:
-		keepGoing = False
-		listIdentifiersCalledFunctions.clear()
-		findIdentifiersToInline.visit(Make.Module(list(dictionary4Inlining.values())))
-
-		listIdentifiersCalledFunctions = sorted((set(listIdentifiersCalledFunctions).difference(dictionary4Inlining.keys())).intersection(dictionaryFunctionDef.keys()))
-		if len(listIdentifiersCalledFunctions) > 0:
-			keepGoing = True
-			for identifier in listIdentifiersCalledFunctions:
-				if NodeTourist(IfThis.matchesMeButNotAnyDescendant(IfThis.isCallIdentifier(identifier)), Then.extractIt).captureLastMatch(astModule) is not None:
-					FunctionDefTarget = dictionaryFunctionDef[identifier]
-					if len(FunctionDefTarget.body) == 1:
-						replacement = NodeTourist(Be.Return, Then.extractIt(DOT.value)).captureLastMatch(FunctionDefTarget)
-						inliner = NodeChanger(
-							findThis=IfThis.isCallIdentifier(identifier), doThat=Then.replaceWith(replacement))
-						for astFunctionDef in dictionary4Inlining.values():
-							inliner.visit(astFunctionDef)
-					else:
-						inliner = NodeChanger(Be.Assign.valueIs(IfThis.isCallIdentifier(identifier)), Then.replaceWith(FunctionDefTarget.body[0:-1]))
-						for astFunctionDef in dictionary4Inlining.values():
-							inliner.visit(astFunctionDef)
-
-	for identifier, FunctionDefTarget in dictionary4Inlining.items():
-		if len(FunctionDefTarget.body) == 1:
-			replacement = NodeTourist(Be.Return, Then.extractIt(DOT.value)).captureLastMatch(FunctionDefTarget)
-			inliner = NodeChanger(IfThis.isCallIdentifier(identifier), Then.replaceWith(replacement))
-			inliner.visit(FunctionDefToInline)
-		else:
-			inliner = NodeChanger(Be.Assign.valueIs(IfThis.isCallIdentifier(identifier)), Then.replaceWith(FunctionDefTarget.body[0:-1]))
-			inliner.visit(FunctionDefToInline)
-	ast.fix_missing_locations(FunctionDefToInline)
-	return FunctionDefToInline
+	return Inliner(astModule).inlineInPlace(identifierToInline)
+
+def _inlineCallee(FunctionDefTarget: ast.FunctionDef, identifier: str, FunctionDefCallee: ast.FunctionDef) -> None:
+	# Copy the replacement first: `FunctionDefCallee` can be `FunctionDefTarget`, if the target calls itself.
+	if len(FunctionDefCallee.body) == 1:
+		replacement: ast.expr | None = deepcopy(NodeTourist(Be.Return, Then.extractIt(DOT.value)).captureLastMatch(FunctionDefCallee))
+		NodeChanger(IfThis.isCallIdentifier(identifier), lambda _call: deepcopy(replacement)).visit(FunctionDefTarget)
+	else:
+		listStatements: list[ast.stmt] = deepcopy(FunctionDefCallee.body[0:-1])
+		NodeChanger(Be.Assign.valueIs(IfThis.isCallIdentifier(identifier)), lambda _assign: deepcopy(listStatements)).visit(FunctionDefTarget)
+
+class Inliner:
+	"""Inline the functions of one module into any number of its functions, with one analysis of the module.
+
+	`inlineFunctionDef` analyzes the module each time that you call it. `Inliner` builds the `CallGraph`
+	of `astModule` once, when it is created. To inline into a target, `Inliner` first prepares each
+	function that the target calls: the prepared function is a copy of the function in which the
+	functions that the called functions call, but that the target does not call, are substituted
+	inline once. The prepared function depends only on the function and on which of those functions
+	it reaches, so each later target with the same answer reuses the prepared function, and each call
+	site receives a copy of only the prepared `body` that it needs.
+
+	`inline` returns the same code as `inlineFunctionDef`, but it does not change `astModule`.
+	`inlineInPlace`, which `inlineFunctionDef` calls, changes `astModule` as `inlineFunctionDef` does.
+
+	Parameters
+	----------
+	astModule : ast.Module
+		The module with the target functions and the functions to inline.
+
+	Examples
+	--------
+	```python
+		inliner = Inliner(kitchenModule)
+		listFunctionDef = [inliner.inline(identifier) for identifier in ('bake', 'fry', 'steam')]
+	```
+	"""
+
+	def __init__(self, astModule: ast.Module) -> None:
+		self.astModule: Final[ast.Module] = astModule
+		self.callGraph: CallGraph = CallGraph(astModule)
+		self._dictionaryPrepared: Final[dict[tuple[str, frozenset[str]], ast.FunctionDef]] = {}
+		self._dictionaryIdentifier2Reachable: Final[dict[str, frozenset[str]]] = {}
+
+	def inline(self, identifierToInline: str) -> ast.FunctionDef:
+		"""Return a copy of the `ast.FunctionDef` named `identifierToInline`, with each function that it calls substituted inline.
+
+		If `identifierToInline` does not match any `ast.FunctionDef.name` in `astModule`, `inline` raises
+		`ValueError`.
+
+		Parameters
+		----------
+		identifierToInline : str
+			The name of the target `ast.FunctionDef`.
+
+		Returns
+		-------
+		FunctionDefInlined : ast.FunctionDef
+			A new `ast.FunctionDef`, which you can change without changing `astModule` or the next
+			result of `inline`.
+		"""
+		FunctionDefInlined: ast.FunctionDef = deepcopy(self._functionDefOf(identifierToInline))
+		self._inlineInto(FunctionDefInlined, identifierToInline)
+		ast.fix_missing_locations(FunctionDefInlined)
+		return FunctionDefInlined
+
+	def inlineInPlace(self, identifierToInline: str) -> ast.FunctionDef:
+		"""Substitute inline, in the `ast.FunctionDef` named `identifierToInline` in `astModule`, each function that it calls, as `inlineFunctionDef` does.
+
+		As `inlineFunctionDef` does, `inlineInPlace` also replaces each function of `astModule` that the
+		target calls with its prepared version. Then `Inliner` analyzes the changed `astModule` again. If
+		`identifierToInline` does not match any `ast.FunctionDef.name` in `astModule`, `inlineInPlace`
+		raises `ValueError`.
+
+		Parameters
+		----------
+		identifierToInline : str
+			The name of the target `ast.FunctionDef`.
+
+		Returns
+		-------
+		FunctionDefToInline : ast.FunctionDef
+			The `ast.FunctionDef` of `astModule`, changed.
+		"""
+		FunctionDefToInline: ast.FunctionDef = self._functionDefOf(identifierToInline)
+		dictionaryPrepared: dict[str, ast.FunctionDef] = self._inlineInto(FunctionDefToInline, identifierToInline)
+		for identifier, FunctionDefPrepared in dictionaryPrepared.items():
+			if identifier != identifierToInline:
+				FunctionDefCallee: ast.FunctionDef = self.callGraph.dictionaryFunctionDef[identifier]
+				FunctionDefCopy: ast.FunctionDef = deepcopy(FunctionDefPrepared)
+				for fieldName in FunctionDefCopy._fields:
+					setattr(FunctionDefCallee, fieldName, getattr(FunctionDefCopy, fieldName))
+		ast.fix_missing_locations(FunctionDefToInline)
+		self.callGraph = CallGraph(self.astModule)
+		self._dictionaryPrepared.clear()
+		self._dictionaryIdentifier2Reachable.clear()
+		return FunctionDefToInline
+
+	def _functionDefOf(self, identifier: str) -> ast.FunctionDef:
+		try:
+			return self.callGraph.dictionaryFunctionDef[identifier]
+		except KeyError as 拦message:
+			message: str = f"I was unable to find an `ast.FunctionDef` with name {identifier = } in astModule = {self.astModule!r}."
+			raise ValueError(message) from 拦message
+
+	def _prepare(self, identifier: str, setIdentifiersSubstituted: frozenset[str]) -> ast.FunctionDef:
+		"""Return a copy of `identifier` in which each function of `setIdentifiersSubstituted` is substituted inline, in one pass in sorted order.
+
+		Returns
+		-------
+		FunctionDefPrepared : ast.FunctionDef
+			The prepared copy, which is shared by each later call with the same `identifier` and the same
+			functions of `setIdentifiersSubstituted` that `identifier` can reach. Do not change it.
+		"""
+		try:
+			setReachable: frozenset[str] = self._dictionaryIdentifier2Reachable[identifier]
+		except KeyError:
+			setReachable = self._dictionaryIdentifier2Reachable.setdefault(identifier, frozenset(self.callGraph.reachableFrom(identifier)))
+		# `identifier` cannot reach the other functions, so they do not change the prepared function and are not in the key.
+		key: tuple[str, frozenset[str]] = (identifier, setIdentifiersSubstituted & setReachable)
+		try:
+			return self._dictionaryPrepared[key]
+		except KeyError:
+			pass
+		FunctionDefPrepared: ast.FunctionDef = deepcopy(self.callGraph.dictionaryFunctionDef[identifier])
+		for identifierCallee in sorted(key[1]):
+			_inlineCallee(FunctionDefPrepared, identifierCallee, self.callGraph.dictionaryFunctionDef[identifierCallee])
+		return self._dictionaryPrepared.setdefault(key, FunctionDefPrepared)
+
+	def _inlineInto(self, FunctionDefTarget: ast.FunctionDef, identifier: str) -> dict[str, ast.FunctionDef]:
+		"""Inline into `FunctionDefTarget`, which is `identifier` or a copy of it, the functions that `identifier` calls, and return them, prepared.
+
+		Returns
+		-------
+		dictionaryPrepared : dict[str, ast.FunctionDef]
+			For each function that `identifier` calls, the prepared version from `_prepare`.
+		"""
+		setIdentifiersCalled: frozenset[str] = frozenset(self.callGraph.calleesOf(identifier))
+		# The functions that the functions called by `identifier` call, and that `identifier` does not call, are substituted into them first.
+		setIdentifiersSubstituted: frozenset[str] = frozenset(identifierCallee for identifierCalled in setIdentifiersCalled
+			for identifierCallee in self.callGraph.calleesOf(identifierCalled)) - setIdentifiersCalled
+		dictionaryPrepared: dict[str, ast.FunctionDef] = {identifierCalled: self._prepare(identifierCalled, setIdentifiersSubstituted)
+			for identifierCalled in sorted(setIdentifiersCalled)}
+		if identifier in dictionaryPrepared:
+			# The target calls itself, so the target is prepared, too, before the functions that it calls are substituted.
+			FunctionDefCopy: ast.FunctionDef = deepcopy(dictionaryPrepared[identifier])
+			for fieldName in FunctionDefCopy._fields:
+				setattr(FunctionDefTarget, fieldName, getattr(FunctionDefCopy, fieldName))
+		for identifierCalled, FunctionDefPrepared in dictionaryPrepared.items():
+			_inlineCallee(FunctionDefTarget, identifierCalled, FunctionDefTarget if identifierCalled == identifier else FunctionDefPrepared)
+		return dictionaryPrepared
 
 def pythonCode2ast_expr(string: str) -> ast.expr:
 	"""Convert a single Python expression `str` (***str***ing) to an `ast.expr` (***expr***ession) node.
@@ -296,7 +397,7 @@ def pythonCode2ast_expr(string: str) -> ast.expr:
 	[3] hunterMakesPy raiseIfNone - Context7
 		https://context7.com/hunterhogan/huntermakespy
 	"""
-	return raiseIfNone(NodeTourist(Be.Expr, Then.extractIt(DOT.value)).captureLastMatch(ast.parse(string)))
+	return raiseIfNone(NodeTourist(Be.Expr, Then.extractIt(DOT.value)).captureFirstMatch(ast.parse(string)))
 
 def removeUnusedParameters(FunctionDef: ast.FunctionDef) -> ast.FunctionDef:
 	"""Remove unused `ast.arg` (***arg***ument) parameters from an `ast.FunctionDef` (Function ***Def***inition).
@@ -305,7 +406,11 @@ def removeUnusedParameters(FunctionDef: ast.FunctionDef) -> ast.FunctionDef:
 
 	You can use `removeUnusedParameters` to strip `ast.arg` parameters from the `ast.arguments`
 	(***arg***ument***s***) of an `ast.FunctionDef` when those parameters are not referenced anywhere
-	in the `ast.FunctionDef.body`, or are only referenced within `ast.Return` statements.
+	in the `ast.FunctionDef.body`, or are only referenced within `ast.Return` statements. A reference
+	is an `ast.Name` that resolves, by the scoping rules of Python, to the parameter, as `ScopeAnalysis`
+	finds it: a nested function, a lambda, or a comprehension that binds the same identifier does not
+	reference the parameter. `removeUnusedParameters` removes the default value of each parameter that
+	it removes.
 	`removeUnusedParameters` examines `ast.arguments.args`, `ast.arguments.posonlyargs`
 	(***pos***itional-only ***arg***ument***s***), and `ast.arguments.kwonlyargs` (***k***ey***w***ord-only
 	***arg***ument***s***).
@@ -335,17 +440,30 @@ def removeUnusedParameters(FunctionDef: ast.FunctionDef) -> ast.FunctionDef:
 	[3] astToolkit - Context7
 		https://context7.com/hunterhogan/asttoolkit
 	"""
-	list_argCuzMyBrainRefusesToThink = FunctionDef.args.args + FunctionDef.args.posonlyargs + FunctionDef.args.kwonlyargs
-	list_arg_arg: list[str] = [ast_arg.arg for ast_arg in list_argCuzMyBrainRefusesToThink]
-	listName: list[ast.Name] = []
-	fauxFunctionDef = deepcopy(FunctionDef)
-	NodeChanger(Be.Return, Then.removeIt).visit(fauxFunctionDef)
-	NodeTourist(Be.Name, Then.appendTo(listName)).visit(fauxFunctionDef)
-	listIdentifiers: list[str] = [astName.id for astName in listName]
-	listIdentifiersNotUsed: list[str] = list(set(list_arg_arg) - set(listIdentifiers))
-	for argIdentifier in listIdentifiersNotUsed:
-		remove_arg = NodeChanger(IfThis.is_argIdentifier(argIdentifier), Then.removeIt)
-		remove_arg.visit(FunctionDef)
+	scope: Scope = ScopeAnalysis(FunctionDef).scopeOf(FunctionDef)
+	listReturn: list[ast.Return] = []
+	NodeTourist(Be.Return, Then.appendTo(listReturn)).visit(FunctionDef)
+	setNodesInReturn: set[ast.AST] = {node for astReturn in listReturn for node in ast.walk(astReturn)}
+
+	def isUnused(ast_arg: ast.arg) -> bool:
+		listNodes: list[ast.AST] = [*scope.dictionaryIdentifier2Definitions.get(ast_arg.arg, []), *scope.dictionaryIdentifier2Uses.get(ast_arg.arg, [])]
+		return all(node is ast_arg or node in setNodesInReturn for node in listNodes)
+
+	argumentSpecification: ast.arguments = FunctionDef.args
+	list_argPositional: list[ast.arg] = argumentSpecification.posonlyargs + argumentSpecification.args
+	# The defaults belong to the last positional parameters.
+	countWithoutDefault: int = len(list_argPositional) - len(argumentSpecification.defaults)
+	argumentSpecification.defaults = [default for position, default in enumerate(argumentSpecification.defaults, start=countWithoutDefault)
+		if not isUnused(list_argPositional[position])]
+	argumentSpecification.posonlyargs = [ast_arg for ast_arg in argumentSpecification.posonlyargs if not isUnused(ast_arg)]
+	argumentSpecification.args = [ast_arg for ast_arg in argumentSpecification.args if not isUnused(ast_arg)]
+	# `Make.arguments` leaves `kw_defaults` empty if you do not pass it.
+	list_kw_defaults: list[ast.expr | None] = argumentSpecification.kw_defaults or [None] * len(argumentSpecification.kwonlyargs)
+	listKeywordOnly: list[tuple[ast.arg, ast.expr | None]] = [(ast_arg, default) for ast_arg, default
+		in zip(argumentSpecification.kwonlyargs, list_kw_defaults, strict=True) if not isUnused(ast_arg)]
+	argumentSpecification.kwonlyargs = [ast_arg for ast_arg, _default in listKeywordOnly]
+	if argumentSpecification.kw_defaults:
+		argumentSpecification.kw_defaults = [default for _ast_arg, default in listKeywordOnly]
 
 	list_argCuzMyBrainRefusesToThink = FunctionDef.args.args + FunctionDef.args.posonlyargs + FunctionDef.args.kwonlyargs
 
@@ -420,17 +538,135 @@ def unjoinBinOP(astAST: ast.AST, operator: type[ast.operator] = ast.operator) ->
 
 	return list_ast_expr
 
-def unparseFindReplace[木: ast.AST, 文件: ast.AST, 文义: ast.AST](astTree: 木, mappingFindReplaceNodes: Mapping[文件, 文义]) -> 木:
+class _RewriterFindReplace:
+	"""Replace, in one traversal per pass, each node whose key is the key of a node to find, until a pass replaces no node.
+
+	The key of a node is its unparsed code or, if `structural`, its structural hash. The nodes to find
+	are indexed by key, so checking a node costs one key and one `dict` lookup, however many entries
+	the `Mapping` has. In a pass, the outermost node that matches is replaced with a copy of its
+	replacement, and the traversal does not enter the copy, so a match inside a replacement, or of an
+	ancestor of a replaced node, is replaced in the next pass.
+	"""
+
+	def __init__(self, mappingFindReplaceNodes: Mapping[Any, ast.AST], *, structural: bool) -> None:
+		self.structural: Final[bool] = structural
+		self.unparseCache: Final[UnparseCache] = UnparseCache()
+		self.structuralHasher: StructuralHasher = StructuralHasher(ignoreContext=True)
+		self.listFindReplace: Final[list[tuple[ast.AST, ast.AST]]] = []
+		self.dictionaryKey2Indices: Final[dict[object, list[int]]] = {}
+		for nodeFind, nodeReplace in mappingFindReplaceNodes.items():
+			if structural and areStructurallyEqual(nodeFind, nodeReplace, ignoreContext=True):
+				continue
+			self.dictionaryKey2Indices.setdefault(self.keyOf(nodeFind), []).append(len(self.listFindReplace))
+			self.listFindReplace.append((nodeFind, nodeReplace))
+		self.indexMatched: int = -1
+		nodeTypes: set[type[ast.AST]] | None = {_classStructural(type(nodeFind)) for nodeFind, _nodeReplace in self.listFindReplace} if structural else None
+		self.nodeChanger: Final[NodeChanger[ast.AST, ast.AST]] = NodeChanger(self.isMatch, self.replace, nodeTypes=nodeTypes)
+
+	def keyOf(self, node: ast.AST) -> object:
+		if self.structural:
+			return self.structuralHasher.hashOf(node)
+		return self.unparseCache.unparse(node)
+
+	def indexOf(self, node: ast.AST) -> int:
+		"""Return the index of the first entry that `node` matches, or -1.
+
+		Returns
+		-------
+		index : int
+			The index of the first entry that `node` matches, or -1 if `node` matches no entry.
+		"""
+		listIndices: list[int] | None = self.dictionaryKey2Indices.get(self.keyOf(node))
+		if listIndices is None:
+			return -1
+		if not self.structural:
+			return listIndices[0]
+		for index in listIndices:
+			if areStructurallyEqual(node, self.listFindReplace[index][0], ignoreContext=True):
+				return index
+		return -1
+
+	def isMatch(self, node: ast.AST) -> bool:
+		self.indexMatched = self.indexOf(node)
+		return self.indexMatched >= 0
+
+	def replace(self, node: ast.AST) -> ast.AST:
+		if not self.structural:
+			self.unparseCache.invalidate(node)
+		return deepcopy(self.listFindReplace[self.indexMatched][1])
+
+	def raiseIfCyclic(self) -> None:
+		"""Raise `ValueError` if a replacement contains, directly or through other replacements, the node that it replaces.
+
+		Raises
+		------
+		ValueError
+			If a replacement leads back to the node that it replaces.
+		"""
+		# An entry points to each entry that a node of its replacement matches, except a replacement that matches its own entry,
+		# such as `x` in `Store` context for `x` in `Load` context, which changes no key and stops the passes.
+		listIndicesNext: list[list[int]] = []
+		for index, (_nodeFind, nodeReplace) in enumerate(self.listFindReplace):
+			listIndicesNext.append([indexNext for node in ast.walk(nodeReplace)
+				if (indexNext := self.indexOf(node)) >= 0 and not (node is nodeReplace and indexNext == index)])
+		# 0: not visited, 1: on the path of the depth-first search, 2: done.
+		listStates: list[int] = [0] * len(self.listFindReplace)
+		for indexStart in range(len(self.listFindReplace)):
+			if listStates[indexStart]:
+				continue
+			stack: list[tuple[int, int]] = [(indexStart, 0)]
+			listStates[indexStart] = 1
+			while stack:
+				index, position = stack.pop()
+				if position < len(listIndicesNext[index]):
+					stack.append((index, position + 1))
+					indexNext: int = listIndicesNext[index][position]
+					if listStates[indexNext] == 1:
+						nodeFind: ast.AST = self.listFindReplace[indexNext][0]
+						message: str = f"I received a mapping in which the replacement of `{ast.unparse(nodeFind)}` leads back to `{ast.unparse(nodeFind)}`, so replacing would never end."
+						raise ValueError(message)
+					if listStates[indexNext] == 0:
+						listStates[indexNext] = 1
+						stack.append((indexNext, 0))
+				else:
+					listStates[index] = 2
+
+	def rewrite[木: ast.AST](self, newTree: 木) -> 木:
+		self.raiseIfCyclic()
+		setKeysTree: set[object] = set()
+		keyPrevious: object = None
+		while True:
+			if self.structural:
+				# A pass changes nodes after the hasher remembered the hashes of their ancestors, so each pass has a new hasher.
+				self.structuralHasher = StructuralHasher(ignoreContext=True)
+			keyTree: object = self.keyOf(newTree)
+			if keyTree == keyPrevious:
+				# The last pass replaced nodes with nodes that have the same key, such as `x` in `Store` context for `x`.
+				return newTree
+			if keyTree in setKeysTree:
+				message: str = f"I received a mapping whose replacements change the tree back to an earlier state, so replacing would never end. The tree is `{ast.unparse(newTree)}`."
+				raise ValueError(message)
+			setKeysTree.add(keyTree)
+			newTree = self.nodeChanger.visit(newTree)  # pyright: ignore[reportAssignmentType]
+			if not self.nodeChanger.changed:
+				return newTree
+			keyPrevious = keyTree
+
+def unparseFindReplace[木: ast.AST, 文件: ast.AST, 文义: ast.AST](astTree: 木, mappingFindReplaceNodes: Mapping[文件, 文义], *, structural: bool = False) -> 木:
 	"""Replace `ast.AST` (Abstract Syntax Tree) nodes in `astTree` using a find-replace `Mapping`.
 
 	(AI generated docstring)
 
 	You can use `unparseFindReplace` to substitute nodes throughout an `ast.AST` tree by comparing
-	unparsed text representations. `unparseFindReplace` iterates the replacement pass until the
-	unparsed form of `astTree` no longer changes, ensuring all matching nodes are replaced
-	regardless of nesting depth. `unparseFindReplace` does not modify `astTree` in place; it
+	unparsed text representations. `unparseFindReplace` repeats the replacement pass until a pass
+	replaces no node, or the unparsed form of `astTree` no longer changes, ensuring all matching
+	nodes are replaced regardless of nesting depth. `unparseFindReplace` does not modify `astTree` in place; it
 	returns a modified deep copy of the same type.
 
+	If replacing would never end, `unparseFindReplace` raises `ValueError`: for example, if a
+	replacement contains, directly or through other replacements, the node that it replaces, such as
+	`{x: f(x)}` or `{x: y, y: x}`, or if a pass changes the tree back to an earlier state.
+
 	Parameters
 	----------
 	astTree : ast.AST
@@ -439,6 +675,9 @@ def unparseFindReplace[木: ast.AST, 文件: ast.AST, 文义: ast.AST](astTree:
 	mappingFindReplaceNodes : Mapping[ast.AST, ast.AST]
 		A `Mapping` from source `ast.AST` nodes to replacement `ast.AST` nodes. Each entry
 		specifies one find-replace substitution.
+	structural : bool = False
+		If `True`, compare nodes by structure, ignoring positions and `ctx`, instead of by unparsed
+		text. See `IfThis.unparseIs`.
 
 	Returns
 	-------
@@ -449,9 +688,25 @@ def unparseFindReplace[木: ast.AST, 文件: ast.AST, 文义: ast.AST](astTree:
 	Algorithm Details
 	-----------------
 	`unparseFindReplace` compares nodes by their unparsed text representation using `ast.unparse`
-	[1]. The outer loop repeats until `ast.unparse(newTree) == ast.unparse(astTree)`, guaranteeing
-	convergence but potentially requiring multiple passes for deeply nested or chained substitutions.
-	This text-based approach does not rely on node identity or structural equality.
+	[1]. The nodes to find are indexed by their text, so each pass is one traversal of the tree, in
+	which each node is unparsed once, with an `UnparseCache`, and looked up in the index, however
+	many entries `mappingFindReplaceNodes` has. In a pass, the outermost matching node is replaced
+	with a copy of its replacement. Then the next pass replaces the matches that the replacements
+	made, such as a match inside a replacement, or an ancestor of a replaced node, potentially
+	requiring multiple passes for deeply nested or chained substitutions. The `UnparseCache`
+	discards the text of only the replaced nodes and their ancestors, so a later pass unparses
+	only those. The passes stop when a pass replaces no node, which `NodeChanger.changed` reports
+	without unparsing the tree, or when a pass does not change the text of the tree.
+
+	If the nodes to find overlap, the outermost match wins, whatever the order of the entries in
+	`mappingFindReplaceNodes`: with `{a: e, f(a, b.attr): h(c)}`, `f(a, b.attr)` becomes `h(c)`,
+	not `f(e, b.attr)`. The order of the entries decides only between entries that match the same
+	node, and then the first entry wins.
+
+	With `structural=True`, the key of a node is its structural hash, from a `StructuralHasher`, a
+	node is compared with `areStructurallyEqual` only if its hash equals the hash of a node to find,
+	and only the nodes of the classes of the nodes to find are checked, so no node is unparsed. An
+	entry whose replacement is structurally equal to the node to find is ignored.
 
 	References
 	----------
@@ -462,18 +717,7 @@ def unparseFindReplace[木: ast.AST, 文件: ast.AST, 文义: ast.AST](astTree:
 	[3] astToolkit IfThis.unparseIs - Context7
 		https://context7.com/hunterhogan/asttoolkit
 	"""
-	keepGoing = True
-	newTree: 木 = deepcopy(astTree)
-
-	while keepGoing:
-		for nodeFind, nodeReplace in mappingFindReplaceNodes.items():
-			NodeChanger(IfThis.unparseIs(nodeFind), Then.replaceWith(nodeReplace)).visit(newTree)
-
-		if ast.unparse(newTree) == ast.unparse(astTree):
-			keepGoing = False
-		else:
-			astTree = deepcopy(newTree)
-	return newTree
+	return _RewriterFindReplace(mappingFindReplaceNodes, structural=structural).rewrite(deepcopy(astTree))
 
 @overload
 def write_astModule(astModule: ast.Module, pathFilename: PathLike[Any] | PurePath, settings: dict[str, dict[str, Any]] | None = None, identifierPackage: str = '') -> Path: ...
@@ -607,7 +851,7 @@ def extractClassDef(astAST: ast.AST, identifier: str) -> ast.ClassDef | None:
 	[2] astToolkit - Context7
 		https://context7.com/hunterhogan/asttoolkit
 	"""
-	return NodeTourist(IfThis.isClassDefIdentifier(identifier), Then.extractIt).captureLastMatch(astAST)
+	return NodeTourist(IfThis.isClassDefIdentifier(identifier), Then.extractIt).captureFirstMatch(astAST)
 
 def extractFunctionDef(astAST: ast.AST, identifier: str) -> ast.FunctionDef | None:
 	"""Extract an `ast.FunctionDef` (Function ***Def***inition) from an `ast.AST` (abstract syntax tree) `object` by name.
@@ -639,7 +883,7 @@ def extractFunctionDef(astAST: ast.AST, identifier: str) -> ast.FunctionDef | No
 	[2] astToolkit - Context7
 		https://context7.com/hunterhogan/asttoolkit
 	"""
-	return NodeTourist(IfThis.isFunctionDefIdentifier(identifier), Then.extractIt).captureLastMatch(astAST)
+	return NodeTourist(IfThis.isFunctionDefIdentifier(identifier), Then.extractIt).captureFirstMatch(astAST)
 
 def parseLogicalPath2astModule(logicalPath: identifierDotAttribute, package: str | None = None, **keywordArguments: Unpack[astParseParameters]) -> ast.Module:
 	"""Parse the source code of a Python module at a logical import path into an `ast.Module` (Module).
@@ -0,0 +1,123 @@
+"""`Be`, with a check of the exact class of the node before `isinstance`.
+
+Each predicate of `Be` calls `isinstance`, and each `Be.*` with attribute predicates, such as
+`Be.Name`, is an object with a `__call__` method, so `Be.Name(node)` costs a method call and, if the
+node is not an `ast.Name`, a walk of the MRO of the class of the node. In practice, a node is an
+instance of exactly one class of `ast`, or of a class of `Make`, such as `Make.Add`, that subclasses
+one. `BeExact` has the same predicates as `Be`, but each predicate is a plain function that looks up
+`type(node)` in a precomputed `dict` from each class to whether the class is the class of the
+predicate or a subclass of it, so the predicate neither makes a method call nor walks an MRO.
+
+The precomputed `dict` has the subclasses of `ast.AST` that exist when `astToolkit` is imported,
+including the classes of `Make`. For a node of any other class, such as a subclass defined later,
+the predicate calls `isinstance`, so each predicate of `BeExact` is `True` for exactly the nodes for
+which the predicate of `Be` is `True`.
+
+`Be` is generated, so `BeExact` is built from `Be` when this module is imported: for each predicate of
+`Be`, it writes the source code of the predicate, compiles it with `exec`, and caches the compiled
+code by the shape of the predicate, as `compilePredicate` and `Find` do.
+"""
+from __future__ import annotations
+
+from astToolkit._toolBe import Be
+from astToolkit._toolkitPredicateMetadata import metadataOfPredicate
+from inspect import isfunction
+from typing import TYPE_CHECKING, TypeIs
+import ast
+# `Make` subclasses some classes of `ast`, such as `ast.Add`; import it so its classes are in the precomputed `dict`.
+import astToolkit._toolMake
+
+if TYPE_CHECKING:
+	from collections.abc import Callable
+	from typing import Any, Final
+
+_dictionaryShape2Factory: Final[dict[str | None, Callable[..., Callable[..., Any]]]] = {}
+
+def _classesExact(classNode: type[ast.AST]) -> frozenset[type[ast.AST]]:
+	"""Return `classNode` and every class that subclasses it, directly or indirectly.
+
+	Returns
+	-------
+	setClasses : frozenset[type[ast.AST]]
+		`classNode` and its subclasses.
+	"""
+	setClasses: set[type[ast.AST]] = set()
+	stack: list[type[ast.AST]] = [classNode]
+	while stack:
+		classCurrent: type[ast.AST] = stack.pop()
+		if classCurrent not in setClasses:
+			setClasses.add(classCurrent)
+			stack.extend(classCurrent.__subclasses__())
+	return frozenset(setClasses)
+
+_classesKnown: Final[frozenset[type[ast.AST]]] = _classesExact(ast.AST)
+
+def _writeSource(fieldName: str | None) -> str:
+	# `a0` is the class, `a1` is the `dict` from each known class to `isMatch`, `a2` is the annotations, and `a3` is the qualified name.
+	lookup: str = "try:\n\t\t\tisMatch = a1[type(node)]\n\t\texcept KeyError:\n\t\t\tisMatch = isinstance(node, a0)\n\t\t"
+	if fieldName is None:
+		return ("def factory(a0, a1, a2, a3):\n"
+			"\tdef predicateExact(node):\n"
+			f"\t\t{lookup}return isMatch\n"
+			"\treturn predicateExact\n")
+	return ("def factory(a0, a1, a2, a3):\n"
+		"\tdef attributeIs(attributeCondition):\n"
+		"\t\tdef workhorse(node):\n"
+		f"\t\t\t{lookup.replace(chr(10), chr(10) + chr(9))}return isMatch and attributeCondition(node.{fieldName})\n"
+		"\t\tworkhorse.__annotations__ = a2\n"
+		"\t\tworkhorse.__qualname__ = a3\n"
+		"\t\treturn workhorse\n"
+		"\treturn attributeIs\n")
+
+def _makePredicate(identifier: str, classNode: type[ast.AST], dictionaryClass2IsMatch: dict[type[ast.AST], bool], fieldName: str | None) -> Callable[..., Any]:
+	factory: Callable[..., Callable[..., Any]] | None = _dictionaryShape2Factory.get(fieldName)
+	if factory is None:
+		namespace: dict[str, Any] = {'__name__': __name__}
+		exec(compile(_writeSource(fieldName), '<BeExact>', 'exec'), namespace)  # noqa: S102
+		factory = _dictionaryShape2Factory.setdefault(fieldName, namespace['factory'])
+	annotations: dict[str, Any] = {'node': ast.AST, 'return': TypeIs[classNode]}
+	qualname: str = f"BeExact.{identifier}" if fieldName is None else f"BeExact.{identifier}.{fieldName}Is"
+	predicate: Callable[..., Any] = factory(classNode, dictionaryClass2IsMatch, annotations, f"{qualname}.<locals>.workhorse")
+	predicate.__qualname__ = qualname
+	predicate.__name__ = qualname.rpartition('.')[2]
+	if fieldName is None:
+		predicate.__annotations__ = annotations
+	return predicate
+
+class BeExact(Be):
+	"""The predicates of `Be`, with a check of the exact class of the node before `isinstance`.
+
+	Use `BeExact` as `Be`: `BeExact.Name`, `BeExact.Name.idIs(...)`, and `BeExact.at(...)` are `True` for
+	the same nodes as `Be.Name`, `Be.Name.idIs(...)`, and `Be.at(...)`. Each predicate of `BeExact` is a
+	plain function, and, for a node of a class of `ast` or of `Make`, it looks up the class of the
+	node instead of calling `isinstance`, so it is faster than the predicate of `Be`, especially for
+	the many nodes that a visitor checks and that do not match. See `benchmarks/benchmarkBeExact.py`.
+
+	Examples
+	--------
+	```python
+		listCallsBake = NodeTourist(BeExact.Call.funcIs(BeExact.Name.idIs(IfThis.isIdentifier('bake'))), Then.extractIt).captureMatches(kitchenModule)
+	```
+	"""
+
+def _buildBeExact() -> None:
+	for identifier, predicateBe in vars(Be).items():
+		if identifier.startswith('_') or identifier == 'at':
+			continue
+		if isinstance(predicateBe, staticmethod):
+			predicateBe = predicateBe.__func__
+		nodeTypes: tuple[type[ast.AST], ...] | None = metadataOfPredicate(predicateBe).nodeTypes
+		if not nodeTypes:
+			continue
+		classNode: type[ast.AST] = nodeTypes[0]
+		classesExact: frozenset[type[ast.AST]] = _classesExact(classNode)
+		# The class predicate and the attribute predicates of `identifier` share the `dict`.
+		dictionaryClass2IsMatch: dict[type[ast.AST], bool] = {classKnown: classKnown in classesExact for classKnown in _classesKnown}
+		predicateExact: Callable[..., Any] = _makePredicate(identifier, classNode, dictionaryClass2IsMatch, None)
+		if not isfunction(predicateBe):
+			for nameMethod in vars(predicateBe.__class__):
+				if nameMethod.endswith('Is') and not nameMethod.startswith('_'):
+					setattr(predicateExact, nameMethod, _makePredicate(identifier, classNode, dictionaryClass2IsMatch, nameMethod.removesuffix('Is')))
+		setattr(BeExact, identifier, staticmethod(predicateExact))
+
+_buildBeExact()
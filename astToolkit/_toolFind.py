@@ -0,0 +1,233 @@
+"""Build a predicate by writing the path to the value that it checks, in dot notation.
+
+`Find` is a query builder. Each attribute of a query is one step of a path from the node to a value:
+the name of an `ast` class checks the class of the current value, the name of a field of that class
+reads the field, `at(index)` reads an element of a `list`, `any` and `all` apply the rest of the path
+to the elements of a `list`, and `equal(value)` compares the current value. For example,
+`Find.Assign.targets.at(0).Name.id.equal('x')` matches `x = ...`.
+
+A query is immutable, so each step makes a new query. The first time a query is called, it writes the
+source code of one function for the whole path, compiles it with `exec`, and keeps it, so the cost of
+each later call is the cost of the checks themselves, without a call per step, as in a chain of `Be`
+closures. The compiled code depends only on the shape of the path, not on the classes and values in
+it, so it is cached by shape.
+"""
+from __future__ import annotations
+
+from astToolkit._toolkitPredicateMetadata import _annotationReturnOf, _normalizeNodeTypes
+from typing import TYPE_CHECKING
+import ast
+
+if TYPE_CHECKING:
+	from collections.abc import Callable
+	from typing import Any, Final
+
+_dictionaryIdentifier2ClassNode: Final[dict[str, type[ast.AST]]] = {identifier: classNode
+	for identifier, classNode in vars(ast).items() if isinstance(classNode, type) and issubclass(classNode, ast.AST)}
+
+_dictionaryShape2Factory: Final[dict[tuple[tuple[str, Any], ...], Callable[..., Callable[[ast.AST], bool]]]] = {}
+
+class _MetaclassFind(type):
+	def __getattr__(cls, identifier: str) -> Find:
+		if identifier.startswith('_'):
+			raise AttributeError(identifier)
+		return getattr(Find(), identifier)
+
+class Find(metaclass=_MetaclassFind):
+	"""A predicate written as the path, in dot notation, from a node to the value that it checks.
+
+	Start a query with `Find.` and the name of an `ast` class, then add steps:
+
+	- the name of an `ast` class, such as `.Name`: the current value is an instance of the class.
+	- the name of a field or an attribute of the preceding class, such as `.id` after `.Name`: read
+		the field. A field can only follow its class, so `Find.Name.id` is valid and `Find.id` is not.
+		If a field and a class have the same name, such as `arg` or `slice`, the field wins. An
+		attribute of the position, such as `lineno`, is `None` if the node has no position, as a node
+		from `Make` without `lineno`.
+	- `at(index)`: read the element `index` of a `list`. If there is no such element, the query is
+		`False`.
+	- `any`, `all`: the rest of the path is `True` for any, or all, of the elements of a `list`.
+	- `equal(value)`: the current value equals `value`. `equal` ends the path.
+
+	If the path ends with a field, the query is `True` if the field is not `None`, so
+	`Find.Return.value` matches `return cake` but not `return`.
+
+	A query is a predicate, so it can be `findThis` of `NodeTourist` and `NodeChanger`, and an
+	antecedent of `IfThis.isAllOf` and the other combinators. The visitors read `nodeTypes` to skip
+	nodes of other classes, and they call `predicate`, the compiled function, directly. Elsewhere,
+	calling `predicate` instead of the query saves one call per node.
+
+	Parameters
+	----------
+	listSteps : tuple[tuple[str, Any], ...] = ()
+		The steps of the path. Build a query with dot notation instead.
+
+	Examples
+	--------
+	```python
+		listAssignX = NodeTourist(Find.Assign.targets.at(0).Name.id.equal('x'), Then.extractIt).captureMatches(kitchenModule)
+		NodeChanger(Find.FunctionDef.body.any.Return.value.Call.func.Name.id.equal('bake'), Then.removeIt).visit(kitchenModule)
+	```
+	"""
+
+	__slots__ = ('__weakref__', '_predicate', 'listSteps')
+
+	def __init__(self, listSteps: tuple[tuple[str, Any], ...] = ()) -> None:
+		self.listSteps: Final[tuple[tuple[str, Any], ...]] = listSteps
+		self._predicate: Callable[[ast.AST], bool] | None = None
+
+	def _append(self, kind: str, value: Any) -> Find:
+		if self.listSteps and self.listSteps[-1][0] == 'equal':
+			message: str = f"I received a step after `equal`, but `equal` ends the path of `{self!r}`."
+			raise AttributeError(message)
+		return Find((*self.listSteps, (kind, value)))
+
+	def __getattr__(self, identifier: str) -> Find:
+		if identifier.startswith('_'):
+			raise AttributeError(identifier)
+		if self.listSteps and self.listSteps[-1][0] == 'class':
+			classNode: type[ast.AST] = self.listSteps[-1][1]
+			if identifier in classNode._fields:
+				return self._append('attribute', identifier)
+			if identifier in classNode._attributes:  # noqa: SLF001
+				return self._append('attributeOptional', identifier)
+		if identifier in _dictionaryIdentifier2ClassNode:
+			return self._append('class', _dictionaryIdentifier2ClassNode[identifier])
+		if self.listSteps and self.listSteps[-1][0] == 'class':
+			message: str = f"I received `{identifier}`, but it is not a field of `ast.{self.listSteps[-1][1].__name__}` or a class in `ast`."
+		else:
+			message = f"I received `{identifier}`, but it is not a class in `ast`, and a field must follow its class, as in `Find.Name.id`."
+		raise AttributeError(message)
+
+	def at(self, index: int) -> Find:
+		"""Read the element `index` of the `list`, or the query is `False` if there is no such element.
+
+		Returns
+		-------
+		find : Find
+			The query with the step.
+		"""
+		return self._append('at', index)
+
+	@property
+	def any(self) -> Find:
+		"""Apply the rest of the path to each element of the `list`; the query is `True` if any element matches."""
+		return self._append('any', None)
+
+	@property
+	def all(self) -> Find:
+		"""Apply the rest of the path to each element of the `list`; the query is `True` if every element matches."""
+		return self._append('all', None)
+
+	def equal(self, value: object) -> Find:
+		"""The current value equals `value`. `equal` ends the path.
+
+		Returns
+		-------
+		find : Find
+			The query with the step.
+		"""
+		return self._append('equal', value)
+
+	@property
+	def nodeTypes(self) -> tuple[type[ast.AST], ...] | None:
+		"""The `ast` classes that the query can match, from the classes at the start of the path, or `None` if any node could match."""
+		listClasses: list[type[ast.AST]] = []
+		for kind, value in self.listSteps:
+			if kind != 'class':
+				break
+			listClasses.append(value)
+		if not listClasses:
+			return None
+		# `Find.expr.Name` matches only `ast.Name`; `Find.Name.Call` matches nothing.
+		return _normalizeNodeTypes([classNode for classNode in listClasses if all(issubclass(classNode, classOther) for classOther in listClasses)])
+
+	@property
+	def predicate(self) -> Callable[[ast.AST], bool]:
+		"""The compiled function of the query. Its `return` annotation is `TypeIs` of `nodeTypes`."""
+		if self._predicate is None:
+			self._predicate = _compile(self)
+		return self._predicate
+
+	def __call__(self, node: ast.AST) -> bool:
+		"""Whether `node` matches the query.
+
+		Returns
+		-------
+		isMatch : bool
+			`True` if `node` matches the query.
+		"""
+		predicate: Callable[[ast.AST], bool] | None = self._predicate
+		if predicate is None:
+			predicate = self.predicate
+		return predicate(node)
+
+	def __repr__(self) -> str:
+		listParts: list[str] = ['Find']
+		for kind, value in self.listSteps:
+			if kind == 'class':
+				listParts.append(value.__name__)
+			elif kind in {'attribute', 'attributeOptional'}:
+				listParts.append(value)
+			elif kind in {'any', 'all'}:
+				listParts.append(kind)
+			else:
+				listParts.append(f"{kind}({value!r})")
+		return '.'.join(listParts)
+
+def _writeSource(shape: tuple[tuple[str, Any], ...]) -> str:
+	listLines: list[str] = []
+	slot: int = 0
+	kindLast: str | None = None
+	for kind, value in shape:
+		kindLast = kind
+		if kind == 'class':
+			listLines.append(f"if not isinstance(node, a{slot}):\n\t\t\treturn False")
+			slot += 1
+		elif kind == 'attribute':
+			listLines.append(f"node = node.{value}")
+		elif kind == 'attributeOptional':
+			listLines.append(f"node = getattr(node, {value!r}, None)")
+		elif kind == 'at':
+			listLines.append(f"try:\n\t\t\tnode = node[{value!r}]\n\t\texcept (IndexError, KeyError, TypeError):\n\t\t\treturn False")
+		elif kind == 'equal':
+			listLines.append(f"return node == a{slot}")
+			slot += 1
+		else:
+			# The rest of the path is compiled as its own query.
+			listLines.append(f"return {kind}(map(a{slot}, node))")
+			slot += 1
+			break
+	if kindLast == 'class':
+		listLines[-1] = f"return isinstance(node, a{slot - 1})"
+	elif kindLast in {'attribute', 'attributeOptional'}:
+		listLines.append("return node is not None")
+	elif kindLast not in {'equal', 'any', 'all'}:
+		listLines.append("return True")
+	parameters: str = ', '.join(f"a{index}" for index in range(slot))
+	body: str = '\n\t\t'.join(listLines)
+	return f"def factory({parameters}):\n\tdef predicateCompiled(node):\n\t\t{body}\n\treturn predicateCompiled\n"
+
+def _compile(find: Find) -> Callable[[ast.AST], bool]:
+	listShape: list[tuple[str, Any]] = []
+	listArguments: list[object] = []
+	for index, (kind, value) in enumerate(find.listSteps):
+		if kind in {'class', 'equal'}:
+			listShape.append((kind, None))
+			listArguments.append(value)
+		elif kind in {'any', 'all'}:
+			listShape.append((kind, None))
+			listArguments.append(Find(find.listSteps[index + 1:]).predicate)
+			break
+		else:
+			listShape.append((kind, value))
+	shape: tuple[tuple[str, Any], ...] = tuple(listShape)
+	factory: Callable[..., Callable[[ast.AST], bool]] | None = _dictionaryShape2Factory.get(shape)
+	if factory is None:
+		namespace: dict[str, Any] = {}
+		exec(compile(_writeSource(shape), '<Find>', 'exec'), namespace)  # noqa: S102
+		factory = _dictionaryShape2Factory.setdefault(shape, namespace['factory'])
+	predicateCompiled: Callable[[ast.AST], bool] = factory(*listArguments)
+	nodeTypes: tuple[type[ast.AST], ...] | None = find.nodeTypes
+	predicateCompiled.__annotations__ = {'node': ast.AST, 'return': _annotationReturnOf(nodeTypes)}
+	return predicateCompiled
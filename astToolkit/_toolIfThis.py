@@ -8,10 +8,87 @@ type-safe, composable AST analysis and transformation workflows.
 
 """
 from astToolkit import Be
+from astToolkit._toolkitPredicateMetadata import metadataOfPredicate
+from astToolkit._toolkitStructuralHash import areStructurallyEqual
+from astToolkit._toolkitUnparseCache import UnparseCache
 from collections.abc import Callable
+from time import perf_counter_ns
 from typing import Any, TypeIs
 import ast
 
+def _isReorderable(predicate: Callable[..., object]) -> bool:
+	predicateMetadata = metadataOfPredicate(predicate)
+	if predicateMetadata.kind in {'allOf', 'anyOf'}:
+		return all(_isReorderable(antecedent) for antecedent in predicateMetadata.childPredicates)
+	return predicateMetadata.kind in {'isinstance', 'attribute', 'equal', 'noDescendant'}
+
+def _combineAdaptive(predicate: tuple[Callable[[ast.AST], object], ...], *, isAllOf: bool, intervalSample: int, countSamplesPerReorder: int) -> Callable[[ast.AST], bool]:
+	# Each run is the indices of consecutive reorderable predicates, or the index of one other predicate, which is a barrier.
+	listRuns: list[tuple[bool, list[int]]] = []
+	for index, antecedent in enumerate(predicate):
+		if _isReorderable(antecedent) and listRuns and listRuns[-1][0]:
+			listRuns[-1][1].append(index)
+		else:
+			listRuns.append((_isReorderable(antecedent), [index]))
+	listNanoseconds: list[float] = [0.0] * len(predicate)
+	listCountResult: list[float] = [0.0] * len(predicate)
+	listCountSamples: list[float] = [0.0] * len(predicate)
+	# `isAllOf` stops at `False`; `isAnyOf` stops at `True`.
+	resultStop: bool = not isAllOf
+	ordered: tuple[Callable[[ast.AST], object], ...] = predicate
+	countdownSample: int = intervalSample
+	countSampled: int = 0
+
+	def rank(index: int) -> tuple[bool, float]:
+		if not listCountSamples[index]:
+			return (True, 0.0)
+		rateStop: float = (listCountResult[index] if resultStop else listCountSamples[index] - listCountResult[index]) / listCountSamples[index]
+		return (False, listNanoseconds[index] / listCountSamples[index] / max(rateStop, 1e-6))
+
+	def reorder() -> None:
+		nonlocal ordered
+		for isReorderable, listIndices in listRuns:
+			if isReorderable:
+				listIndices.sort(key=rank)
+		for index in range(len(predicate)):
+			listNanoseconds[index] /= 2
+			listCountResult[index] /= 2
+			listCountSamples[index] /= 2
+		ordered = tuple(predicate[index] for _isReorderable, listIndices in listRuns for index in listIndices)
+
+	def sample(node: ast.AST) -> bool:
+		nonlocal countSampled
+		isStopped: bool = False
+		for isReorderable, listIndices in listRuns:
+			if not isReorderable:
+				isStopped = bool(predicate[listIndices[0]](node)) is resultStop
+			else:
+				for index in listIndices:
+					timeStart: int = perf_counter_ns()
+					result: bool = bool(predicate[index](node))
+					listNanoseconds[index] += perf_counter_ns() - timeStart
+					listCountResult[index] += result
+					listCountSamples[index] += 1
+					isStopped = isStopped or result is resultStop
+			if isStopped:
+				break
+		countSampled += 1
+		if countSampled % countSamplesPerReorder == 0:
+			reorder()
+		return resultStop if isStopped else not resultStop
+
+	def workhorse(node: ast.AST) -> bool:
+		nonlocal countdownSample
+		countdownSample -= 1
+		if countdownSample == 0:
+			countdownSample = intervalSample
+			return sample(node)
+		for antecedent in ordered:
+			if bool(antecedent(node)) is not isAllOf:
+				return not isAllOf
+		return isAllOf
+	return workhorse
+
 class IfThis:
 	"""Composable predicate generators for AST node identification in antecedent-action workflows.
 
@@ -26,16 +103,93 @@ class IfThis:
 
 	@staticmethod
 	def isAllOf[归个](*predicate: Callable[[ast.AST], TypeIs[归个] | bool]) -> Callable[[ast.AST], TypeIs[归个] | bool]:
+		"""Return a predicate that is `True` if every `predicate` is `True`, calling them in order until one is `False`.
+
+		Returns
+		-------
+		workhorse : Callable[[ast.AST], TypeIs[归个] | bool]
+			The combined predicate.
+		"""
 		def workhorse(node: ast.AST) -> TypeIs[归个] | bool:
-			return all(antecedent(node) for antecedent in predicate)
+			# A `for` loop, not `all(...)`, which allocates a generator at each call.
+			for antecedent in predicate:  # noqa: SIM110
+				if not antecedent(node):
+					return False
+			return True
 		return workhorse
 
+	@staticmethod
+	def isAllOfAdaptive[归个](*predicate: Callable[[ast.AST], TypeIs[归个] | bool], intervalSample: int = 16, countSamplesPerReorder: int = 64) -> Callable[[ast.AST], TypeIs[归个] | bool]:
+		"""Return a predicate that is `True` if every `predicate` is `True`, calling first the predicates that are cheap and often `False`.
+
+		The returned predicate measures, on one call in `intervalSample`, the time and the result of
+		each `predicate`, and after every `countSamplesPerReorder` measured calls, it reorders the
+		predicates by time divided by the rate of `False`, so it usually returns `False` after one cheap
+		call. Older measurements count half as much after each reordering, so the order follows a
+		change in the nodes, for example, from statements to expressions.
+
+		Only `Be` and `IfThis` predicates, as read by `metadataOfPredicate`, are reordered, because they
+		are safe to call on any node. Any other predicate, such as a `lambda` that reads `node.id` after
+		an earlier predicate checked `Be.Name`, keeps its position, and the predicates before it stay
+		before it.
+
+		Parameters
+		----------
+		*predicate : Callable[[ast.AST], TypeIs[归个] | bool]
+			The predicates.
+		intervalSample : int = 16
+			Measure one call in `intervalSample`. On a measured call, all reorderable predicates up to
+			the first `False` run of them are called.
+		countSamplesPerReorder : int = 64
+			Reorder after this many measured calls.
+
+		Returns
+		-------
+		predicate : Callable[[ast.AST], TypeIs[归个] | bool]
+			The combined predicate.
+		"""
+		return _combineAdaptive(predicate, isAllOf=True, intervalSample=intervalSample, countSamplesPerReorder=countSamplesPerReorder)
+
 	@staticmethod
 	def isAnyOf[归个](*predicate: Callable[[ast.AST], TypeIs[归个] | bool]) -> Callable[[ast.AST], TypeIs[归个] | bool]:
+		"""Return a predicate that is `True` if any `predicate` is `True`, calling them in order until one is `True`.
+
+		Returns
+		-------
+		workhorse : Callable[[ast.AST], TypeIs[归个] | bool]
+			The combined predicate.
+		"""
 		def workhorse(node: ast.AST) -> TypeIs[归个] | bool:
-			return any(antecedent(node) for antecedent in predicate)
+			# A `for` loop, not `any(...)`, which allocates a generator at each call.
+			for antecedent in predicate:  # noqa: SIM110
+				if antecedent(node):
+					return True
+			return False
 		return workhorse
 
+	@staticmethod
+	def isAnyOfAdaptive[归个](*predicate: Callable[[ast.AST], TypeIs[归个] | bool], intervalSample: int = 16, countSamplesPerReorder: int = 64) -> Callable[[ast.AST], TypeIs[归个] | bool]:
+		"""Return a predicate that is `True` if any `predicate` is `True`, calling first the predicates that are cheap and often `True`.
+
+		`isAnyOfAdaptive` is to `isAnyOf` what `isAllOfAdaptive` is to `isAllOf`: it reorders the `Be` and
+		`IfThis` predicates by time divided by the rate of `True`.
+
+		Parameters
+		----------
+		*predicate : Callable[[ast.AST], TypeIs[归个] | bool]
+			The predicates.
+		intervalSample : int = 16
+			Measure one call in `intervalSample`.
+		countSamplesPerReorder : int = 64
+			Reorder after this many measured calls.
+
+		Returns
+		-------
+		predicate : Callable[[ast.AST], TypeIs[归个] | bool]
+			The combined predicate.
+		"""
+		return _combineAdaptive(predicate, isAllOf=False, intervalSample=intervalSample, countSamplesPerReorder=countSamplesPerReorder)
+
 	@staticmethod
 	def is_argIdentifier(identifier: str) -> Callable[[ast.AST], TypeIs[ast.arg]]:
 		"""Return a predicate matching an `ast.arg` node with a specific identifier.
@@ -52,9 +206,7 @@ class IfThis:
 		predicate : Callable[[ast.AST], TypeIs[ast.arg]]
 			Predicate returning `True` if the node is an `ast.arg` with the given identifier.
 		"""
-		def workhorse(node: ast.AST) -> TypeIs[ast.arg]:
-			return Be.arg.argIs(IfThis.isIdentifier(identifier))(node)
-		return workhorse
+		return Be.arg.argIs(IfThis.isIdentifier(identifier))
 
 	@staticmethod
 	def is_keywordIdentifier(identifier: str | None) -> Callable[[ast.AST], TypeIs[ast.keyword]]:
@@ -72,9 +224,7 @@ class IfThis:
 		predicate : Callable[[ast.AST], TypeIs[ast.keyword]]
 			Predicate returning `True` if the node is an `ast.keyword` with the given identifier.
 		"""
-		def workhorse(node: ast.AST) -> TypeIs[ast.keyword]:
-			return Be.keyword.argIs(IfThis.isIdentifier(identifier))(node)
-		return workhorse
+		return Be.keyword.argIs(IfThis.isIdentifier(identifier))
 
 	@staticmethod
 	def isAssignAndTargets0Is(targets0Predicate: Callable[[ast.AST], bool]) -> Callable[[ast.AST], TypeIs[ast.Assign]]:
@@ -112,9 +262,7 @@ class IfThis:
 		predicate : Callable[[ast.AST], TypeIs[ast.Attribute]]
 			Predicate returning `True` if the node is an `ast.Attribute` whose value matches the identifier.
 		"""
-		def workhorse(node: ast.AST) -> TypeIs[ast.Attribute]:
-			return Be.Attribute.valueIs(IfThis.isNestedNameIdentifier(identifier))(node)
-		return workhorse
+		return Be.Attribute.valueIs(IfThis.isNestedNameIdentifier(identifier))
 
 	@staticmethod
 	def isAttributeName(node: ast.AST) -> TypeIs[ast.Attribute]:
@@ -152,8 +300,10 @@ class IfThis:
 		predicate : Callable[[ast.AST], TypeIs[ast.Attribute]]
 			Predicate returning `True` if the node is an `ast.Attribute` with the given namespace and identifier.
 		"""
+		predicateComposed: Callable[[ast.AST], bool] = IfThis.isAllOf(Be.Attribute.valueIs(Be.Name.idIs(IfThis.isIdentifier(namespace))), Be.Attribute.attrIs(IfThis.isIdentifier(identifier)))
+
 		def workhorse(node: ast.AST) -> TypeIs[ast.Attribute]:
-			return Be.Attribute.valueIs(Be.Name.idIs(IfThis.isIdentifier(namespace)))(node) and Be.Attribute.attrIs(IfThis.isIdentifier(identifier))(node)
+			return predicateComposed(node)
 		return workhorse
 
 	@staticmethod
@@ -172,9 +322,7 @@ class IfThis:
 		predicate : Callable[[ast.AST], TypeIs[ast.Call]]
 			Predicate returning `True` if the node is an `ast.Call` to the given identifier.
 		"""
-		def workhorse(node: ast.AST) -> TypeIs[ast.Call]:
-			return Be.Call.funcIs(Be.Name.idIs(IfThis.isIdentifier(identifier)))(node)
-		return workhorse
+		return Be.Call.funcIs(Be.Name.idIs(IfThis.isIdentifier(identifier)))
 
 	@staticmethod
 	def isCallAttributeNamespaceIdentifier(namespace: str, identifier: str) -> Callable[[ast.AST], TypeIs[ast.Call]]:
@@ -195,9 +343,7 @@ class IfThis:
 			Predicate returning `True` if the node is an `ast.Call` whose function is an `ast.Attribute` with the given namespace and identifier.
 
 		"""
-		def workhorse(node: ast.AST) -> TypeIs[ast.Call]:
-			return Be.Call.funcIs(IfThis.isAttributeNamespaceIdentifier(namespace, identifier))(node)
-		return workhorse
+		return Be.Call.funcIs(IfThis.isAttributeNamespaceIdentifier(namespace, identifier))
 
 	@staticmethod
 	def isCallToName(node: ast.AST) -> TypeIs[ast.Call]:
@@ -235,9 +381,7 @@ class IfThis:
 			Predicate returning `True` if the node is an `ast.ClassDef` with the given identifier.
 
 		"""
-		def workhorse(node: ast.AST) -> TypeIs[ast.ClassDef]:
-			return Be.ClassDef.nameIs(IfThis.isIdentifier(identifier))(node)
-		return workhorse
+		return Be.ClassDef.nameIs(IfThis.isIdentifier(identifier))
 
 	@staticmethod
 	def isConstant_value(value: Any) -> Callable[[ast.AST], TypeIs[ast.Constant]]:
@@ -256,9 +400,7 @@ class IfThis:
 			Predicate returning `True` if the node is an `ast.Constant` with the given value.
 
 		"""
-		def workhorse(node: ast.AST) -> TypeIs[ast.Constant]:
-			return Be.Constant.valueIs(lambda thisAttribute: thisAttribute == value)(node)
-		return workhorse
+		return Be.Constant.valueIs(lambda thisAttribute: thisAttribute == value)
 
 	@staticmethod
 	def isFunctionDefIdentifier(identifier: str) -> Callable[[ast.AST], TypeIs[ast.FunctionDef]]:
@@ -277,9 +419,7 @@ class IfThis:
 			Predicate returning `True` if the node is an `ast.FunctionDef` with the given identifier.
 
 		"""
-		def workhorse(node: ast.AST) -> TypeIs[ast.FunctionDef]:
-			return Be.FunctionDef.nameIs(IfThis.isIdentifier(identifier))(node)
-		return workhorse
+		return Be.FunctionDef.nameIs(IfThis.isIdentifier(identifier))
 
 	@staticmethod
 	def isIdentifier(identifier: str | None) -> Callable[[str | None], TypeIs[str]]:
@@ -321,9 +461,7 @@ class IfThis:
 			Predicate returning `True` if the node is an `ast.If` whose test is a unary NOT of an attribute with the given namespace and identifier.
 
 		"""
-		def workhorse(node: ast.AST) -> TypeIs[ast.If]:
-			return Be.If.testIs(IfThis.isUnaryNotAttributeNamespaceIdentifier(namespace, identifier))(node)
-		return workhorse
+		return Be.If.testIs(IfThis.isUnaryNotAttributeNamespaceIdentifier(namespace, identifier))
 
 	@staticmethod
 	def isNameIdentifier(identifier: str) -> Callable[[ast.AST], TypeIs[ast.Name]]:
@@ -342,14 +480,12 @@ class IfThis:
 			Predicate returning `True` if the node is an `ast.Name` with the given identifier.
 
 		"""
-		def workhorse(node: ast.AST) -> TypeIs[ast.Name]:
-			return Be.Name.idIs(IfThis.isIdentifier(identifier))(node)
-		return workhorse
+		return Be.Name.idIs(IfThis.isIdentifier(identifier))
 
 # TODO I wanted `Be.Call.funcIs(IfThis.isNestedNameIdentifier('TypeVar'))` to match typing_extensions.TypeVar(), typing.TypeVar(), or TypeVar().
 # Is that a good idea?
 	@staticmethod
-	def isNestedNameIdentifier(identifier: str) -> Callable[[ast.AST], TypeIs[ast.Attribute | ast.Starred | ast.Subscript]]:
+	def isNestedNameIdentifier(identifier: str) -> Callable[[ast.AST], TypeIs[ast.Attribute | ast.Name | ast.Starred | ast.Subscript]]:
 		"""Return a predicate matching an `ast.Name`, `ast.Attribute`, `ast.Subscript`, or `ast.Starred` node with a specific identifier.
 
 		(AI generated docstring)
@@ -361,12 +497,14 @@ class IfThis:
 
 		Returns
 		-------
-		predicate : Callable[[ast.AST], TypeIs[ast.Attribute | ast.Starred | ast.Subscript]]
+		predicate : Callable[[ast.AST], TypeIs[ast.Attribute | ast.Name | ast.Starred | ast.Subscript]]
 			Predicate returning `True` if the node is a `Name`, `Attribute`, `Subscript`, or `Starred` with the given identifier.
 
 		"""
-		def workhorse(node: ast.AST) -> TypeIs[ast.Attribute | ast.Starred | ast.Subscript]:
-			return IfThis.isNameIdentifier(identifier)(node) or IfThis.isAttributeIdentifier(identifier)(node) or IfThis.isSubscriptIdentifier(identifier)(node) or IfThis.isStarredIdentifier(identifier)(node)
+		def workhorse(node: ast.AST) -> TypeIs[ast.Attribute | ast.Name | ast.Starred | ast.Subscript]:
+			return predicateComposed(node)
+		# The predicate refers to itself for the `value` of `ast.Attribute`, `ast.Subscript`, and `ast.Starred`, so it is composed once, not once per level of nesting.
+		predicateComposed: Callable[[ast.AST], bool] = IfThis.isAnyOf(IfThis.isNameIdentifier(identifier), Be.Attribute.valueIs(workhorse), Be.Subscript.valueIs(workhorse), Be.Starred.valueIs(workhorse))
 		return workhorse
 
 	@staticmethod
@@ -386,9 +524,7 @@ class IfThis:
 			Predicate returning `True` if the node is an `ast.Starred` whose value matches the identifier.
 
 		"""
-		def workhorse(node: ast.AST) -> TypeIs[ast.Starred]:
-			return Be.Starred.valueIs(IfThis.isNestedNameIdentifier(identifier))(node)
-		return workhorse
+		return Be.Starred.valueIs(IfThis.isNestedNameIdentifier(identifier))
 
 	@staticmethod
 	def isSubscriptIdentifier(identifier: str) -> Callable[[ast.AST], TypeIs[ast.Subscript]]:
@@ -407,9 +543,7 @@ class IfThis:
 			Predicate returning `True` if the node is a `Subscript` whose value matches the identifier.
 
 		"""
-		def workhorse(node: ast.AST) -> TypeIs[ast.Subscript]:
-			return Be.Subscript.valueIs(IfThis.isNestedNameIdentifier(identifier))(node)
-		return workhorse
+		return Be.Subscript.valueIs(IfThis.isNestedNameIdentifier(identifier))
 
 	@staticmethod
 	def isUnaryNotAttributeNamespaceIdentifier(namespace: str, identifier: str) -> Callable[[ast.AST], TypeIs[ast.UnaryOp]]:
@@ -430,10 +564,10 @@ class IfThis:
 			Predicate returning `True` if the node is a `UnaryOp` representing NOT of an attribute with the given namespace and identifier.
 
 		"""
+		predicateComposed: Callable[[ast.AST], bool] = IfThis.isAllOf(Be.UnaryOp.opIs(Be.Not), Be.UnaryOp.operandIs(IfThis.isAttributeNamespaceIdentifier(namespace, identifier)))
+
 		def workhorse(node: ast.AST) -> TypeIs[ast.UnaryOp]:
-			return (Be.UnaryOp(node)
-					and Be.Not(node.op)  # ty:ignore[unresolved-attribute]
-					and IfThis.isAttributeNamespaceIdentifier(namespace, identifier)(node.operand))  # ty:ignore[unresolved-attribute]
+			return predicateComposed(node)
 		return workhorse
 
 	@staticmethod
@@ -453,9 +587,7 @@ class IfThis:
 			Predicate returning `True` if the node matches and no descendant matches.
 
 		"""
-		def workhorse(node: ast.AST) -> bool:
-			return predicate(node) and IfThis.matchesNoDescendant(predicate)(node)
-		return workhorse
+		return IfThis.isAllOf(predicate, IfThis.matchesNoDescendant(predicate))
 
 	@staticmethod
 	def matchesNoDescendant(predicate: Callable[[ast.AST], bool]) -> Callable[[ast.AST], bool]:
@@ -463,6 +595,9 @@ class IfThis:
 
 		(AI generated docstring)
 
+		The predicate walks the subtree of each node it is asked about. To ask about many nodes of the
+		same tree, use `DescendantMatchIndex(predicate).matchesNoDescendant`, which walks each subtree once.
+
 		Parameters
 		----------
 		predicate : Callable[[ast.AST], bool]
@@ -480,15 +615,26 @@ class IfThis:
 
 # TODO Py3.14 has a new feature for comparing two nodes. Investigate.
 	@staticmethod
-	def unparseIs(astAST: ast.AST) -> Callable[[ast.AST], bool]:
+	def unparseIs(astAST: ast.AST, *, structural: bool = False, unparseCache: UnparseCache | None = None) -> Callable[[ast.AST], bool]:
 		"""Return a predicate that matches a node if its unparsed code matches the unparsed code of a given AST node.
 
 		(AI generated docstring)
 
+		The code of `astAST` is computed once, when `unparseIs` makes the predicate, so change
+		`astAST` only before you call `unparseIs`.
+
 		Parameters
 		----------
 		astAST : ast.AST
 			The AST node to compare against.
+		structural : bool = False
+			If `True`, compare the trees with `areStructurallyEqual`, ignoring `ctx`, instead of comparing
+			the unparsed code. The comparison stops at the first difference, so it is much faster. The
+			result differs only for different trees that unparse to the same code, such as
+			`ast.Constant(-1)` and `ast.UnaryOp(ast.USub(), ast.Constant(1))`.
+		unparseCache : UnparseCache | None = None
+			If not `None`, the predicate unparses each node with `unparseCache`, so many predicates, or
+			many passes, that check the same tree unparse each subtree once. See `UnparseCache.watch`.
 
 		Returns
 		-------
@@ -496,6 +642,14 @@ class IfThis:
 			Predicate returning `True` if the node's unparsed code matches the given AST node's unparsed code.
 
 		"""
+		if structural:
+			def workhorseStructural(node: ast.AST) -> bool:
+				return areStructurallyEqual(node, astAST, ignoreContext=True)
+			return workhorseStructural
+
+		textReference: str = ast.unparse(astAST)
+		unparse: Callable[[ast.AST], str] = ast.unparse if unparseCache is None else unparseCache.unparse
+
 		def workhorse(node: ast.AST) -> bool:
-			return ast.unparse(node) == ast.unparse(astAST)
+			return unparse(node) == textReference
 		return workhorse
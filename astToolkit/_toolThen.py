@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from astToolkit._toolkitNodeVisitor import StopTraversal
+from typing import NoReturn, TYPE_CHECKING
 
 if TYPE_CHECKING:
 	from collections.abc import Callable, Mapping, Sequence
@@ -21,6 +22,9 @@ class Then:
 	- `removeIt()`.
 	- `replaceWith()` an `ast.AST` or appropriate `object`.
 
+	End the traversal:
+	- `stopTraversal()`.
+
 	"""
 
 	@staticmethod
@@ -153,6 +157,26 @@ class Then:
 		"""
 		return lambda _replaceMe: this
 
+	@staticmethod
+	def stopTraversal(_stopHere: object) -> NoReturn:
+		"""End the traversal of `NodeTourist` at the matched node.
+
+		`stopTraversal` raises `StopTraversal`, which `NodeTourist` catches. Use it as the last action of
+		`Grab.andDoAllOf` to stop after the other actions, for example, to collect nodes up to and
+		including the first `ast.Return`.
+
+		Parameters
+		----------
+		_stopHere : object
+			The matched node (parameter ignored).
+
+		Raises
+		------
+		StopTraversal
+			Always.
+		"""
+		raise StopTraversal
+
 	@staticmethod
 	def updateKeyValueIn[个, 文件, 文义](key: Callable[[个], 文件], value: Callable[[个], 文义], dictionary: dict[文件, 文义]) -> Callable[[个], Mapping[文件, 文义]]:
 		"""Update a dictionary with key-value pairs derived from matched nodes.
@@ -0,0 +1,118 @@
+"""Apply an action to the `ast.Module` of each of many Python source files in parallel processes.
+
+`mapPathFilenames` and `rewritePathFilenames` parse each file with `parsePathFilename2astModule` and
+apply an action, such as a function that runs `NodeTourist` or `NodeChanger` passes, in a
+`concurrent.futures.ProcessPoolExecutor`, so a pass over every file of a repository scales with the
+number of cores. The results are in the order of the paths, regardless of which process finishes first.
+
+Each worker process receives `action` by `pickle`, so `action` must be picklable: a function defined
+at the top level of a module or a `functools.partial` of one, but not a `lambda` or a closure. A
+`NodeTourist` or `NodeChanger` with `Be.*` attribute predicates or `Then.*` actions contains closures,
+so `action` should construct the visitors inside the worker. The return value of `action` is sent
+back by `pickle`, too, so `action` should return plain data, such as identifiers or source code,
+rather than the `ast.Module`.
+"""
+from __future__ import annotations
+
+from astToolkit._namespaceUncertainty import parsePathFilename2astModule
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from math import ceil
+from os import process_cpu_count
+from typing import TYPE_CHECKING
+import ast
+
+if TYPE_CHECKING:
+	from astToolkit._namespaceUncertainty import astParseParameters
+	from collections.abc import Callable, Iterable
+	from os import PathLike
+	from pathlib import PurePath
+	from typing import Any, Unpack
+
+def _parseAndApply[个](action: Callable[[ast.Module], 个], keywordArguments: astParseParameters, pathFilename: PathLike[Any] | PurePath) -> 个:
+	return action(parsePathFilename2astModule(pathFilename, **keywordArguments))
+
+def _parseApplyAndUnparse(action: Callable[[ast.Module], object], keywordArguments: astParseParameters, pathFilename: PathLike[Any] | PurePath) -> str:
+	astModule: ast.Module = parsePathFilename2astModule(pathFilename, **keywordArguments)
+	action(astModule)
+	return ast.unparse(ast.fix_missing_locations(astModule))
+
+def _mapInProcessPool[个](worker: Callable[[PathLike[Any] | PurePath], 个], listPathFilenames: list[PathLike[Any] | PurePath], maxWorkers: int | None, chunksize: int | None) -> list[个]:
+	if not listPathFilenames:
+		return []
+	workers: int = min(maxWorkers or process_cpu_count() or 1, len(listPathFilenames))
+	if chunksize is None:
+		# About four chunks per worker balances the cost of sending each chunk against idle workers at the end.
+		chunksize = ceil(len(listPathFilenames) / (workers * 4))
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		return list(executor.map(worker, listPathFilenames, chunksize=chunksize))
+
+def mapPathFilenames[个](action: Callable[[ast.Module], 个], listPathFilenames: Iterable[PathLike[Any] | PurePath], *, maxWorkers: int | None = None, chunksize: int | None = None, **keywordArguments: Unpack[astParseParameters]) -> list[个]:
+	"""Parse each file in `listPathFilenames` and return the result of `action` on each `ast.Module`, using parallel processes.
+
+	If parsing a file or running `action` raises an exception, such as `SyntaxError`, `mapPathFilenames`
+	raises the first such exception, in the order of `listPathFilenames`.
+
+	Parameters
+	----------
+	action : Callable[[ast.Module], 个]
+		A picklable function, such as a function defined at the top level of a module, that receives the
+		`ast.Module` of one file and returns a picklable result.
+	listPathFilenames : Iterable[PathLike[Any] | PurePath]
+		The paths of the Python source files.
+	maxWorkers : int | None = None
+		The maximum number of worker processes. If `None`, the number of CPUs available to this process.
+	chunksize : int | None = None
+		The number of paths sent to a worker at a time. If `None`, about four chunks per worker.
+	**keywordArguments : Unpack[astParseParameters]
+		Keyword arguments for `ast.parse`, as in `parsePathFilename2astModule`.
+
+	Returns
+	-------
+	listResults : list[个]
+		The result of `action` for each file, in the order of `listPathFilenames`.
+
+	Examples
+	--------
+	Collect the function names of each module of a package:
+	```python
+		def identifiersFunctionDef(astModule: ast.Module) -> list[str]:
+			return NodeTourist(Be.FunctionDef, DOT.name).captureMatches(astModule)
+
+		listPathFilenames = sorted(Path('kitchen').rglob('*.py'))
+		for pathFilename, listIdentifiers in zip(listPathFilenames, mapPathFilenames(identifiersFunctionDef, listPathFilenames)):
+			print(pathFilename, listIdentifiers)
+	```
+	"""
+	return _mapInProcessPool(partial(_parseAndApply, action, keywordArguments), list(listPathFilenames), maxWorkers, chunksize)
+
+def rewritePathFilenames(action: Callable[[ast.Module], object], listPathFilenames: Iterable[PathLike[Any] | PurePath], *, maxWorkers: int | None = None, chunksize: int | None = None, **keywordArguments: Unpack[astParseParameters]) -> list[str]:
+	"""Parse each file in `listPathFilenames`, let `action` change each `ast.Module`, and return the new source code, using parallel processes.
+
+	`rewritePathFilenames` does not write any file. To write a result, for example, with
+	`write_astModule`, parse the returned source code or write it directly.
+
+	If parsing a file or running `action` raises an exception, such as `SyntaxError`,
+	`rewritePathFilenames` raises the first such exception, in the order of `listPathFilenames`.
+
+	Parameters
+	----------
+	action : Callable[[ast.Module], object]
+		A picklable function, such as a function defined at the top level of a module, that changes the
+		`ast.Module` of one file in place, for example, with `NodeChanger(...).visit(astModule)`. The
+		return value of `action` is ignored.
+	listPathFilenames : Iterable[PathLike[Any] | PurePath]
+		The paths of the Python source files.
+	maxWorkers : int | None = None
+		The maximum number of worker processes. If `None`, the number of CPUs available to this process.
+	chunksize : int | None = None
+		The number of paths sent to a worker at a time. If `None`, about four chunks per worker.
+	**keywordArguments : Unpack[astParseParameters]
+		Keyword arguments for `ast.parse`, as in `parsePathFilename2astModule`.
+
+	Returns
+	-------
+	listPythonSource : list[str]
+		The `ast.unparse` source code of each changed `ast.Module`, in the order of `listPathFilenames`.
+	"""
+	return _mapInProcessPool(partial(_parseApplyAndUnparse, action, keywordArguments), list(listPathFilenames), maxWorkers, chunksize)
@@ -0,0 +1,195 @@
+"""The call graph of the functions of a module, built in one traversal.
+
+`CallGraph` records, for each `ast.FunctionDef` of a module, the functions of the module that it calls
+by name. From the graph, it computes the strongly connected components, which are the groups of
+functions that call each other, directly or indirectly, and an order of the functions in which each
+function comes after every function that it calls. With the order, a transformation can process
+each function once, from the leaves of the graph up, instead of searching the module again after
+each change until nothing changes.
+
+`Inliner` and `inlineFunctionDef` use only `calleesOf` and `reachableFrom`. As `inlineFunctionDef`
+always has, they inline the functions that the target calls and, once, the functions that those
+call, including recursive functions, so they do not use the order or `isRecursive`.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+import ast
+
+if TYPE_CHECKING:
+	from typing import Final
+
+def _identifiersCalledByName(astAST: ast.AST) -> list[str]:
+	"""Return the identifiers that an `ast.Call` of an `ast.Name` in `astAST` calls, such as `bake` in `bake(flour)`, in the order of their first call.
+
+	Returns
+	-------
+	listIdentifiers : list[str]
+		The identifiers, each once, in the order of their first call.
+	"""
+	dictionaryIdentifiers: dict[str, None] = {}
+	stack: list[ast.AST] = [astAST]
+	while stack:
+		node: ast.AST = stack.pop()
+		if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+			dictionaryIdentifiers[node.func.id] = None
+		stack.extend(reversed(list(ast.iter_child_nodes(node))))
+	return list(dictionaryIdentifiers)
+
+class CallGraph:
+	"""The functions of a module that each function of the module calls by name.
+
+	`CallGraph` traverses `astModule` once, when it is created, and records each `ast.FunctionDef`, at
+	any depth, by `name`, as `makeDictionaryFunctionDef` does. The callees of a function are the
+	recorded functions that it calls with an `ast.Call` of an `ast.Name`, anywhere in the function,
+	including its nested functions. A call of an `ast.Attribute`, such as `self.bake()`, is not an edge
+	of the graph.
+
+	A function is recursive if it is in a strongly connected component with more than one function,
+	or if it calls itself. `CallGraph` computes the components, with Tarjan's algorithm and an explicit
+	stack, when it is created.
+
+	The graph is a snapshot: after a transformation changes the module, build a new `CallGraph`.
+
+	Parameters
+	----------
+	astModule : ast.AST
+		The module.
+
+	Examples
+	--------
+	```python
+		callGraph = CallGraph(kitchenModule)
+		callGraph.calleesOf('bake')  # ('mix', 'rise')
+		callGraph.isRecursive('knead')  # True, if `knead` calls `knead`, directly or indirectly
+		callGraph.orderInlining('bake')  # ['rise', 'mix']: callees first
+	```
+
+	References
+	----------
+	[1] Tarjan's strongly connected components algorithm - Wikipedia
+		https://en.wikipedia.org/wiki/Tarjan%27s_strongly_connected_components_algorithm
+	"""
+
+	def __init__(self, astModule: ast.AST) -> None:
+		self.dictionaryFunctionDef: Final[dict[str, ast.FunctionDef]] = {}
+		# In the order of the source code, so, as in `makeDictionaryFunctionDef`, the last function with a name wins.
+		stack: list[ast.AST] = [astModule]
+		while stack:
+			node: ast.AST = stack.pop()
+			if isinstance(node, ast.FunctionDef):
+				self.dictionaryFunctionDef[node.name] = node
+			stack.extend(reversed(list(ast.iter_child_nodes(node))))
+		self.dictionaryIdentifier2Callees: Final[dict[str, tuple[str, ...]]] = {identifier: tuple(callee for callee in _identifiersCalledByName(functionDef) if callee in self.dictionaryFunctionDef)
+			for identifier, functionDef in self.dictionaryFunctionDef.items()}
+		self.listComponents: Final[list[tuple[str, ...]]] = self._stronglyConnectedComponents()
+		self.setRecursive: Final[frozenset[str]] = frozenset(identifier for component in self.listComponents for identifier in component
+			if len(component) > 1 or identifier in self.dictionaryIdentifier2Callees[identifier])
+		# Tarjan's algorithm finds each component after the components that it calls.
+		self._dictionaryIdentifier2Position: Final[dict[str, int]] = {identifier: position
+			for position, identifier in enumerate(identifier for component in self.listComponents for identifier in component)}
+
+	def _stronglyConnectedComponents(self) -> list[tuple[str, ...]]:
+		dictionaryIdentifier2Callees: dict[str, tuple[str, ...]] = self.dictionaryIdentifier2Callees
+		dictionaryIndex: dict[str, int] = {}
+		dictionaryLowLink: dict[str, int] = {}
+		setOnStack: set[str] = set()
+		stackComponent: list[str] = []
+		listComponents: list[tuple[str, ...]] = []
+		for identifierStart in dictionaryIdentifier2Callees:
+			if identifierStart in dictionaryIndex:
+				continue
+			# Each frame is a function and the position of its next callee.
+			stackCall: list[tuple[str, int]] = [(identifierStart, 0)]
+			while stackCall:
+				identifier, position = stackCall.pop()
+				if position == 0:
+					dictionaryIndex[identifier] = dictionaryLowLink[identifier] = len(dictionaryIndex)
+					stackComponent.append(identifier)
+					setOnStack.add(identifier)
+				callees: tuple[str, ...] = dictionaryIdentifier2Callees[identifier]
+				if position < len(callees):
+					stackCall.append((identifier, position + 1))
+					callee: str = callees[position]
+					if callee not in dictionaryIndex:
+						stackCall.append((callee, 0))
+					elif callee in setOnStack:
+						dictionaryLowLink[identifier] = min(dictionaryLowLink[identifier], dictionaryIndex[callee])
+					continue
+				if dictionaryLowLink[identifier] == dictionaryIndex[identifier]:
+					listMembers: list[str] = []
+					while True:
+						member: str = stackComponent.pop()
+						setOnStack.discard(member)
+						listMembers.append(member)
+						if member == identifier:
+							break
+					listComponents.append(tuple(reversed(listMembers)))
+				if stackCall:
+					caller: str = stackCall[-1][0]
+					dictionaryLowLink[caller] = min(dictionaryLowLink[caller], dictionaryLowLink[identifier])
+		return listComponents
+
+	def calleesOf(self, identifier: str) -> tuple[str, ...]:
+		"""Return the functions of the module that `identifier` calls, in the order of their first call.
+
+		Returns
+		-------
+		tupleCallees : tuple[str, ...]
+			The names of the functions of the module that `identifier` calls.
+		"""
+		return self.dictionaryIdentifier2Callees[identifier]
+
+	def isRecursive(self, identifier: str) -> bool:
+		"""Whether `identifier` calls itself, directly or through other functions of the module.
+
+		Returns
+		-------
+		isRecursive : bool
+			`True` if `identifier` calls itself, directly or indirectly.
+		"""
+		return identifier in self.setRecursive
+
+	def reachableFrom(self, identifier: str, *, throughRecursive: bool = True) -> set[str]:
+		"""Return the functions that `identifier` calls, directly or indirectly.
+
+		Parameters
+		----------
+		identifier : str
+			The function.
+		throughRecursive : bool = True
+			If `False`, a recursive function, and the functions that only it calls, are not included.
+
+		Returns
+		-------
+		setReachable : set[str]
+			The functions. `identifier` is included only if it is recursive and `throughRecursive`.
+		"""
+		setReachable: set[str] = set()
+		stack: list[str] = [identifier]
+		while stack:
+			for callee in self.dictionaryIdentifier2Callees[stack.pop()]:
+				if callee not in setReachable and (throughRecursive or callee not in self.setRecursive):
+					setReachable.add(callee)
+					stack.append(callee)
+		return setReachable
+
+	def orderInlining(self, identifier: str) -> list[str]:
+		"""Return the functions to inline into `identifier`, each after every function that it calls.
+
+		The functions are the non-recursive functions that `identifier` calls, directly or through
+		other non-recursive functions.
+
+		Parameters
+		----------
+		identifier : str
+			The function into which to inline.
+
+		Returns
+		-------
+		listIdentifiers : list[str]
+			The functions, callees first. `identifier` is not included.
+		"""
+		setReachable: set[str] = self.reachableFrom(identifier, throughRecursive=False)
+		setReachable.discard(identifier)
+		return sorted(setReachable, key=self._dictionaryIdentifier2Position.__getitem__)
@@ -0,0 +1,349 @@
+r"""Match nodes against Python source code with placeholders, and build nodes from the same kind of source code.
+
+A template is Python source code in which `$identifier` is a placeholder. `CodeTemplate('$a + $b * $a')`
+matches any `ast.BinOp` that adds a product to an expression, if the left operand of `+` is
+structurally equal to the right operand of `*`, and it binds `'a'` and `'b'` to the nodes at the
+placeholders. A placeholder can be:
+
+- an expression, such as `$a` in `$a + 1`, which matches any node;
+- a statement, such as `$step` in `while $test:\n\t$step`, which matches any statement;
+- an identifier, such as `$name` in `def $name(): pass` or `$attr` in `self.$attr`, which matches any `str`.
+
+`$_` matches anything and binds nothing. Every other placeholder that appears more than once must bind
+structurally equal values, ignoring `ctx`.
+
+`CodeTemplate` compiles the template once: it writes the source code of one function with the
+checks for the whole template, as `compilePredicate` does for a predicate, so matching a node does
+not traverse the template.
+"""
+from __future__ import annotations
+
+from astToolkit._toolkitPredicateMetadata import _annotationReturnOf
+from astToolkit._toolkitStructuralHash import _isEqualValue, areStructurallyEqual
+from copy import deepcopy
+from textwrap import dedent
+from typing import cast, TYPE_CHECKING
+import ast
+import re as regex
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Mapping
+	from typing import Any, Final
+
+_prefixMarker: Final[str] = '__astToolkitPlaceholder_'
+_regexPlaceholder: Final[regex.Pattern[str]] = regex.compile(r'\$([A-Za-z_][A-Za-z0-9_]*)')
+_identifierWildcard: Final[str] = '_'
+_fieldsIgnored: Final[frozenset[str]] = frozenset({'ctx', 'type_comment'})
+
+_dictionarySource2Factory: Final[dict[str, tuple[Callable[..., tuple[Callable[[ast.AST], Any], Callable[[ast.AST], bool]]], list[object]]]] = {}
+
+def _placeholderOf(value: object) -> str | None:
+	if isinstance(value, ast.Name):
+		value = value.id
+	if isinstance(value, str) and value.startswith(_prefixMarker):
+		return value.removeprefix(_prefixMarker)
+	return None
+
+def _placeholderOfStatement(value: object) -> str | None:
+	if isinstance(value, ast.Expr):
+		return _placeholderOf(value.value)
+	return None
+
+def _isSameBinding(valueA: object, valueB: object) -> bool:
+	if isinstance(valueA, ast.AST) and isinstance(valueB, ast.AST):
+		return areStructurallyEqual(valueA, valueB, ignoreContext=True)
+	# The same placeholder can be an identifier and an expression, as in `def $name(): return $name`.
+	if isinstance(valueA, ast.Name):
+		valueA = valueA.id
+	if isinstance(valueB, ast.Name):
+		valueB = valueB.id
+	return _isEqualValue(valueA, valueB)
+
+class _CompilerOfTemplate:
+	"""Write the lines of the matching function, in which `return FAIL` means "no match"."""
+
+	def __init__(self) -> None:
+		self.listArguments: list[object] = []
+		self.listLines: list[str] = []
+		self.dictionaryPlaceholder2Local: dict[str, str] = {}
+		self.countLocals: int = 0
+
+	def _slot(self, value: object) -> str:
+		self.listArguments.append(value)
+		return f"a{len(self.listArguments) - 1}"
+
+	def _local(self, expression: str) -> str:
+		self.countLocals += 1
+		local: str = f"v{self.countLocals}"
+		self.listLines.append(f"{local} = {expression}")
+		return local
+
+	def _bind(self, placeholder: str, local: str) -> None:
+		if placeholder == _identifierWildcard:
+			return
+		if placeholder in self.dictionaryPlaceholder2Local:
+			self.listLines.append(f"if not {self._slot(_isSameBinding)}({local}, {self.dictionaryPlaceholder2Local[placeholder]}): return FAIL")
+		else:
+			self.dictionaryPlaceholder2Local[placeholder] = local
+
+	def emitNode(self, templateNode: ast.AST, local: str, *, isStatement: bool) -> None:
+		placeholder: str | None = _placeholderOfStatement(templateNode) if isStatement else _placeholderOf(templateNode)
+		if placeholder is not None:
+			self._bind(placeholder, local)
+			return
+		self.listLines.append(f"if not isinstance({local}, {self._slot(type(templateNode))}): return FAIL")
+		for fieldName in templateNode._fields:
+			if fieldName not in _fieldsIgnored:
+				self.emitValue(getattr(templateNode, fieldName, None), f"{local}.{fieldName}")
+
+	def emitValue(self, value: object, expression: str) -> None:
+		if isinstance(value, ast.AST):
+			self.emitNode(value, self._local(expression), isStatement=False)
+		elif isinstance(value, list):
+			listItems: list[object] = cast('list[object]', value)
+			local: str = self._local(expression)
+			self.listLines.append(f"if len({local}) != {len(listItems)}: return FAIL")
+			for index, item in enumerate(listItems):
+				if isinstance(item, ast.AST):
+					self.emitNode(item, self._local(f"{local}[{index}]"), isStatement=isinstance(item, ast.stmt))
+				else:
+					self.emitValue(item, f"{local}[{index}]")
+		elif value is None:
+			self.listLines.append(f"if {expression} is not None: return FAIL")
+		elif (placeholder := _placeholderOf(value)) is not None:
+			self._bind(placeholder, self._local(expression))
+		elif isinstance(value, str):
+			self.listLines.append(f"if {expression} != {self._slot(value)}: return FAIL")
+		else:
+			self.listLines.append(f"if not {self._slot(_isEqualValue)}({expression}, {self._slot(value)}): return FAIL")
+
+	def writeSource(self) -> str:
+		bindings: str = ', '.join(f"{placeholder!r}: {local}" for placeholder, local in self.dictionaryPlaceholder2Local.items())
+		bodyBindings: str = '\n\t\t'.join([*(line.replace('return FAIL', 'return None') for line in self.listLines), f"return {{{bindings}}}"])
+		bodyPredicate: str = '\n\t\t'.join([*(line.replace('return FAIL', 'return False') for line in self.listLines), "return True"])
+		parameters: str = ', '.join(f"a{slot}" for slot in range(len(self.listArguments)))
+		return (f"def factory({parameters}):\n\tdef bindingsCompiled(v0):\n\t\t{bodyBindings}\n"
+			f"\tdef predicateCompiled(v0):\n\t\t{bodyPredicate}\n\treturn bindingsCompiled, predicateCompiled\n")
+
+class CodeTemplate:
+	"""Python source code with `$identifier` placeholders, compiled once into a matcher that binds the placeholders.
+
+	A `CodeTemplate` is a predicate, so it can be `findThis` of `NodeTourist` and `NodeChanger`. The
+	visitors read `nodeTypes`, the class of the root of the template, to skip nodes of other
+	classes, and they call `predicate`, the compiled function, directly. `bindingsOf` returns the
+	nodes, or, for an identifier, the `str`, at each placeholder; use them in an action, for example
+	with `Make`, or pass them to `substitute` of another template. `replaceWith` makes the action
+	that does both.
+
+	The template is parsed as an expression if it is one, otherwise as one statement. A node matches
+	if it has the same structure as the template, ignoring positions, `ctx`, and `type_comment`; an
+	instance of a subclass of a class in the template, such as `Make.Add`, matches, too.
+
+	Parameters
+	----------
+	source : str
+		The template, such as `'$a + $b * $a'`. It is dedented, so it can be an indented block.
+
+	Raises
+	------
+	ValueError
+		If `source` is not valid Python after replacing the placeholders, or if it is more than one
+		statement.
+
+	Examples
+	--------
+	Replace `x + x` with `2 * x` for any expression `x`:
+	```python
+		codeTemplate = CodeTemplate('$x + $x')
+		NodeChanger(codeTemplate, codeTemplate.replaceWith('2 * $x')).visit(kitchenModule)
+	```
+
+	Collect the pairs of a `dict.get` with a default:
+	```python
+		codeTemplate = CodeTemplate('$mapping.get($key, $default)')
+		listBindings = NodeTourist(codeTemplate, codeTemplate.bindingsOf).captureMatches(kitchenModule)
+	```
+	"""
+
+	def __init__(self, source: str) -> None:
+		self.source: Final[str] = source
+		sourceMarked: str = _regexPlaceholder.sub(lambda matchPlaceholder: _prefixMarker + matchPlaceholder.group(1), dedent(source).strip())
+		self.astTemplate: Final[ast.AST] = _parseTemplate(source, sourceMarked)
+		self.nodeTypes: Final[tuple[type[ast.AST], ...] | None] = None if _placeholderOf(self.astTemplate) is not None else (type(self.astTemplate),)
+		self.bindingsCompiled: Final[Callable[[ast.AST], dict[str, Any] | None]]
+		self.predicate: Final[Callable[[ast.AST], bool]]
+		self.bindingsCompiled, self.predicate = _compile(sourceMarked, self.astTemplate)
+		self.predicate.__annotations__ = {'node': ast.AST, 'return': _annotationReturnOf(self.nodeTypes)}
+
+	def __call__(self, node: ast.AST) -> bool:
+		"""Whether `node` matches the template.
+
+		Returns
+		-------
+		isMatch : bool
+			`True` if `node` matches the template.
+		"""
+		return self.predicate(node)
+
+	def __repr__(self) -> str:
+		return f"CodeTemplate({self.source!r})"
+
+	def bindingsOf(self, node: ast.AST) -> dict[str, Any] | None:
+		"""Match `node` and return the value at each placeholder.
+
+		Parameters
+		----------
+		node : ast.AST
+			The node to match.
+
+		Returns
+		-------
+		bindings : dict[str, Any] | None
+			For each placeholder other than `$_`, the node of `node`, or the `str` of an identifier, at
+			the placeholder; or `None` if `node` does not match. The values are not copies.
+		"""
+		return self.bindingsCompiled(node)
+
+	def substitute(self, bindings: Mapping[str, Any] | None = None, /, **keywordBindings: Any) -> Any:
+		"""Build a new node from the template, replacing each placeholder with a copy of its value.
+
+		A value can be a node, such as a value from `bindingsOf` or from `Make`; a `str`, which becomes
+		an `ast.Name` at an expression placeholder; or, at a statement placeholder, a `list` of
+		statements. At an identifier placeholder, an `ast.Name` becomes its `id`.
+
+		If a placeholder has no value, or an identifier placeholder has a value that is not a `str` or an
+		`ast.Name`, `substitute` raises `ValueError`.
+
+		Parameters
+		----------
+		bindings : Mapping[str, Any] | None = None
+			The value of each placeholder.
+		**keywordBindings : Any
+			More values, by placeholder.
+
+		Returns
+		-------
+		astAST : Any
+			The new node. For a statement template, it is the statement, or a `list` if the template is a
+			statement placeholder and its value is a `list`.
+		"""
+		dictionaryBindings: dict[str, Any] = {**(bindings or {}), **keywordBindings}
+		treeNew: ast.AST = deepcopy(self.astTemplate)
+		replacementRoot: Any = _replacementOf(treeNew, dictionaryBindings, isStatement=isinstance(treeNew, ast.stmt))
+		if replacementRoot is not None:
+			return replacementRoot
+		stack: list[ast.AST] = [treeNew]
+		while stack:
+			node: ast.AST = stack.pop()
+			for fieldName, value in ast.iter_fields(node):
+				if isinstance(value, ast.AST):
+					replacement: Any = _replacementOf(value, dictionaryBindings, isStatement=False)
+					if replacement is None:
+						stack.append(value)
+					else:
+						setattr(node, fieldName, replacement)
+				elif isinstance(value, list):
+					listValues: list[Any] = []
+					for item in cast('list[object]', value):
+						replacement = _replacementOf(item, dictionaryBindings, isStatement=isinstance(item, ast.stmt))
+						if replacement is None:
+							listValues.append(item)
+							if isinstance(item, ast.AST):
+								stack.append(item)
+						elif isinstance(replacement, list):
+							listValues.extend(replacement)  # pyright: ignore[reportUnknownArgumentType]
+						else:
+							listValues.append(replacement)
+					setattr(node, fieldName, listValues)
+				elif isinstance(value, str) and (placeholder := _placeholderOf(value)) is not None:
+					setattr(node, fieldName, _identifierOf(placeholder, dictionaryBindings))
+		return treeNew
+
+	def replaceWith(self, templateReplacement: str | CodeTemplate) -> Callable[[ast.AST], Any]:
+		"""Make an action for `NodeChanger` that replaces a match of this template with `templateReplacement`, filled with the bindings of the match.
+
+		Parameters
+		----------
+		templateReplacement : str | CodeTemplate
+			The template of the replacement, such as `'2 * $x'`. Its placeholders must be placeholders
+			of this template.
+
+		Returns
+		-------
+		workhorse : Callable[[ast.AST], Any]
+			The action. It returns the node unchanged if the node does not match this template.
+		"""
+		codeTemplateReplacement: CodeTemplate = templateReplacement if isinstance(templateReplacement, CodeTemplate) else CodeTemplate(templateReplacement)
+
+		def workhorse(node: ast.AST) -> Any:
+			bindings: dict[str, Any] | None = self.bindingsCompiled(node)
+			if bindings is None:
+				return node
+			replacement: Any = codeTemplateReplacement.substitute(bindings)
+			if isinstance(replacement, ast.AST):
+				ast.copy_location(replacement, node)
+			return replacement
+		return workhorse
+
+def _parseTemplate(source: str, sourceMarked: str) -> ast.AST:
+	try:
+		return ast.parse(sourceMarked, mode='eval').body
+	except SyntaxError:
+		pass
+	try:
+		astModule: ast.Module = ast.parse(sourceMarked)
+	except SyntaxError as 拦message:
+		message: str = f"I received {source = }, but it is not valid Python, even with each `$identifier` replaced by an identifier."
+		raise ValueError(message) from 拦message
+	if len(astModule.body) != 1:
+		message = f"I received {source = }, but a template must be one expression or one statement, and it has {len(astModule.body)} statements."
+		raise ValueError(message)
+	return astModule.body[0]
+
+def _valueOf(placeholder: str, dictionaryBindings: dict[str, Any]) -> Any:
+	try:
+		return dictionaryBindings[placeholder]
+	except KeyError as 拦message:
+		message: str = f"I received bindings for {sorted(dictionaryBindings)}, but the template has the placeholder `${placeholder}`."
+		raise ValueError(message) from 拦message
+
+def _identifierOf(placeholder: str, dictionaryBindings: dict[str, Any]) -> str:
+	value: Any = _valueOf(placeholder, dictionaryBindings)
+	if isinstance(value, ast.Name):
+		return value.id
+	if isinstance(value, str):
+		return value
+	message: str = f"I received `{value!r}` for `${placeholder}`, but `${placeholder}` is an identifier, so its value must be a `str` or an `ast.Name`."
+	raise ValueError(message)
+
+def _replacementOf(templateNode: object, dictionaryBindings: dict[str, Any], *, isStatement: bool) -> Any:
+	if isStatement and (placeholder := _placeholderOfStatement(templateNode)) is not None:
+		value: Any = _valueOf(placeholder, dictionaryBindings)
+		if isinstance(value, list):
+			return [deepcopy(statement) for statement in cast('list[object]', value)]
+		if isinstance(value, ast.stmt):
+			return deepcopy(value)
+		return ast.Expr(_expressionOf(value, ast.Load()))
+	if isinstance(templateNode, ast.Name) and (placeholder := _placeholderOf(templateNode)) is not None:
+		return _expressionOf(_valueOf(placeholder, dictionaryBindings), templateNode.ctx)
+	return None
+
+def _expressionOf(value: Any, ctx: ast.expr_context) -> Any:
+	if isinstance(value, str):
+		return ast.Name(value, ctx)
+	expression: Any = deepcopy(value)
+	if hasattr(expression, 'ctx'):
+		# The template decides the context, so a bound `x` in `print(x)` can be the target of `$x = 0`.
+		expression.ctx = ctx
+	return expression
+
+def _compile(sourceMarked: str, astTemplate: ast.AST) -> tuple[Callable[[ast.AST], dict[str, Any] | None], Callable[[ast.AST], bool]]:
+	try:
+		factory, listArguments = _dictionarySource2Factory[sourceMarked]
+	except KeyError:
+		compiler = _CompilerOfTemplate()
+		compiler.emitNode(astTemplate, 'v0', isStatement=isinstance(astTemplate, ast.stmt))
+		namespace: dict[str, Any] = {}
+		exec(compile(compiler.writeSource(), '<CodeTemplate>', 'exec'), namespace)  # noqa: S102
+		factory, listArguments = _dictionarySource2Factory.setdefault(sourceMarked, (namespace['factory'], compiler.listArguments))
+	return factory(*listArguments)
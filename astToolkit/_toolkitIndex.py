@@ -0,0 +1,620 @@
+"""Indexes of an AST tree built in one traversal and queried without traversing the tree again.
+
+`TreeIndex` records, for every node of a tree, the parent of the node, the field of the parent
+that holds the node, and, if that field is a `list`, the index of the node in the `list`. With the
+index, "where is this node?" questions, such as "is this `ast.Name` inside a loop?", cost O(depth)
+instead of a traversal of the tree.
+
+`DescendantMatchIndex` records, for every node, whether any descendant matches a predicate, so
+"innermost match" questions cost O(1) after one bottom-up traversal.
+
+`NodeClassIndex` records, for every `ast` class, the nodes of the class in document order, so a
+query for `Be.Return`, then `Be.Call`, then `Be.Name` touches only the nodes of each class.
+`IdentifierIndex` records, for every identifier, the nodes that bind or reference it, by role.
+
+An index is a snapshot: after a `NodeChanger` or another transformation changes the tree, build a
+new index. `NodeClassIndex` and `IdentifierIndex` can watch a `NodeChanger` and rebuild
+themselves when the `NodeChanger` changes the tree.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from astToolkit._toolkitPredicateMetadata import _normalizeNodeTypes, metadataOfPredicate
+from heapq import merge
+from typing import TYPE_CHECKING
+import ast
+
+if TYPE_CHECKING:
+	from astToolkit._toolkitNodeVisitor import NodeChanger, NodeChangerSuite
+	from collections.abc import Callable, Iterator
+	from typing import Any, Final
+
+class TreeIndex:
+	"""The parent, field name, and `list` index of every node of an AST tree.
+
+	`TreeIndex` traverses the tree once, with an explicit stack, when it is created. Then `parentOf`,
+	`fieldNameOf`, and `indexOf` answer in O(1), and `ancestors` and `pathTo` answer in O(depth). The
+	methods are plain functions of a node, so they can be used in predicates for `findThis` and in
+	actions for `doThat`, and `hasAncestor` makes a predicate directly.
+
+	A node `object` that appears at more than one place in the tree, such as the `ast.Load` and
+	`ast.Add` instances that `ast.parse` shares among all nodes, has the location of only one of
+	those places.
+
+	Parameters
+	----------
+	root : ast.AST
+		The root of the tree to index.
+
+	Examples
+	--------
+	Find the `ast.Name` nodes inside a `for` loop:
+	```python
+		treeIndex = TreeIndex(kitchenModule)
+		listNamesInLoop = NodeTourist(IfThis.isAllOf(Be.Name, treeIndex.hasAncestor(Be.For)), Then.extractIt).captureMatches(kitchenModule)
+	```
+
+	Find the unreachable statements after each `return`:
+	```python
+		listUnreachable = [statement
+			for returnStatement in NodeTourist(Be.Return, Then.extractIt).iterMatches(kitchenModule)
+			for statement in treeIndex.siblings(returnStatement)[treeIndex.indexOf(returnStatement):]]
+	```
+	"""
+
+	def __init__(self, root: ast.AST) -> None:
+		self.root: Final[ast.AST] = root
+		self._dictionaryNode2Location: Final[dict[ast.AST, tuple[ast.AST, str, int | None]]] = {}
+		dictionaryNode2Location: dict[ast.AST, tuple[ast.AST, str, int | None]] = self._dictionaryNode2Location
+		stack: list[ast.AST] = [root]
+		while stack:
+			node: ast.AST = stack.pop()
+			for fieldName, value in ast.iter_fields(node):
+				if isinstance(value, ast.AST):
+					dictionaryNode2Location[value] = (node, fieldName, None)
+					stack.append(value)
+				elif isinstance(value, list):
+					for index, item in enumerate(value):  # pyright: ignore[reportUnknownArgumentType, reportUnknownVariableType]
+						if isinstance(item, ast.AST):
+							dictionaryNode2Location[item] = (node, fieldName, index)
+							stack.append(item)
+
+	def __contains__(self, node: object) -> bool:
+		"""Whether `node` is `root` or a descendant of `root`.
+
+		Returns
+		-------
+		isInTree : bool
+			`True` if `node` is `root` or a descendant of `root`.
+		"""
+		return node is self.root or node in self._dictionaryNode2Location
+
+	def __len__(self) -> int:
+		"""The number of nodes in the tree, including `root`.
+
+		Returns
+		-------
+		countNodes : int
+			The number of nodes in the tree, including `root`.
+		"""
+		return len(self._dictionaryNode2Location) + 1
+
+	def _locationOf(self, node: ast.AST) -> tuple[ast.AST, str, int | None] | None:
+		try:
+			return self._dictionaryNode2Location[node]
+		except KeyError as 拦message:
+			if node is self.root:
+				return None
+			message: str = f"I received {node = }, but it is not in the tree of {self.root = }. If the tree changed, create a new `TreeIndex`."
+			raise ValueError(message) from 拦message
+
+	def parentOf(self, node: ast.AST) -> ast.AST | None:
+		"""Return the parent of `node`, or `None` if `node` is `root`.
+
+		If `node` is not in the tree, `parentOf` raises `ValueError`.
+
+		Returns
+		-------
+		parent : ast.AST | None
+			The parent of `node`, or `None` if `node` is `root`.
+		"""
+		location: tuple[ast.AST, str, int | None] | None = self._locationOf(node)
+		return location[0] if location is not None else None
+
+	def fieldNameOf(self, node: ast.AST) -> str | None:
+		"""Return the name of the field of the parent that holds `node`, such as `'body'`, or `None` if `node` is `root`.
+
+		If `node` is not in the tree, `fieldNameOf` raises `ValueError`.
+
+		Returns
+		-------
+		fieldName : str | None
+			The name of the field, or `None` if `node` is `root`.
+		"""
+		location: tuple[ast.AST, str, int | None] | None = self._locationOf(node)
+		return location[1] if location is not None else None
+
+	def indexOf(self, node: ast.AST) -> int | None:
+		"""Return the index of `node` in the `list` field of the parent, or `None` if the field is not a `list` or `node` is `root`.
+
+		If `node` is not in the tree, `indexOf` raises `ValueError`.
+
+		Returns
+		-------
+		index : int | None
+			The index of `node` in the `list` field, or `None` if the field is not a `list` or `node` is `root`.
+		"""
+		location: tuple[ast.AST, str, int | None] | None = self._locationOf(node)
+		return location[2] if location is not None else None
+
+	def ancestors(self, node: ast.AST) -> Iterator[ast.AST]:
+		"""Yield the parent of `node`, the parent of the parent, and so on, ending with `root`.
+
+		If `node` is not in the tree, `ancestors` raises `ValueError` when the iteration starts.
+
+		Yields
+		------
+		ancestor : ast.AST
+			Each ancestor of `node`, from the parent to `root`.
+		"""
+		location: tuple[ast.AST, str, int | None] | None = self._locationOf(node)
+		while location is not None:
+			parent: ast.AST = location[0]
+			yield parent
+			location = self._dictionaryNode2Location.get(parent)
+
+	def pathTo(self, node: ast.AST) -> list[tuple[str, int | None]]:
+		"""Return the steps, from `root`, to `node`.
+
+		Each step is the name of a field and, if the field is a `list`, the index in the `list`. For
+		example, `[('body', 2), ('value', None)]` means `root.body[2].value`. If `node` is not in the tree,
+		`pathTo` raises `ValueError`.
+
+		Returns
+		-------
+		listSteps : list[tuple[str, int | None]]
+			The steps, from `root` to `node`. The list is empty if `node` is `root`.
+		"""
+		listSteps: list[tuple[str, int | None]] = []
+		location: tuple[ast.AST, str, int | None] | None = self._locationOf(node)
+		while location is not None:
+			parent, fieldName, index = location
+			listSteps.append((fieldName, index))
+			location = self._dictionaryNode2Location.get(parent)
+		listSteps.reverse()
+		return listSteps
+
+	def siblings(self, node: ast.AST) -> list[ast.AST]:
+		"""Return the other nodes in the same `list` field of the parent of `node`, in order.
+
+		For example, the siblings of a statement are the other statements of the same `body`. If the
+		field that holds `node` is not a `list`, or `node` is `root`, `node` has no siblings. If `node` is
+		not in the tree, `siblings` raises `ValueError`.
+
+		Returns
+		-------
+		listSiblings : list[ast.AST]
+			The siblings of `node`, in order, not including `node`.
+		"""
+		location: tuple[ast.AST, str, int | None] | None = self._locationOf(node)
+		if location is None or location[2] is None:
+			return []
+		parent, fieldName, _index = location
+		return [item for item in getattr(parent, fieldName) if isinstance(item, ast.AST) and item is not node]
+
+	def hasAncestor(self, predicate: Callable[[ast.AST], bool]) -> Callable[[ast.AST], bool]:
+		"""Make a predicate that is `True` for a node with at least one ancestor for which `predicate` is `True`.
+
+		Parameters
+		----------
+		predicate : Callable[[ast.AST], bool]
+			A predicate, such as `Be.For` or `IfThis.isFunctionDefIdentifier('bake')`.
+
+		Returns
+		-------
+		workhorse : Callable[[ast.AST], bool]
+			A predicate for nodes in the tree. It is `False` for `root` and for a node that is not in the
+			tree.
+		"""
+		def workhorse(node: ast.AST) -> bool:
+			if node not in self._dictionaryNode2Location:
+				return False
+			return any(predicate(ancestor) for ancestor in self.ancestors(node))
+		return workhorse
+
+class DescendantMatchIndex:
+	"""Whether any descendant of a node matches a predicate, computed bottom-up once per node.
+
+	`IfThis.matchesNoDescendant(predicate)` walks the whole subtree of each node it is asked about,
+	so asking about every node of a tree, as a `NodeTourist` does, costs O(size of the tree x depth)
+	calls to `predicate`. `DescendantMatchIndex` answers for a node, and remembers the answer for the
+	node and for each of its descendants, in one post-order traversal of the subtree, so it calls
+	`predicate` at most once per node and then answers in O(1).
+
+	The methods `matchesNoDescendant` and `matchesMeButNotAnyDescendant` are predicates, so they can
+	be used directly as `findThis`. A `DescendantMatchIndex` is a snapshot, like `TreeIndex`: after a
+	tree changes, create a new `DescendantMatchIndex`.
+
+	Parameters
+	----------
+	predicate : Callable[[ast.AST], bool]
+		The predicate to match against the descendants.
+
+	Examples
+	--------
+	Find the innermost calls to `bake`, in linear time:
+	```python
+		descendantMatchIndex = DescendantMatchIndex(IfThis.isCallIdentifier('bake'))
+		listInnermost = NodeTourist(descendantMatchIndex.matchesMeButNotAnyDescendant, Then.extractIt).captureMatches(kitchenModule)
+	```
+	"""
+
+	def __init__(self, predicate: Callable[[ast.AST], bool]) -> None:
+		self.predicate: Final[Callable[[ast.AST], bool]] = predicate
+		self._dictionaryNode2Matches: Final[dict[ast.AST, bool]] = {}
+		self._dictionaryNode2HasMatchingDescendant: Final[dict[ast.AST, bool]] = {}
+
+	def _index(self, node: ast.AST) -> None:
+		dictionaryNode2Matches: dict[ast.AST, bool] = self._dictionaryNode2Matches
+		dictionaryNode2HasMatchingDescendant: dict[ast.AST, bool] = self._dictionaryNode2HasMatchingDescendant
+		stack: list[tuple[ast.AST, bool]] = [(node, False)]
+		while stack:
+			nodeCurrent, isChildrenIndexed = stack.pop()
+			if isChildrenIndexed:
+				dictionaryNode2HasMatchingDescendant[nodeCurrent] = any(dictionaryNode2Matches[child] or dictionaryNode2HasMatchingDescendant[child]
+					for child in ast.iter_child_nodes(nodeCurrent))
+				dictionaryNode2Matches[nodeCurrent] = bool(self.predicate(nodeCurrent))
+			elif nodeCurrent not in dictionaryNode2HasMatchingDescendant:
+				stack.append((nodeCurrent, True))
+				stack.extend((child, False) for child in ast.iter_child_nodes(nodeCurrent))
+
+	def hasMatchingDescendant(self, node: ast.AST) -> bool:
+		"""Whether `predicate` is `True` for at least one descendant of `node`, not counting `node`.
+
+		Returns
+		-------
+		hasMatchingDescendant : bool
+			`True` if `predicate` is `True` for at least one descendant of `node`.
+		"""
+		try:
+			return self._dictionaryNode2HasMatchingDescendant[node]
+		except KeyError:
+			self._index(node)
+			return self._dictionaryNode2HasMatchingDescendant[node]
+
+	def matchesNoDescendant(self, node: ast.AST) -> bool:
+		"""Whether `predicate` is `False` for every descendant of `node`, as `IfThis.matchesNoDescendant(predicate)`.
+
+		Returns
+		-------
+		matchesNoDescendant : bool
+			`True` if `predicate` is `False` for every descendant of `node`.
+		"""
+		return not self.hasMatchingDescendant(node)
+
+	def matchesMeButNotAnyDescendant(self, node: ast.AST) -> bool:
+		"""Whether `predicate` is `True` for `node` but for no descendant of `node`, as `IfThis.matchesMeButNotAnyDescendant(predicate)`.
+
+		Returns
+		-------
+		matchesMeButNotAnyDescendant : bool
+			`True` if `predicate` is `True` for `node` and `False` for every descendant of `node`.
+		"""
+		hasMatchingDescendant: bool = self.hasMatchingDescendant(node)
+		return self._dictionaryNode2Matches[node] and not hasMatchingDescendant
+
+_dictionaryClass2ClassesIndexed: Final[dict[type[ast.AST], tuple[type[ast.AST], ...]]] = {}
+
+def _classesIndexed(classNode: type[ast.AST]) -> tuple[type[ast.AST], ...]:
+	try:
+		return _dictionaryClass2ClassesIndexed[classNode]
+	except KeyError:
+		return _dictionaryClass2ClassesIndexed.setdefault(classNode, tuple(classBase for classBase in classNode.__mro__ if issubclass(classBase, ast.AST)))
+
+class _IndexRebuiltAfterChange(ABC):
+	"""An index of the tree of `root` that `_build` makes, and rebuilds at the next query after `invalidate`."""
+
+	def __init__(self, root: ast.AST) -> None:
+		self.root: Final[ast.AST] = root
+		self.isStale: bool = True
+
+	@abstractmethod
+	def _build(self) -> None:
+		"""Build the index of the tree of `root`."""
+
+	def _rebuildIfStale(self) -> None:
+		if self.isStale:
+			self._build()
+			self.isStale = False
+
+	def invalidate(self, _node: ast.AST | None = None) -> None:
+		"""Mark the index as stale, so the next query rebuilds it. `_node` lets `invalidate` be a callback of `NodeChanger`."""
+		self.isStale = True
+
+	def watch[个: NodeChanger[Any, Any] | NodeChangerSuite](self, nodeChanger: 个) -> 个:
+		"""Call `invalidate` after each `visit` of `nodeChanger` that changes the tree.
+
+		Parameters
+		----------
+		nodeChanger : NodeChanger | NodeChangerSuite
+			The transformer to watch.
+
+		Returns
+		-------
+		nodeChanger : NodeChanger | NodeChangerSuite
+			The same `nodeChanger`.
+		"""
+		nodeChanger.listCallbacksChanged.append(self.invalidate)
+		return nodeChanger
+
+class NodeClassIndex(_IndexRebuiltAfterChange):
+	"""The nodes of each `ast` class, including abstract classes such as `ast.stmt` and `ast.expr`, in document order.
+
+	`NodeClassIndex` traverses the tree once, in the order of `NodeTourist`, and records the position
+	of each node under its class and under each base class of its class, up to `ast.AST`. Then
+	`nodesOf(ast.Return)` costs O(number of `ast.Return` nodes), and `iterMatches(findThis)` calls
+	`findThis` only on the nodes of the classes that `findThis` can match, which it learns as the
+	visitors do, from `metadataOfPredicate`.
+
+	The index is built when it is created, and it is rebuilt, at the next query, after `invalidate`.
+	`watch` connects the index to a `NodeChanger` or a `NodeChangerSuite`, which calls `invalidate`
+	after each `visit` that changed the tree.
+
+	As in `NodeTourist`, a node `object` that appears at more than one place in the tree, such as the
+	`ast.Load` instance that `ast.parse` shares, appears once for each place.
+
+	Parameters
+	----------
+	root : ast.AST
+		The root of the tree to index.
+
+	Examples
+	--------
+	```python
+		nodeClassIndex = NodeClassIndex(kitchenModule)
+		listReturns = nodeClassIndex.nodesOf(ast.Return)
+		listCallsBake = list(nodeClassIndex.iterMatches(IfThis.isCallIdentifier('bake')))
+		nodeClassIndex.watch(NodeChanger(Be.Pass, Then.removeIt)).visit(kitchenModule)
+		listStatements = nodeClassIndex.nodesOf(ast.stmt)  # Rebuilt, without the `ast.Pass` nodes.
+	```
+	"""
+
+	def __init__(self, root: ast.AST) -> None:
+		super().__init__(root)
+		self._listNodes: Final[list[ast.AST]] = []
+		self._dictionaryClass2Positions: Final[dict[type[ast.AST], list[int]]] = {}
+		self._rebuildIfStale()
+
+	def _build(self) -> None:
+		listNodes: list[ast.AST] = self._listNodes
+		dictionaryClass2Positions: dict[type[ast.AST], list[int]] = self._dictionaryClass2Positions
+		listNodes.clear()
+		dictionaryClass2Positions.clear()
+		stack: list[ast.AST] = [self.root]
+		while stack:
+			node: ast.AST = stack.pop()
+			position: int = len(listNodes)
+			listNodes.append(node)
+			for classIndexed in _classesIndexed(type(node)):
+				try:
+					dictionaryClass2Positions[classIndexed].append(position)
+				except KeyError:
+					dictionaryClass2Positions[classIndexed] = [position]
+			for fieldName in node._fields[::-1]:
+				value: object = getattr(node, fieldName, None)
+				if isinstance(value, ast.AST):
+					stack.append(value)
+				elif isinstance(value, list):
+					stack.extend(item for item in value[::-1] if isinstance(item, ast.AST))  # pyright: ignore[reportUnknownVariableType]
+
+	def __len__(self) -> int:
+		"""The number of places in the tree, including `root`.
+
+		Returns
+		-------
+		countPlaces : int
+			The number of places in the tree, including `root`.
+		"""
+		self._rebuildIfStale()
+		return len(self._listNodes)
+
+	def nodesOf(self, nodeTypes: type[ast.AST] | tuple[type[ast.AST], ...]) -> list[ast.AST]:
+		"""Return the nodes that are instances of `nodeTypes`, in document order.
+
+		Parameters
+		----------
+		nodeTypes : type[ast.AST] | tuple[type[ast.AST], ...]
+			One class, such as `ast.Return` or `ast.stmt`, or a `tuple` of classes.
+
+		Returns
+		-------
+		listNodes : list[ast.AST]
+			The nodes, in the order in which `NodeTourist` would visit them.
+		"""
+		self._rebuildIfStale()
+		listNodes: list[ast.AST] = self._listNodes
+		return [listNodes[position] for position in self._positionsOf(_normalizeNodeTypes(nodeTypes))]
+
+	def _positionsOf(self, nodeTypes: tuple[type[ast.AST], ...]) -> Iterator[int]:
+		# A class that is a subclass of another class in `nodeTypes` adds no nodes.
+		nodeTypesMinimal: list[type[ast.AST]] = [classNode for classNode in nodeTypes
+			if not any(classOther is not classNode and issubclass(classNode, classOther) for classOther in nodeTypes)]
+		listPositions: list[list[int]] = [self._dictionaryClass2Positions.get(classNode, []) for classNode in nodeTypesMinimal]
+		if len(listPositions) == 1:
+			return iter(listPositions[0])
+		return merge(*listPositions)
+
+	def iterMatches(self, findThis: Callable[[ast.AST], object]) -> Iterator[ast.AST]:
+		"""Yield, in document order, the nodes for which `findThis` is `True`, calling `findThis` only on the nodes of the classes it can match.
+
+		Parameters
+		----------
+		findThis : Callable[[ast.AST], object]
+			A predicate, such as `Be.Return` or `IfThis.isCallIdentifier('bake')`.
+
+		Yields
+		------
+		node : ast.AST
+			Each matching node.
+		"""
+		self._rebuildIfStale()
+		nodeTypes: tuple[type[ast.AST], ...] | None = metadataOfPredicate(findThis).nodeTypes
+		listNodes: list[ast.AST] = self._listNodes
+		if nodeTypes is None:
+			yield from (node for node in listNodes if findThis(node))
+			return
+		for position in self._positionsOf(nodeTypes):
+			node: ast.AST = listNodes[position]
+			if findThis(node):
+				yield node
+
+rolesIdentifier: Final[tuple[str, ...]] = ('arg', 'attribute', 'call', 'def', 'del', 'import', 'keyword', 'load', 'store')
+"""The roles of an identifier in `IdentifierIndex`."""
+
+def _rolesIdentifierOfNode(node: ast.AST) -> tuple[str, str] | None:
+	identifierRole: tuple[str, str] | None = None
+	if isinstance(node, ast.Name):
+		if isinstance(node.ctx, ast.Store):
+			identifierRole = (node.id, 'store')
+		elif isinstance(node.ctx, ast.Del):
+			identifierRole = (node.id, 'del')
+		else:
+			identifierRole = (node.id, 'load')
+	elif isinstance(node, ast.Attribute):
+		identifierRole = (node.attr, 'attribute')
+	elif isinstance(node, ast.Call):
+		if isinstance(node.func, ast.Name):
+			identifierRole = (node.func.id, 'call')
+	elif isinstance(node, ast.arg):
+		identifierRole = (node.arg, 'arg')
+	elif isinstance(node, ast.keyword):
+		if node.arg is not None:
+			identifierRole = (node.arg, 'keyword')
+	elif isinstance(node, (ast.AsyncFunctionDef, ast.ClassDef, ast.FunctionDef)):
+		identifierRole = (node.name, 'def')
+	elif isinstance(node, ast.alias):
+		# `import os.path` binds `os`.
+		identifier: str = node.asname or node.name.partition('.')[0]
+		if identifier != '*':
+			identifierRole = (identifier, 'import')
+	return identifierRole
+
+class IdentifierIndex(_IndexRebuiltAfterChange):
+	"""The nodes that bind or reference each identifier, by role, in document order.
+
+	`IdentifierIndex` traverses the tree once and records each node that has an identifier, under the
+	identifier and the role of the node:
+
+	- `'load'`, `'store'`, `'del'`: an `ast.Name`, by its `ctx`, as `IfThis.isNameIdentifier`.
+	- `'call'`: an `ast.Call` of an `ast.Name`, as `IfThis.isCallIdentifier`.
+	- `'attribute'`: an `ast.Attribute`, by `attr`, as `IfThis.isAttributeIdentifier` and the last part
+		of `IfThis.isAttributeNamespaceIdentifier`.
+	- `'arg'`: an `ast.arg`, as `IfThis.is_argIdentifier`.
+	- `'keyword'`: an `ast.keyword` with a name, as `IfThis.is_keywordIdentifier`.
+	- `'def'`: an `ast.FunctionDef`, `ast.AsyncFunctionDef`, or `ast.ClassDef`, as
+		`IfThis.isFunctionDefIdentifier` and `IfThis.isClassDefIdentifier`.
+	- `'import'`: an `ast.alias`, by the identifier that the import binds.
+
+	Then renaming, inlining, and finding unused parameters can go directly to the nodes of an
+	identifier instead of comparing the identifier of every node of the tree. Like `NodeClassIndex`,
+	an `IdentifierIndex` can `watch` a `NodeChanger`.
+
+	Parameters
+	----------
+	root : ast.AST
+		The root of the tree to index.
+
+	Examples
+	--------
+	```python
+		identifierIndex = IdentifierIndex(kitchenModule)
+		listCallsBake = identifierIndex.nodesOf('bake', 'call')
+		listReferences = identifierIndex.nodesOf('flour', ('load', 'store', 'del', 'arg'))
+		setIdentifiersLoaded = identifierIndex.identifiersOf('load')
+	```
+	"""
+
+	def __init__(self, root: ast.AST) -> None:
+		super().__init__(root)
+		self._listNodes: Final[list[ast.AST]] = []
+		self._dictionaryIdentifier2Role2Positions: Final[dict[str, dict[str, list[int]]]] = {}
+		self._rebuildIfStale()
+
+	def _build(self) -> None:
+		listNodes: list[ast.AST] = self._listNodes
+		dictionaryIdentifier2Role2Positions: dict[str, dict[str, list[int]]] = self._dictionaryIdentifier2Role2Positions
+		listNodes.clear()
+		dictionaryIdentifier2Role2Positions.clear()
+		stack: list[ast.AST] = [self.root]
+		while stack:
+			node: ast.AST = stack.pop()
+			identifierRole: tuple[str, str] | None = _rolesIdentifierOfNode(node)
+			if identifierRole is not None:
+				identifier, role = identifierRole
+				dictionaryIdentifier2Role2Positions.setdefault(identifier, {}).setdefault(role, []).append(len(listNodes))
+				listNodes.append(node)
+			for fieldName in node._fields[::-1]:
+				value: object = getattr(node, fieldName, None)
+				if isinstance(value, ast.AST):
+					stack.append(value)
+				elif isinstance(value, list):
+					stack.extend(item for item in value[::-1] if isinstance(item, ast.AST))  # pyright: ignore[reportUnknownVariableType]
+
+	def __contains__(self, identifier: object) -> bool:
+		"""Whether any node of the tree has `identifier`, in any role.
+
+		Returns
+		-------
+		hasIdentifier : bool
+			`True` if at least one node of the tree has `identifier`.
+		"""
+		self._rebuildIfStale()
+		return identifier in self._dictionaryIdentifier2Role2Positions
+
+	def nodesOf(self, identifier: str, roles: str | tuple[str, ...] | None = None) -> list[ast.AST]:
+		"""Return the nodes with `identifier` in one of `roles`, in document order.
+
+		If a role is not in `rolesIdentifier`, `nodesOf` raises `ValueError`.
+
+		Parameters
+		----------
+		identifier : str
+			The identifier, such as `'bake'`.
+		roles : str | tuple[str, ...] | None = None
+			A role, such as `'call'`, or a `tuple` of roles. If `None`, every role.
+
+		Returns
+		-------
+		listNodes : list[ast.AST]
+			The nodes, in the order in which `NodeTourist` would visit them.
+		"""
+		self._rebuildIfStale()
+		dictionaryRole2Positions: dict[str, list[int]] = self._dictionaryIdentifier2Role2Positions.get(identifier, {})
+		listPositions: list[list[int]] = [dictionaryRole2Positions.get(role, []) for role in _validateRoles(roles)]
+		listNodes: list[ast.AST] = self._listNodes
+		return [listNodes[position] for position in merge(*listPositions)]
+
+	def identifiersOf(self, roles: str | tuple[str, ...] | None = None) -> set[str]:
+		"""Return the identifiers that have at least one node in one of `roles`.
+
+		If a role is not in `rolesIdentifier`, `identifiersOf` raises `ValueError`.
+
+		Returns
+		-------
+		setIdentifiers : set[str]
+			The identifiers with at least one node in one of `roles`.
+		"""
+		self._rebuildIfStale()
+		tupleRoles: tuple[str, ...] = _validateRoles(roles)
+		return {identifier for identifier, dictionaryRole2Positions in self._dictionaryIdentifier2Role2Positions.items()
+			if any(role in dictionaryRole2Positions for role in tupleRoles)}
+
+def _validateRoles(roles: str | tuple[str, ...] | None) -> tuple[str, ...]:
+	if roles is None:
+		return rolesIdentifier
+	tupleRoles: tuple[str, ...] = (roles,) if isinstance(roles, str) else roles
+	for role in tupleRoles:
+		if role not in rolesIdentifier:
+			message: str = f"I received {role = }, but the roles of `IdentifierIndex` are {rolesIdentifier}."
+			raise ValueError(message)
+	return tupleRoles
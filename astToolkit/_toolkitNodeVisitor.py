@@ -28,17 +28,185 @@ optimization, refactoring, and generation workflows.
 Both classes support generic type parameters for type-safe node matching and result handling,
 integrating seamlessly with astToolkit's type system and atomic classes to create composable,
 maintainable AST manipulation code.
+
+Both classes only call `findThis` on nodes whose class can possibly match. The visitor learns the
+candidate classes from the `TypeIs[...]` (or `TypeGuard[...]`) `return` annotation of `findThis`,
+which every `Be.*` and `IfThis.*` predicate has, or from an explicit `nodeTypes` parameter. Every
+other node is traversed without calling `findThis`. If `findThis` has a callable `predicate`
+attribute, as a `Find` query and a `CodeTemplate` do, the visitor calls `predicate` directly.
+
+Neither class recurses through Python frames: `walkPreOrder` and `walkPostOrder` traverse with an
+explicit stack, so the depth of a tree, such as a long `Make.Add.join(...)` chain, is not limited by
+`sys.getrecursionlimit()`. The order in which nodes are matched and the results of transformations
+are identical to the order and results of `ast.NodeVisitor` and `ast.NodeTransformer`.
+
+`NodeTouristSuite` and `NodeChangerSuite` fuse many `NodeTourist` or `NodeChanger` rules into one
+traversal, dispatching each node to only the rules that can match its class.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterable
-from typing import overload, TYPE_CHECKING
+from astToolkit._toolkitPredicateMetadata import _normalizeNodeTypes, metadataOfPredicate
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import cast, overload, TYPE_CHECKING, TypeGuard, TypeIs
 import ast
 
 if TYPE_CHECKING:
 	from collections.abc import Callable
-	from typing import Final, TypeGuard, TypeIs
+	from typing import Any, Final
+
+dictionaryNodeTypes2Dispatch: dict[tuple[type[ast.AST], ...], dict[type[ast.AST], bool]] = {}
+"""Per-class dispatch tables shared by every visitor with the same `nodeTypes`: each table maps a concrete node class to whether
+`findThis` could possibly match it."""
+
+def _getDispatchTable(nodeTypes: tuple[type[ast.AST], ...]) -> dict[type[ast.AST], bool]:
+	return dictionaryNodeTypes2Dispatch.setdefault(nodeTypes, {})
+
+def _isCandidate(dispatchTable: dict[type[ast.AST], bool], nodeTypes: tuple[type[ast.AST], ...], node: ast.AST) -> bool:
+	classNode: type[ast.AST] = type(node)
+	try:
+		return dispatchTable[classNode]
+	except KeyError:
+		return dispatchTable.setdefault(classNode, issubclass(classNode, nodeTypes))
+
+def nodeTypesOfPredicate(findThis: Callable[..., object]) -> tuple[type[ast.AST], ...] | None:
+	"""Identify the `ast.AST` classes for which `findThis` can possibly return `True`.
+
+	`nodeTypesOfPredicate` reads the `return` annotation of `findThis`. If the annotation is
+	`TypeIs[ast.X]`, `TypeGuard[ast.X]`, or either with a union of `ast.AST` subclasses, the
+	predicate cannot match a node that is not an instance of one of those classes. All `Be.*`
+	methods, including attribute predicates such as `Be.Assign.valueIs(...)`, and the `IfThis.*`
+	predicates have such an annotation. For `IfThis.isAllOf(...)` and `IfThis.isAnyOf(...)`, whose
+	annotation uses a `TypeVar`, the classes are the intersection, or the union, of the classes of
+	the predicates they combine. See `metadataOfPredicate`.
+
+	Parameters
+	----------
+	findThis : Callable[..., object]
+		A predicate, such as a `Be.*` method or a predicate returned by `IfThis.*`.
+
+	Returns
+	-------
+	nodeTypes : tuple[type[ast.AST], ...] | None
+		The candidate classes, or `None` if the annotation is missing, is `bool`, uses a `TypeVar`, or
+		otherwise cannot be resolved. `None` means "any node could match".
+	"""
+	return metadataOfPredicate(findThis).nodeTypes
+
+def _resolveNodeTypes(findThis: Callable[..., object], nodeTypes: type[ast.AST] | Iterable[type[ast.AST]] | None) -> tuple[type[ast.AST], ...] | None:
+	if nodeTypes is not None:
+		return _normalizeNodeTypes(nodeTypes)
+	return nodeTypesOfPredicate(findThis)
+
+def _resolveFindThis(findThis: Callable[[ast.AST], bool]) -> Callable[[ast.AST], bool]:
+	# A `Find` query and a `CodeTemplate` wrap a compiled function in `predicate`; the visitor calls the function directly.
+	predicate: object = getattr(findThis, 'predicate', None)
+	if callable(predicate):
+		return predicate  # pyright: ignore[reportReturnType]
+	return findThis
+
+class StopTraversal(Exception):
+	"""Raise `StopTraversal` from an action to end the traversal of `NodeTourist` immediately.
+
+	`NodeTourist` catches `StopTraversal`, so `visit`, `captureLastMatch`, `captureFirstMatch`, and
+	`captureMatches` return normally and no other node is visited. The action that raises
+	`StopTraversal` does not `return`, so its node is not captured. `Then.stopTraversal` raises
+	`StopTraversal` and can be the last action in `Grab.andDoAllOf`.
+	"""
+
+def _childNodesReversed(node: ast.AST) -> list[ast.AST]:
+	listChildNodes: list[ast.AST] = []
+	for fieldName in node._fields[::-1]:
+		value = getattr(node, fieldName, None)
+		if isinstance(value, ast.AST):
+			listChildNodes.append(value)
+		elif isinstance(value, list):
+			# A `for` loop, not `extend(...)` of a generator, which allocates a generator for each `list` field.
+			for item in value[::-1]:  # pyright: ignore[reportUnknownVariableType]
+				if isinstance(item, ast.AST):
+					listChildNodes.append(item)  # noqa: PERF401
+	return listChildNodes
+
+def walkPreOrder(node: ast.AST, pruneIf: Callable[[ast.AST], bool] | None = None, maxDepth: int | None = None) -> Iterator[ast.AST]:
+	"""Yield `node` and every descendant of `node`, each parent before its children.
+
+	The order is the order of `ast.NodeVisitor`: depth first, with the children of a node in the
+	order of `ast.iter_child_nodes`. Unlike `ast.walk`, which is breadth first, and unlike
+	`ast.NodeVisitor`, which recurses, `walkPreOrder` uses an explicit stack. The children of a node
+	are read after the consumer has received the node, so the consumer may modify the node before
+	`walkPreOrder` descends into it.
+
+	Parameters
+	----------
+	node : ast.AST
+		The root of the traversal.
+	pruneIf : Callable[[ast.AST], bool] | None = None
+		If `pruneIf(descendant)` is `True`, `walkPreOrder` yields `descendant` but not its descendants.
+		`pruneIf` is not applied to `node`, so `walkPreOrder(functionDef, pruneIf=Be.FunctionDef)`
+		yields the body of `functionDef` but not the bodies of functions nested in it.
+	maxDepth : int | None = None
+		Do not yield a descendant deeper than `maxDepth`. The depth of `node` is 0 and the depth of its
+		children is 1.
+
+	Yields
+	------
+	descendant : ast.AST
+		`node`, then each descendant of `node` in pre-order.
+	"""
+	if pruneIf is not None or maxDepth is not None:
+		yield from _walkPreOrderPruned(node, pruneIf, maxDepth)
+		return
+	stack: list[ast.AST] = [node]
+	push = stack.append
+	while stack:
+		node = stack.pop()
+		yield node
+		for fieldName in node._fields[::-1]:
+			value = getattr(node, fieldName, None)
+			if isinstance(value, ast.AST):
+				push(value)
+			elif isinstance(value, list):
+				for item in value[::-1]:  # pyright: ignore[reportUnknownVariableType]
+					if isinstance(item, ast.AST):
+						push(item)
+
+def _walkPreOrderPruned(node: ast.AST, pruneIf: Callable[[ast.AST], bool] | None, maxDepth: int | None) -> Iterator[ast.AST]:
+	if maxDepth is not None and maxDepth < 0:
+		return
+	stack: list[tuple[ast.AST, int]] = [(node, 0)]
+	while stack:
+		descendant, depth = stack.pop()
+		yield descendant
+		if maxDepth is not None and depth >= maxDepth:
+			continue
+		if pruneIf is not None and descendant is not node and pruneIf(descendant):
+			continue
+		stack.extend((child, depth + 1) for child in _childNodesReversed(descendant))
+
+def walkPostOrder(node: ast.AST) -> Iterator[ast.AST]:
+	"""Yield every descendant of `node`, and then `node`, each child before its parent.
+
+	`walkPostOrder` uses an explicit stack, so it is not limited by `sys.getrecursionlimit()`.
+
+	Parameters
+	----------
+	node : ast.AST
+		The root of the traversal.
+
+	Yields
+	------
+	descendant : ast.AST
+		Each descendant of `node` in post-order, then `node`.
+	"""
+	stack: list[tuple[ast.AST, bool]] = [(node, False)]
+	while stack:
+		node, childrenVisited = stack.pop()
+		if childrenVisited:
+			yield node
+		else:
+			stack.append((node, True))
+			stack.extend((child, False) for child in _childNodesReversed(node))
 
 class NodeTourist[木: ast.AST, 归个](ast.NodeVisitor):
 	"""Read-only AST visitor that extracts information from nodes matching predicate conditions.
@@ -63,6 +231,17 @@ class NodeTourist[木: ast.AST, 归个](ast.NodeVisitor):
 	doThat : Callable[[木], 归个]
 		Action function that operates on nodes matching the predicate. Receives the matched node with
 		properly narrowed typing and returns the extracted information.
+	nodeTypes : type[ast.AST] | Iterable[type[ast.AST]] | None = None
+		The node classes that `findThis` can possibly match. `NodeTourist` never calls `findThis` on
+		a node that is not an instance of one of `nodeTypes`. If `None`, `NodeTourist` uses
+		`nodeTypesOfPredicate(findThis)`; if that is also `None`, `findThis` is called on every node.
+	pruneIf : Callable[[ast.AST], bool] | None = None
+		If `pruneIf(descendant)` is `True`, `NodeTourist` tests `descendant` with `findThis` but does not
+		descend into it, for example, `pruneIf=Be.FunctionDef` to skip the bodies of nested functions.
+		`pruneIf` is not applied to the node passed to `visit`.
+	maxDepth : int | None = None
+		`NodeTourist` does not visit a descendant deeper than `maxDepth`. The node passed to `visit` has
+		depth 0 and its children have depth 1.
 
 	Examples
 	--------
@@ -79,21 +258,29 @@ class NodeTourist[木: ast.AST, 归个](ast.NodeVisitor):
 		specificRecipe = NodeTourist(IfThis.isFunctionDefIdentifier("bakeBread"), Then.extractIt)
 		foundRecipe = specificRecipe.captureLastMatch(kitchenModule)
 	```
+
+	Find the module-level assignments without visiting the bodies of functions and classes:
+	```python
+		topLevelAssignments = NodeTourist(Be.Assign, Then.extractIt, pruneIf=IfThis.isAnyOf(Be.FunctionDef, Be.ClassDef, Be.Lambda))
+		listAssign = topLevelAssignments.captureMatches(kitchenModule)
+	```
 	"""
 
 	@overload
-	def __init__(self, findThis: Callable[[ast.AST], TypeIs[木]], doThat: Callable[[木], 归个]) -> None: ...
+	def __init__(self, findThis: Callable[[ast.AST], TypeIs[木]], doThat: Callable[[木], 归个], *, nodeTypes: type[ast.AST] | Iterable[type[ast.AST]] | None = None, pruneIf: Callable[[ast.AST], bool] | None = None, maxDepth: int | None = None) -> None: ...
 	@overload
-	def __init__(self, findThis: Callable[[ast.AST], TypeGuard[木]], doThat: Callable[[木], 归个]) -> None: ...
+	def __init__(self, findThis: Callable[[ast.AST], TypeGuard[木]], doThat: Callable[[木], 归个], *, nodeTypes: type[ast.AST] | Iterable[type[ast.AST]] | None = None, pruneIf: Callable[[ast.AST], bool] | None = None, maxDepth: int | None = None) -> None: ...
 	@overload
-	def __init__(self: NodeTourist[ast.AST, 归个], findThis: Callable[[ast.AST], bool], doThat: Callable[[ast.AST], 归个]) -> None: ...
-	def __init__(self, findThis: Callable[[ast.AST], bool], doThat: Callable[[木], 归个]) -> None:
-		self.findThis: Final[Callable[[ast.AST], bool]] = findThis
+	def __init__(self: NodeTourist[ast.AST, 归个], findThis: Callable[[ast.AST], bool], doThat: Callable[[ast.AST], 归个], *, nodeTypes: type[ast.AST] | Iterable[type[ast.AST]] | None = None, pruneIf: Callable[[ast.AST], bool] | None = None, maxDepth: int | None = None) -> None: ...
+	def __init__(self, findThis: Callable[[ast.AST], bool], doThat: Callable[[木], 归个], *, nodeTypes: type[ast.AST] | Iterable[type[ast.AST]] | None = None, pruneIf: Callable[[ast.AST], bool] | None = None, maxDepth: int | None = None) -> None:
+		self.findThis: Callable[[ast.AST], bool] = _resolveFindThis(findThis)
 		self.doThat: Callable[[木], 归个] = doThat
 		self.nodeCaptured: 归个 | None = None
-
-	def _matches(self, node: ast.AST) -> TypeGuard[木]:
-		return self.findThis(node)
+		self.nodeTypes: Final[tuple[type[ast.AST], ...] | None] = _resolveNodeTypes(findThis, nodeTypes)
+		self._nodeTypesDispatch: Final[tuple[type[ast.AST], ...]] = self.nodeTypes or (ast.AST,)
+		self._dispatchTable: Final[dict[type[ast.AST], bool]] = _getDispatchTable(self._nodeTypesDispatch)
+		self.pruneIf: Final[Callable[[ast.AST], bool] | None] = pruneIf
+		self.maxDepth: Final[int | None] = maxDepth
 
 	def visit(self, node: ast.AST) -> None:
 		"""Apply predicate and action functions during AST traversal.
@@ -106,18 +293,93 @@ class NodeTourist[木: ast.AST, 归个](ast.NodeVisitor):
 		`True`, the action function (`doThat`) is applied to the node and the result is captured in
 		`nodeCaptured`.
 
-		The method continues standard AST traversal by calling `generic_visit` to ensure all child
-		nodes are processed recursively. This preserves the complete tree traversal behavior while
-		adding the predicate- action functionality.
+		The method exhausts `iterMatches`, which traverses with `walkPreOrder`, so every descendant is
+		processed in the same order as `ast.NodeVisitor`, but without recursion. If `doThat` raises
+		`StopTraversal`, the traversal ends.
 
 		Parameters
 		----------
 		node : ast.AST
 			AST node to test and potentially process during traversal.
 		"""
-		if self._matches(node):
-			self.nodeCaptured = self.doThat(node)
-		self.generic_visit(node)
+		for _result in self.iterMatches(node):
+			pass
+
+	def captureFirstMatch(self, node: ast.AST) -> 归个 | None:
+		"""Return the result from the first matching node and stop the traversal.
+
+		Use `captureFirstMatch` instead of `captureLastMatch` when you expect one match or want the
+		first match: the traversal ends as soon as `doThat` returns, so looking up one function in a
+		large module does not visit the rest of the module.
+
+		Parameters
+		----------
+		node : ast.AST
+			Root AST node to begin traversal from.
+
+		Returns
+		-------
+		firstResult : 归个 | None
+			Result from the action function applied to the first matching node in pre-order, or `None`
+			if no node matched.
+		"""
+		self.nodeCaptured = None
+		listCaptured: list[归个] = self.captureMatches(node, limit=1)
+		return listCaptured[0] if listCaptured else None
+
+	def captureMatches(self, node: ast.AST, limit: int | None = None) -> list[归个]:
+		"""Return the results from the matching nodes, stopping after `limit` matches.
+
+		Parameters
+		----------
+		node : ast.AST
+			Root AST node to begin traversal from.
+		limit : int | None = None
+			The maximum number of matches. The traversal ends as soon as `doThat` has returned `limit`
+			times. If `None`, every node is visited unless `doThat` raises `StopTraversal`.
+
+		Returns
+		-------
+		listResults : list[归个]
+			Result from the action function applied to each matching node, in pre-order. `nodeCaptured`
+			is set to the last result.
+		"""
+		if limit is not None and limit < 1:
+			return []
+		return list(islice(self.iterMatches(node), limit))
+
+	def iterMatches(self, node: ast.AST) -> Iterator[归个]:
+		"""Yield the result of `doThat` for each matching node, lazily, in pre-order.
+
+		The traversal advances only when the consumer asks for the next result, so a consumer can stream
+		the results, stop early, for example, with `itertools.islice` or `next`, or chain the results into
+		a pipeline without holding every result in memory. `nodeCaptured` is set to each result before
+		it is yielded. If `doThat` raises `StopTraversal`, the generator ends.
+
+		As with `walkPreOrder`, the children of a node are read after its result is yielded, so the
+		traversal sees a change that the consumer makes to the matched node.
+
+		Parameters
+		----------
+		node : ast.AST
+			Root AST node to begin traversal from.
+
+		Yields
+		------
+		result : 归个
+			Result from the action function applied to a matching node.
+		"""
+		dispatchTable: dict[type[ast.AST], bool] = self._dispatchTable
+		try:
+			for descendant in walkPreOrder(node, self.pruneIf, self.maxDepth):
+				if (isCandidate := dispatchTable.get(type(descendant))) is None:
+					isCandidate = _isCandidate(dispatchTable, self._nodeTypesDispatch, descendant)
+				if isCandidate and self.findThis(descendant):
+					# `findThis` narrows `descendant` to `木`.
+					self.nodeCaptured = self.doThat(cast('木', descendant))
+					yield self.nodeCaptured
+		except StopTraversal:
+			return
 
 	def captureLastMatch(self, node: ast.AST) -> 归个 | None:
 		"""Visit an AST tree and return the result from the last matching node.
@@ -149,6 +411,93 @@ class NodeTourist[木: ast.AST, 归个](ast.NodeVisitor):
 		self.visit(node)
 		return self.nodeCaptured
 
+class _FrameNodeChanger:
+	__slots__ = ('depth', 'iteratorFields', 'iteratorList', 'listNewValues', 'listOldValues', 'node')
+
+	def __init__(self, node: ast.AST, depth: int = 0) -> None:
+		self.node: ast.AST = node
+		self.depth: int = depth
+		self.iteratorFields: Iterator[tuple[str, object]] = ast.iter_fields(node)
+		self.iteratorList: Iterator[tuple[int, object]] | None = None
+		self.listOldValues: list[object] = []
+		# `None` until an item of `listOldValues` is replaced, so a `list` without a replacement is neither copied nor rebuilt.
+		self.listNewValues: list[object] | None = None
+
+_noMatch: Final[object] = object()
+"""Returned by the `_consequence` method of a transformer when no rule matches the node, because `None` is a valid consequence."""
+
+def _changeDescendants(node: ast.AST, consequenceOf: Callable[[ast.AST], object], pruneIf: Callable[[ast.AST], bool] | None = None, maxDepth: int | None = None) -> ast.AST:
+	"""Replace, in place, each descendant of `node` with `consequenceOf(descendant)`, in the manner of `ast.NodeTransformer.generic_visit`.
+
+	If `consequenceOf` returns `_noMatch`, the descendant is kept and, unless `pruneIf(descendant)` is `True` or its children
+	would be deeper than `maxDepth`, its children are visited. A field is assigned, or a `list` field is rebuilt, only if a
+	consequence is not the descendant itself.
+
+	Returns
+	-------
+	node : ast.AST
+		`node`, with its descendants replaced.
+	"""
+	if maxDepth is not None and maxDepth < 1:
+		return node
+	# Each frame is a node whose fields are being visited and, if the current field is a `list`, the state of that `list`.
+	stack: list[_FrameNodeChanger] = [_FrameNodeChanger(node)]
+	while stack:
+		frame: _FrameNodeChanger = stack[-1]
+		descend: bool = maxDepth is None or frame.depth + 1 < maxDepth
+		if frame.iteratorList is not None:
+			for index, item in frame.iteratorList:
+				if not isinstance(item, ast.AST):
+					if frame.listNewValues is not None:
+						frame.listNewValues.append(item)
+					continue
+				consequence: object = consequenceOf(item)
+				if consequence is _noMatch or consequence is item:
+					if frame.listNewValues is not None:
+						frame.listNewValues.append(item)
+					if consequence is _noMatch and descend and (pruneIf is None or not pruneIf(item)):
+						stack.append(_FrameNodeChanger(item, frame.depth + 1))
+						break
+					continue
+				if frame.listNewValues is None:
+					frame.listNewValues = frame.listOldValues[0:index]
+				if consequence is None:
+					continue
+				if isinstance(consequence, ast.AST):
+					frame.listNewValues.append(consequence)
+				else:
+					frame.listNewValues.extend(consequence)  # pyright: ignore[reportArgumentType]
+			else:
+				if frame.listNewValues is not None:
+					frame.listOldValues[:] = frame.listNewValues
+				frame.iteratorList = None
+			continue
+
+		for fieldName, valueOld in frame.iteratorFields:
+			if isinstance(valueOld, list):
+				frame.listOldValues = valueOld  # pyright: ignore[reportUnknownMemberType]
+				frame.listNewValues = None
+				frame.iteratorList = enumerate(valueOld)  # pyright: ignore[reportUnknownArgumentType]
+				break
+			if isinstance(valueOld, ast.AST):
+				consequence = consequenceOf(valueOld)
+				if consequence is _noMatch:
+					if descend and (pruneIf is None or not pruneIf(valueOld)):
+						stack.append(_FrameNodeChanger(valueOld, frame.depth + 1))
+						break
+					continue
+				if consequence is None:
+					delattr(frame.node, fieldName)
+				elif consequence is not valueOld:
+					setattr(frame.node, fieldName, consequence)
+		else:
+			stack.pop()
+	return node
+
+def _callCallbacksChanged(listCallbacksChanged: list[Callable[[ast.AST], object]], node: ast.AST) -> None:
+	for callbackChanged in listCallbacksChanged:
+		callbackChanged(node)
+
 class NodeChanger[木: ast.AST, 归木: ast.AST | Iterable[ast.AST] | None](ast.NodeTransformer):
 	"""Destructive AST transformer that selectively modifies nodes matching predicate conditions.
 
@@ -178,6 +527,29 @@ class NodeChanger[木: ast.AST, 归木: ast.AST | Iterable[ast.AST] | None](ast.
 		Action function that performs the actual transformation. Receives nodes that matched the
 		predicate and returns the replacement node, modified node, or `None` for deletion. The return
 		value becomes the new node in the transformed tree.
+	nodeTypes : type[ast.AST] | Iterable[type[ast.AST]] | None = None
+		The node classes that `findThis` can possibly match. `NodeChanger` never calls `findThis` on
+		a node that is not an instance of one of `nodeTypes`. If `None`, `NodeChanger` uses
+		`nodeTypesOfPredicate(findThis)`; if that is also `None`, `findThis` is called on every node.
+	pruneIf : Callable[[ast.AST], bool] | None = None
+		If `pruneIf(descendant)` is `True`, `NodeChanger` tests `descendant` with `findThis` but does not
+		descend into it, for example, `pruneIf=Be.FunctionDef` to skip the bodies of nested functions.
+		`pruneIf` is not applied to the node passed to `visit`.
+	maxDepth : int | None = None
+		`NodeChanger` does not visit a descendant deeper than `maxDepth`. The node passed to `visit` has
+		depth 0 and its children have depth 1.
+
+	Attributes
+	----------
+	countReplacements : int
+		The number of nodes to which the last `visit` applied `doThat`, including nodes that `doThat`
+		modified and returned.
+	changed : bool
+		Whether `countReplacements` is greater than 0.
+	listCallbacksChanged : list[Callable[[ast.AST], object]]
+		After a `visit` that changed the tree, `NodeChanger` calls each callable with the node passed to
+		`visit`. An index of the tree, such as `NodeClassIndex`, appends a callable to know that it is
+		stale.
 
 	Examples
 	--------
@@ -198,17 +570,35 @@ class NodeChanger[木: ast.AST, 归木: ast.AST | Iterable[ast.AST] | None](ast.
 	"""
 
 	@overload
-	def __init__(self, findThis: Callable[[ast.AST], TypeIs[木]], doThat: Callable[[木], 归木]) -> None: ...
+	def __init__(self, findThis: Callable[[ast.AST], TypeIs[木]], doThat: Callable[[木], 归木], *, nodeTypes: type[ast.AST] | Iterable[type[ast.AST]] | None = None, pruneIf: Callable[[ast.AST], bool] | None = None, maxDepth: int | None = None) -> None: ...
 	@overload
-	def __init__(self, findThis: Callable[[ast.AST], TypeGuard[木]], doThat: Callable[[木], 归木]) -> None: ...
+	def __init__(self, findThis: Callable[[ast.AST], TypeGuard[木]], doThat: Callable[[木], 归木], *, nodeTypes: type[ast.AST] | Iterable[type[ast.AST]] | None = None, pruneIf: Callable[[ast.AST], bool] | None = None, maxDepth: int | None = None) -> None: ...
 	@overload
-	def __init__(self: NodeChanger[ast.AST, 归木], findThis: Callable[[ast.AST], bool], doThat: Callable[[ast.AST], 归木]) -> None: ...
-	def __init__(self, findThis: Callable[[ast.AST], bool], doThat: Callable[[木], 归木]) -> None:
-		self.findThis: Final[Callable[[ast.AST], bool]] = findThis
+	def __init__(self: NodeChanger[ast.AST, 归木], findThis: Callable[[ast.AST], bool], doThat: Callable[[ast.AST], 归木], *, nodeTypes: type[ast.AST] | Iterable[type[ast.AST]] | None = None, pruneIf: Callable[[ast.AST], bool] | None = None, maxDepth: int | None = None) -> None: ...
+	def __init__(self, findThis: Callable[[ast.AST], bool], doThat: Callable[[木], 归木], *, nodeTypes: type[ast.AST] | Iterable[type[ast.AST]] | None = None, pruneIf: Callable[[ast.AST], bool] | None = None, maxDepth: int | None = None) -> None:
+		self.findThis: Callable[[ast.AST], bool] = _resolveFindThis(findThis)
 		self.doThat: Callable[[木], 归木] = doThat
-
-	def _matches(self, node: ast.AST) -> TypeGuard[木]:
-		return self.findThis(node)
+		self.nodeTypes: Final[tuple[type[ast.AST], ...] | None] = _resolveNodeTypes(findThis, nodeTypes)
+		self._nodeTypesDispatch: Final[tuple[type[ast.AST], ...]] = self.nodeTypes or (ast.AST,)
+		self._dispatchTable: Final[dict[type[ast.AST], bool]] = _getDispatchTable(self._nodeTypesDispatch)
+		self.pruneIf: Final[Callable[[ast.AST], bool] | None] = pruneIf
+		self.maxDepth: Final[int | None] = maxDepth
+		self.countReplacements: int = 0
+		self.listCallbacksChanged: Final[list[Callable[[ast.AST], object]]] = []
+
+	@property
+	def changed(self) -> bool:
+		"""Whether the last `visit` applied `doThat` to at least one node."""
+		return self.countReplacements > 0
+
+	def _consequence(self, node: ast.AST) -> 归木 | object:
+		isCandidate: bool | None = self._dispatchTable.get(type(node))
+		if isCandidate is None:
+			isCandidate = _isCandidate(self._dispatchTable, self._nodeTypesDispatch, node)
+		if isCandidate and self.findThis(node):
+			self.countReplacements += 1
+			return self.doThat(node)  # pyright: ignore[reportArgumentType]
+		return _noMatch
 
 	def visit(self, node: ast.AST) -> 归木 | ast.AST:
 		"""Apply predicate and action functions during AST transformation.
@@ -223,9 +613,14 @@ class NodeChanger[木: ast.AST, 归木: ast.AST | Iterable[ast.AST] | None](ast.
 		perform the transformation. The action function may return a replacement node, a modified
 		version of the original node, or `None` to delete the node from the tree.
 
-		If the predicate returns `False`, the method delegates to the parent `visit` method to
-		continue standard transformation traversal, ensuring all child nodes are processed
-		recursively.
+		If the predicate returns `False`, the method continues into the children of the node with an
+		explicit stack instead of recursion. The children are visited in the same order, and the
+		fields of each node are rebuilt in the same way, as `ast.NodeTransformer.generic_visit`, but
+		a `list` field, such as `body`, is rebuilt only if at least one of its items was replaced.
+
+		`visit` counts the nodes to which it applies `doThat` in `countReplacements`, so `changed` is
+		`False` if `visit` did not change the tree. If `changed` is `True`, `visit` then calls each
+		callable in `listCallbacksChanged` with `node`.
 
 		Parameters
 		----------
@@ -238,6 +633,222 @@ class NodeChanger[木: ast.AST, 归木: ast.AST | Iterable[ast.AST] | None](ast.
 			The result of applying the action function if the predicate matches, otherwise the result
 			of standard transformation traversal. Returns `None` if the node should be deleted.
 		"""
-		if self._matches(node):
-			return self.doThat(node)
-		return super().visit(node)
+		self.countReplacements = 0
+		consequence: object = self._consequence(node)
+		if consequence is _noMatch:
+			consequence = _changeDescendants(node, self._consequence, self.pruneIf, self.maxDepth)
+		if self.countReplacements:
+			_callCallbacksChanged(self.listCallbacksChanged, node)
+		return consequence  # pyright: ignore[reportReturnType]
+
+class NodeTouristSuite(ast.NodeVisitor):
+	"""Apply many read-only antecedent-action rules to an AST in one traversal.
+
+	Each rule is a `NodeTourist` or a `(findThis, doThat)` pair, which `NodeTouristSuite` converts to a
+	`NodeTourist`. `visit` walks the tree once, and at each node, it applies, in the order of
+	`listRules`, each rule that can match the class of the node. `NodeTouristSuite` groups the rules by
+	node class, as `NodeTourist` does with `nodeTypes`, so a rule for `ast.FunctionDef` costs nothing
+	at an `ast.Name`, and the fused pass costs about as much as one `NodeTourist` pass.
+
+	Each rule matches the same nodes, in the same order, and sets its own `nodeCaptured`, as if the
+	rule were a separate `NodeTourist` visiting the tree. If `doThat` of a rule raises `StopTraversal`,
+	only that rule stops; the traversal ends when every rule has stopped. Only the order *between*
+	rules differs: rule 2 sees the first node before rule 1 sees the last node, so an action that
+	depends on the side effects of another rule's action should run in a separate pass.
+
+	Parameters
+	----------
+	listRules : Iterable[NodeTourist[Any, Any] | tuple[Callable[[ast.AST], bool], Callable[[Any], Any]]]
+		The ordered rules. A rule must not have `pruneIf` or `maxDepth`.
+
+	Examples
+	--------
+	Collect the functions, the calls, and the returns of a module in one pass:
+	```python
+		listFunctionDef, listCall, listReturn = [], [], []
+		NodeTouristSuite([
+			(Be.FunctionDef, Then.appendTo(listFunctionDef)),
+			(Be.Call, Then.appendTo(listCall)),
+			(Be.Return, Then.appendTo(listReturn)),
+		]).visit(kitchenModule)
+	```
+	"""
+
+	def __init__(self, listRules: Iterable[NodeTourist[Any, Any] | tuple[Callable[[ast.AST], bool], Callable[[Any], Any]]]) -> None:
+		self.listRules: Final[list[NodeTourist[Any, Any]]] = [rule if isinstance(rule, NodeTourist) else NodeTourist(*rule) for rule in listRules]
+		for rule in self.listRules:
+			if rule.pruneIf is not None or rule.maxDepth is not None:
+				message: str = f"I received a rule with `pruneIf` or `maxDepth`, but `NodeTouristSuite` applies every rule to the same nodes. Use a separate `NodeTourist` for {rule = }."
+				raise ValueError(message)
+		self._dispatchTable: Final[dict[type[ast.AST], tuple[NodeTourist[Any, Any], ...]]] = {}
+
+	def visit(self, node: ast.AST) -> None:
+		"""Apply every rule to `node` and each descendant of `node` in one pre-order traversal.
+
+		Parameters
+		----------
+		node : ast.AST
+			Root AST node to begin traversal from.
+		"""
+		listRulesActive: list[NodeTourist[Any, Any]] = list(self.listRules)
+		dispatchTable: dict[type[ast.AST], tuple[NodeTourist[Any, Any], ...]] = self._dispatchTable
+		for descendant in walkPreOrder(node):
+			classNode: type[ast.AST] = type(descendant)
+			rulesCandidate: tuple[NodeTourist[Any, Any], ...] | None = dispatchTable.get(classNode)
+			if rulesCandidate is None:
+				rulesCandidate = dispatchTable[classNode] = tuple(rule for rule in listRulesActive if issubclass(classNode, rule._nodeTypesDispatch))  # noqa: SLF001
+			for rule in rulesCandidate:
+				if rule.findThis(descendant):
+					try:
+						rule.nodeCaptured = rule.doThat(descendant)
+					except StopTraversal:
+						listRulesActive.remove(rule)
+						if not listRulesActive:
+							return
+						# The shared table includes the stopped rule, so this traversal builds its own table.
+						dispatchTable = {}
+
+	def captureLastMatches(self, node: ast.AST) -> list[Any]:
+		"""Visit an AST tree and return, for each rule, the result from the last node the rule matched.
+
+		Parameters
+		----------
+		node : ast.AST
+			Root AST node to begin traversal from.
+
+		Returns
+		-------
+		listLastResults : list[Any]
+			In the order of `listRules`, the `nodeCaptured` of each rule, which is `None` if the rule did
+			not match any node.
+		"""
+		for rule in self.listRules:
+			rule.nodeCaptured = None
+		self.visit(node)
+		return [rule.nodeCaptured for rule in self.listRules]
+
+class NodeChangerSuite(ast.NodeTransformer):
+	"""Apply many antecedent-action transformation rules to an AST in one traversal.
+
+	Each rule is a `NodeChanger` or a `(findThis, doThat)` pair, which `NodeChangerSuite` converts to a
+	`NodeChanger`. The result is the result of applying each rule, in the order of `listRules`, as a
+	separate `NodeChanger` pass, but `NodeChangerSuite` walks the tree once:
+
+	- At each node, the rules that can match the class of the node, as `NodeChanger` learns from
+		`nodeTypes`, are tested in order.
+	- If no rule matches, the traversal continues into the children of the node with every rule.
+	- If rule k matches, the rules before rule k are first applied to the children of the node, which
+		those rules would have visited in their own passes. Then `doThat` of rule k replaces the node,
+		and the rules after rule k are applied to the whole replacement, which rule k does not descend
+		into.
+
+	The one difference from separate passes: `findThis` of a later rule is tested on a node before
+	the earlier rules change the descendants of the node. If `findThis` of a later rule inspects
+	descendants that an earlier rule changes, for example, `Be.Return.valueIs(Be.Name)` after a rule
+	that replaces `ast.Name`, use separate `NodeChanger` passes.
+
+	Parameters
+	----------
+	listRules : Iterable[NodeChanger[Any, Any] | tuple[Callable[[ast.AST], bool], Callable[[Any], Any]]]
+		The ordered rules. A rule must not have `pruneIf` or `maxDepth`.
+
+	Examples
+	--------
+	Rename a variable and remove the `pass` statements in one pass:
+	```python
+		NodeChangerSuite([
+			(IfThis.isNameIdentifier("flour"), Grab.idAttribute(Then.replaceWith("rye"))),
+			(Be.Pass, Then.removeIt),
+		]).visit(kitchenModule)
+	```
+	"""
+
+	def __init__(self, listRules: Iterable[NodeChanger[Any, Any] | tuple[Callable[[ast.AST], bool], Callable[[Any], Any]]]) -> None:
+		self.listRules: Final[list[NodeChanger[Any, Any]]] = [rule if isinstance(rule, NodeChanger) else NodeChanger(*rule) for rule in listRules]
+		for rule in self.listRules:
+			if rule.pruneIf is not None or rule.maxDepth is not None:
+				message: str = f"I received a rule with `pruneIf` or `maxDepth`, but `NodeChangerSuite` applies every rule to the same nodes. Use a separate `NodeChanger` for {rule = }."
+				raise ValueError(message)
+		self._dispatchTable: Final[dict[type[ast.AST], tuple[tuple[int, NodeChanger[Any, Any]], ...]]] = {}
+		self._dictionarySlice2Suite: Final[dict[tuple[int, int], NodeChangerSuite]] = {}
+		self.countReplacements: int = 0
+		self.listCallbacksChanged: Final[list[Callable[[ast.AST], object]]] = []
+		# The suites of slices of `listRules` count their replacements in the suite that the user created.
+		self._suiteRoot: NodeChangerSuite = self
+
+	@property
+	def changed(self) -> bool:
+		"""Whether the last `visit` applied `doThat` of at least one rule to at least one node."""
+		return self.countReplacements > 0
+
+	def _suiteOfSlice(self, start: int, stop: int) -> NodeChangerSuite:
+		suite: NodeChangerSuite | None = self._dictionarySlice2Suite.get((start, stop))
+		if suite is None:
+			suite = self._dictionarySlice2Suite[start, stop] = NodeChangerSuite(self.listRules[start:stop])
+			suite._suiteRoot = self._suiteRoot
+		return suite
+
+	def _consequence(self, node: ast.AST) -> object:
+		classNode: type[ast.AST] = type(node)
+		rulesCandidate: tuple[tuple[int, NodeChanger[Any, Any]], ...] | None = self._dispatchTable.get(classNode)
+		if rulesCandidate is None:
+			rulesCandidate = self._dispatchTable[classNode] = tuple(
+				(index, rule) for index, rule in enumerate(self.listRules) if issubclass(classNode, rule._nodeTypesDispatch))  # noqa: SLF001
+		for index, rule in rulesCandidate:
+			if rule.findThis(node):
+				self._suiteRoot.countReplacements += 1
+				if index > 0:
+					_changeDescendants(node, self._suiteOfSlice(0, index)._consequence)  # noqa: SLF001
+				consequence: object = rule.doThat(node)
+				if index + 1 < len(self.listRules):
+					consequence = self._suiteOfSlice(index + 1, len(self.listRules))._visitConsequence(consequence)  # noqa: SLF001
+				return consequence
+		return _noMatch
+
+	def _visitConsequence(self, consequence: object) -> object:
+		if consequence is None:
+			return None
+		if isinstance(consequence, ast.AST):
+			return self._visit(consequence)
+		listConsequences: list[object] = []
+		for item in cast('Iterable[object]', consequence):
+			if not isinstance(item, ast.AST):
+				listConsequences.append(item)
+				continue
+			consequenceOfItem: object = self._visit(item)
+			if consequenceOfItem is None:
+				continue
+			if isinstance(consequenceOfItem, ast.AST):
+				listConsequences.append(consequenceOfItem)
+			else:
+				listConsequences.extend(consequenceOfItem)  # pyright: ignore[reportArgumentType]
+		return listConsequences
+
+	def _visit(self, node: ast.AST) -> object:
+		consequence: object = self._consequence(node)
+		if consequence is _noMatch:
+			return _changeDescendants(node, self._consequence)
+		return consequence
+
+	def visit(self, node: ast.AST) -> Any:
+		"""Apply every rule to `node` and each descendant of `node` in one traversal.
+
+		`visit` counts, in `countReplacements`, the nodes to which it applies `doThat` of a rule. If it
+		applied at least one, it then calls each callable in `listCallbacksChanged` with `node`.
+
+		Parameters
+		----------
+		node : ast.AST
+			AST node to test and potentially transform.
+
+		Returns
+		-------
+		transformedNode : Any
+			The replacement of `node` if a rule matched `node`, otherwise `node` with its descendants
+			transformed. Returns `None` if the node should be deleted.
+		"""
+		self.countReplacements = 0
+		consequence: object = self._visit(node)
+		if self.countReplacements:
+			_callCallbacksChanged(self.listCallbacksChanged, node)
+		return consequence
@@ -0,0 +1,207 @@
+"""Compile a predicate composed of `Be` and `IfThis` predicates into one flat function.
+
+A composed predicate, such as `Be.Assign.valueIs(IfThis.isCallIdentifier('bake'))`, is a chain of
+`workhorse` closures: each closure calls the next, and each repeats an `isinstance` check and
+an attribute read. `compilePredicate` reads the chain once, writes the source code of one function
+with one boolean expression for the whole chain, and compiles it with `exec`. For example, the
+predicate above becomes, in effect:
+
+```python
+	def predicateCompiled(node):
+		return isinstance(node, ast.Assign) and (isinstance((v1 := node.value), ast.Call) and (isinstance((v2 := v1.func), ast.Name) and v2.id == 'bake'))
+```
+
+The generated code depends only on the structure of the predicate, not on the identifiers and other
+values in it, so the compiled code is cached by structure and reused for, say, every
+`IfThis.isCallIdentifier(...)`.
+"""
+from __future__ import annotations
+
+from astToolkit._toolkitNodeVisitor import nodeTypesOfPredicate
+from astToolkit._toolkitPredicateMetadata import _annotationReturnOf, metadataOfPredicate
+from typing import TYPE_CHECKING
+import ast
+
+if TYPE_CHECKING:
+	from astToolkit._toolkitPredicateMetadata import PredicateMetadata
+	from collections.abc import Callable
+	from typing import Any, Final
+
+_dictionaryShape2Factory: Final[dict[tuple[Any, ...], Callable[..., Callable[[ast.AST], object]]]] = {}
+
+class _CompilerOfPredicate:
+	"""Describe the structure of one predicate, then write, or reuse, the code of its compiled form.
+
+	The description, the "shape", is a nested `tuple` made from the `PredicateMetadata` of each
+	sub-predicate. The first element of each `tuple` is the kind of the sub-predicate:
+
+	- `('isinstance', classes, slot)`
+	- `('attribute', classes, slot, attributeName, shapeChild)`
+	- `('index', index, shapeChild)`
+	- `('equal', slot)`
+	- `('allOf', shapesChildren)`, `('anyOf', shapesChildren)`
+	- `('recurse',)`: the sub-predicate is the predicate that is being compiled.
+	- `('opaque', slot)`: any other callable, which the compiled function calls.
+
+	If a sub-predicate other than `predicate` refers to itself, it is compiled on its own, and the
+	compiled function calls it as an opaque callable.
+
+	A slot is the index of an argument of the factory that makes the compiled function. The
+	arguments are the values of the predicate, such as identifiers and callables, so two predicates
+	with the same shape share a factory.
+	"""
+
+	def __init__(self, predicate: Callable[[ast.AST], object], listCompiling: list[object]) -> None:
+		self.predicate: Callable[[ast.AST], object] = predicate
+		self.listCompiling: list[object] = listCompiling
+		self.listArguments: list[object] = []
+		self.listDescribing: list[object] = []
+		self.listSubjects: list[str] = ['node']
+
+	def _slot(self, value: object) -> int:
+		self.listArguments.append(value)
+		return len(self.listArguments) - 1
+
+	def _opaque(self, predicate: object) -> tuple[Any, ...]:
+		return ('opaque', self._slot(predicate))
+
+	def describe(self, predicate: Callable[..., object]) -> tuple[Any, ...]:
+		if predicate is self.predicate and self.listDescribing:
+			return ('recurse',)
+		if any(predicate is describing for describing in self.listDescribing):
+			if any(predicate is compiling for compiling in self.listCompiling):
+				return self._opaque(predicate)
+			return self._opaque(_compile(predicate, [*self.listCompiling, self.predicate]))
+		self.listDescribing.append(predicate)
+		try:
+			return self._describe(predicate)
+		finally:
+			self.listDescribing.pop()
+
+	def _describe(self, predicate: Callable[..., object]) -> tuple[Any, ...]:
+		predicateMetadata: PredicateMetadata = metadataOfPredicate(predicate)
+		kind: str = predicateMetadata.kind
+		if kind == 'isinstance':
+			return (kind, predicateMetadata.nodeTypes, self._slot(predicateMetadata.nodeTypes))
+		if kind == 'attribute':
+			return (kind, predicateMetadata.nodeTypes, self._slot(predicateMetadata.nodeTypes), predicateMetadata.attributePath[0], self.describe(predicateMetadata.childPredicates[0]))
+		if kind == 'index':
+			return (kind, predicateMetadata.attributePath[0], self.describe(predicateMetadata.childPredicates[0]))
+		if kind == 'equal':
+			return (kind, self._slot(predicateMetadata.value))
+		if kind in {'allOf', 'anyOf'} and predicateMetadata.childPredicates:
+			return (kind, tuple(self.describe(antecedent) for antecedent in predicateMetadata.childPredicates))
+		return self._opaque(predicate)
+
+	def _subject(self, expression: str) -> str:
+		self.listSubjects.append(expression)
+		return f"\x00{len(self.listSubjects) - 1}\x00"
+
+	def express(self, shape: tuple[Any, ...], subject: str, classesKnown: tuple[type[ast.AST], ...] | None) -> str:
+		"""Write the expression of `shape` applied to `subject`.
+
+		The first thing each expression evaluates reads `subject`, so the first occurrence of a
+		subject in the source code is the first to be evaluated, and it can bind the subject to a
+		local with `:=` for the other occurrences.
+
+		`classesKnown`, if not `None`, are classes of which `subject` is certainly an instance, so
+		an `isinstance` check that they imply is omitted.
+
+		Returns
+		-------
+		expression : str
+			The Python expression, in which each subject is a marker for `listSubjects`.
+		"""
+		kind: str = shape[0]
+		if kind == 'isinstance':
+			return f"isinstance({subject}, a{shape[2]})"
+		if kind == 'attribute':
+			expressionChild: str = self.express(shape[4], self._subject(f"{subject}.{shape[3]}"), None)
+			if _implies(classesKnown, shape[1]):
+				return expressionChild
+			return f"(isinstance({subject}, a{shape[2]}) and {expressionChild})"
+		if kind == 'index':
+			return self.express(shape[2], self._subject(f"{subject}[{shape[1]!r}]"), None)
+		if kind == 'equal':
+			return f"{subject} == a{shape[1]}"
+		if kind == 'allOf':
+			listExpressions: list[str] = []
+			for shapeChild in shape[1]:
+				if shapeChild[0] == 'isinstance' and _implies(classesKnown, shapeChild[1]) and listExpressions:
+					continue
+				listExpressions.append(self.express(shapeChild, subject, classesKnown))
+				if shapeChild[0] in {'isinstance', 'attribute'}:
+					classesKnown = shapeChild[1]
+			return f"({' and '.join(listExpressions)})"
+		if kind == 'anyOf':
+			return f"({' or '.join(self.express(shapeChild, subject, classesKnown) for shapeChild in shape[1])})"
+		if kind == 'recurse':
+			return f"predicateCompiled({subject})"
+		return f"a{shape[1]}({subject})"
+
+	def writeSource(self, shape: tuple[Any, ...]) -> str:
+		expression: str = self.express(shape, self.listSubjects[0], None)
+		# Replace the markers of the subjects, from the innermost subject, whose expression contains the marker of its parent, outward.
+		for indexSubject in range(len(self.listSubjects) - 1, 0, -1):
+			marker: str = f"\x00{indexSubject}\x00"
+			if expression.count(marker) > 1:
+				expression = expression.replace(marker, f"(v{indexSubject} := {self.listSubjects[indexSubject]})", 1).replace(marker, f"v{indexSubject}")
+			else:
+				expression = expression.replace(marker, self.listSubjects[indexSubject])
+		expression = expression.replace("\x000\x00", self.listSubjects[0])
+		parameters: str = ', '.join(f"a{slot}" for slot in range(len(self.listArguments)))
+		return f"def factory({parameters}):\n\tdef predicateCompiled(node):\n\t\treturn {expression}\n\treturn predicateCompiled\n"
+
+def _implies(classesKnown: tuple[type[ast.AST], ...] | None, classesChecked: tuple[type[ast.AST], ...]) -> bool:
+	return classesKnown is not None and all(issubclass(classKnown, classesChecked) for classKnown in classesKnown)
+
+def compilePredicate[个](predicate: Callable[[ast.AST], 个]) -> Callable[[ast.AST], 个]:
+	"""Compile a predicate composed of `Be` and `IfThis` predicates into one flat function.
+
+	`compilePredicate` reads the structure with `metadataOfPredicate`, so it recognizes the `Be.*`
+	class predicates, the `Be.*.*Is` attribute predicates, `Be.at`, `IfThis.isIdentifier`,
+	`IfThis.isAllOf`, `IfThis.isAnyOf`, and the `IfThis.*` predicates that are composed of those. The compiled function does, with the fewest `isinstance` checks and
+	attribute reads, what the chain of closures does, and it calls any other callable in the chain,
+	such as a `lambda`, as the chain does. A predicate that refers to itself, such as
+	`IfThis.isNestedNameIdentifier(...)`, becomes a compiled function that calls itself.
+
+	The compiled function returns a value with the same truth value as `predicate`, but the value
+	is not necessarily a `bool`. Its `return` annotation is the `TypeIs` annotation of `predicate`,
+	so `NodeTourist` and `NodeChanger` dispatch on the same `ast.AST` classes.
+
+	Parameters
+	----------
+	predicate : Callable[[ast.AST], 个]
+		A predicate, such as `Be.Return.valueIs(IfThis.isNameIdentifier('cake'))`.
+
+	Returns
+	-------
+	predicateCompiled : Callable[[ast.AST], 个]
+		The compiled predicate, or `predicate` itself if `compilePredicate` does not recognize it or if
+		no node can match it.
+
+	Examples
+	--------
+	```python
+		findThis = compilePredicate(Be.Call.funcIs(IfThis.isAttributeNamespaceIdentifier('np', 'zeros')))
+		listCalls = NodeTourist(findThis, Then.extractIt).captureMatches(kitchenModule)
+	```
+	"""
+	return _compile(predicate, [])
+
+def _compile[个](predicate: Callable[[ast.AST], 个], listCompiling: list[object]) -> Callable[[ast.AST], 个]:
+	nodeTypes: tuple[type[ast.AST], ...] | None = nodeTypesOfPredicate(predicate)
+	if nodeTypes == ():
+		return predicate
+	compiler = _CompilerOfPredicate(predicate, listCompiling)
+	shape: tuple[Any, ...] = compiler.describe(predicate)
+	if shape[0] == 'opaque':
+		return predicate
+	factory: Callable[..., Callable[[ast.AST], object]] | None = _dictionaryShape2Factory.get(shape)
+	if factory is None:
+		namespace: dict[str, Any] = {}
+		exec(compile(compiler.writeSource(shape), f"<compilePredicate {shape[0]}>", 'exec'), namespace)  # noqa: S102
+		factory = _dictionaryShape2Factory.setdefault(shape, namespace['factory'])
+	predicateCompiled: Callable[[ast.AST], Any] = factory(*compiler.listArguments)
+	predicateCompiled.__annotations__ = {'node': ast.AST, 'return': _annotationReturnOf(nodeTypes)}
+	return predicateCompiled
@@ -0,0 +1,214 @@
+"""Read the structure of a predicate made by `Be` or `IfThis`.
+
+A predicate made by `Be` or `IfThis`, such as `Be.Assign.valueIs(IfThis.isCallIdentifier('bake'))`,
+is a `workhorse` closure, so calling it is the only thing a visitor can do with it. `metadataOfPredicate`
+recognizes each kind of `Be` and `IfThis` predicate and returns a `PredicateMetadata` with the
+`ast.AST` classes the predicate can match, the attribute the predicate reads from the node, and the
+predicates that it applies to the attribute or to the node. A visitor, an index, or a query planner
+can use the metadata to skip nodes, to reorder checks, or to compile the predicate, as
+`compilePredicate` does.
+
+`Be` is generated, so this module reads the structure of the closures instead of storing metadata
+on each closure. It identifies `Be` and `IfThis` by the names of their modules, so it does not
+import them, and `NodeTourist` and `NodeChanger` can use it.
+"""
+from __future__ import annotations
+
+from contextlib import suppress
+from functools import reduce
+from inspect import get_annotations, isfunction, ismethod
+from types import UnionType
+from typing import get_args, get_origin, TYPE_CHECKING, TypeGuard, TypeIs
+from weakref import WeakKeyDictionary
+import ast
+import dataclasses
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Iterable
+	from typing import Any, Final
+
+_moduleBe: Final[str] = 'astToolkit._toolBe'
+_moduleBeExact: Final[str] = 'astToolkit._toolBeExact'
+_moduleCodeTemplate: Final[str] = 'astToolkit._toolkitCodeTemplate'
+_moduleFind: Final[str] = 'astToolkit._toolFind'
+_moduleIfThis: Final[str] = 'astToolkit._toolIfThis'
+_qualnameWorkhorse: Final[str] = '.<locals>.workhorse'
+
+_cachePredicate2Metadata: Final[WeakKeyDictionary[Callable[..., object], PredicateMetadata]] = WeakKeyDictionary()
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PredicateMetadata:
+	"""The structure of one predicate, as far as `metadataOfPredicate` can read it.
+
+	Attributes
+	----------
+	kind : str
+		What the predicate does with the node:
+
+		- `'isinstance'`: it is `True` if the node is an instance of one of `nodeTypes`, such as `Be.Name`.
+		- `'attribute'`: it is `True` if the node is an instance of one of `nodeTypes` and
+			`childPredicates[0]` is `True` for the attribute `attributePath[0]`, such as `Be.Name.idIs(...)`.
+		- `'index'`: it applies `childPredicates[0]` to the element `attributePath[0]` of a `list`, as `Be.at(...)`.
+		- `'equal'`: it is `True` if the value equals `value`, as `IfThis.isIdentifier(...)`.
+		- `'allOf'`, `'anyOf'`: it is `True` if all, or any, of `childPredicates` are `True`, as
+			`IfThis.isAllOf(...)` and `IfThis.isAnyOf(...)`, and their adaptive forms.
+		- `'noDescendant'`: it is `True` if `childPredicates[0]` is `False` for every descendant, as
+			`IfThis.matchesNoDescendant(...)`.
+		- `'opaque'`: anything else, including a `Find` query and a `CodeTemplate`. The predicate can only be called.
+	nodeTypes : tuple[type[ast.AST], ...] | None
+		The classes of node for which the predicate can possibly be `True`, or `None` if any node could
+		match. An empty `tuple` means no node can match, for example, `IfThis.isAllOf(Be.Name, Be.Call)`.
+	attributePath : tuple[str | int, ...]
+		The attribute name, or the `list` index, that the predicate reads before it applies
+		`childPredicates[0]`. To follow a chain, such as `node.value.func.id`, read the metadata of the
+		child predicates.
+	childPredicates : tuple[Callable[..., object], ...]
+		The predicates that the predicate calls.
+	value : object
+		The value to which `'equal'` compares, otherwise `None`.
+	"""
+
+	kind: str
+	nodeTypes: tuple[type[ast.AST], ...] | None
+	attributePath: tuple[str | int, ...] = ()
+	childPredicates: tuple[Callable[..., object], ...] = ()
+	value: object = None
+
+def _normalizeNodeTypes(nodeTypes: type[ast.AST] | Iterable[type[ast.AST]]) -> tuple[type[ast.AST], ...]:
+	if isinstance(nodeTypes, type):
+		return (nodeTypes,)
+	return tuple(sorted(set(nodeTypes), key=lambda classNode: classNode.__qualname__))
+
+def _nodeTypesOfAnnotation(findThis: Callable[..., object]) -> tuple[type[ast.AST], ...] | None:
+	callableTarget: object = findThis if isfunction(findThis) or ismethod(findThis) else type(findThis).__call__
+	try:
+		annotationReturn: object = get_annotations(callableTarget, eval_str=True).get('return')  # pyright: ignore[reportArgumentType]
+	except Exception:  # noqa: BLE001
+		return None
+	if get_origin(annotationReturn) not in {TypeIs, TypeGuard}:
+		return None
+	(annotationNarrowed,) = get_args(annotationReturn)
+	if get_origin(annotationNarrowed) is UnionType:
+		listNodeTypes: tuple[object, ...] = get_args(annotationNarrowed)
+	else:
+		listNodeTypes = (annotationNarrowed,)
+	if not all(isinstance(classNode, type) and issubclass(classNode, ast.AST) for classNode in listNodeTypes):
+		return None
+	return _normalizeNodeTypes(listNodeTypes)  # pyright: ignore[reportArgumentType]
+
+def _annotationReturnOf(nodeTypes: tuple[type[ast.AST], ...] | None) -> object:
+	# The `return` annotation of a compiled predicate, such as `TypeIs[ast.Name | ast.Call]`, from which `_nodeTypesOfAnnotation` reads `nodeTypes`.
+	if not nodeTypes:
+		return bool
+	# A `lambda`, not `operator.or_`, whose type strict pyright reads as partially unknown.
+	return TypeIs[reduce(lambda union, classNode: union | classNode, nodeTypes)]  # noqa: FURB118
+
+def _nodeTypesOfAllOf(childPredicates: tuple[Callable[..., object], ...]) -> tuple[type[ast.AST], ...] | None:
+	nodeTypes: tuple[type[ast.AST], ...] | None = None
+	for antecedent in childPredicates:
+		nodeTypesAntecedent: tuple[type[ast.AST], ...] | None = metadataOfPredicate(antecedent).nodeTypes
+		if nodeTypesAntecedent is None:
+			continue
+		if nodeTypes is None:
+			nodeTypes = nodeTypesAntecedent
+		else:
+			# A node that matches both is an instance of a class in one `tuple` that is a subclass of a class in the other.
+			nodeTypes = _normalizeNodeTypes([classNode for classNode in nodeTypes if issubclass(classNode, nodeTypesAntecedent)]
+				+ [classNode for classNode in nodeTypesAntecedent if issubclass(classNode, nodeTypes)])
+	return nodeTypes
+
+def _nodeTypesOfAnyOf(childPredicates: tuple[Callable[..., object], ...]) -> tuple[type[ast.AST], ...] | None:
+	listNodeTypes: list[type[ast.AST]] = []
+	for antecedent in childPredicates:
+		nodeTypesAntecedent: tuple[type[ast.AST], ...] | None = metadataOfPredicate(antecedent).nodeTypes
+		if nodeTypesAntecedent is None:
+			return None
+		listNodeTypes.extend(nodeTypesAntecedent)
+	return _normalizeNodeTypes(listNodeTypes)
+
+def _cellsOf(function: Callable[..., object]) -> dict[str, Any]:
+	return dict(zip(function.__code__.co_freevars, (cell.cell_contents for cell in function.__closure__ or ()), strict=True))
+
+def _readMetadata(predicate: Callable[..., object]) -> PredicateMetadata:
+	if not hasattr(predicate, '__code__'):
+		if type(predicate).__module__ in {_moduleCodeTemplate, _moduleFind}:
+			return PredicateMetadata('opaque', predicate.nodeTypes)  # pyright: ignore[reportFunctionMemberAccess]
+		nodeTypes: tuple[type[ast.AST], ...] | None = _nodeTypesOfAnnotation(predicate)
+		if type(predicate).__module__ == _moduleBe and nodeTypes is not None:
+			return PredicateMetadata('isinstance', nodeTypes)
+		return PredicateMetadata('opaque', nodeTypes)
+
+	qualname: str = predicate.__qualname__
+	# `functools.wraps` copies `__module__` and `__qualname__` to a wrapper, but a wrapper has the globals of its own module.
+	moduleName: object = getattr(predicate, '__globals__', {}).get('__name__')
+	cells: dict[str, Any] = _cellsOf(predicate)
+	nodeTypes = _nodeTypesOfAnnotation(predicate)
+	if moduleName in {_moduleBe, _moduleBeExact}:
+		if _qualnameWorkhorse not in qualname:
+			if nodeTypes is not None:
+				return PredicateMetadata('isinstance', nodeTypes)
+		elif qualname == f"Be.at{_qualnameWorkhorse}":
+			return PredicateMetadata('index', None, (cells['index'],), (cells['predicate'],))
+		elif 'attributeCondition' in cells and nodeTypes is not None:
+			nameMethod: str = qualname.removesuffix(_qualnameWorkhorse).rpartition('.')[2]
+			if nameMethod.endswith('Is') and nameMethod.removesuffix('Is').isidentifier():
+				return PredicateMetadata('attribute', nodeTypes, (nameMethod.removesuffix('Is'),), (cells['attributeCondition'],))
+	elif moduleName == _moduleIfThis:
+		if qualname == f"IfThis.isIdentifier{_qualnameWorkhorse}":
+			return PredicateMetadata('equal', None, value=cells['identifier'])
+		if qualname == f"IfThis.isAllOf{_qualnameWorkhorse}":
+			return PredicateMetadata('allOf', _nodeTypesOfAllOf(cells['predicate']), childPredicates=cells['predicate'])
+		if qualname == f"IfThis.isAnyOf{_qualnameWorkhorse}":
+			return PredicateMetadata('anyOf', _nodeTypesOfAnyOf(cells['predicate']), childPredicates=cells['predicate'])
+		if qualname == f"_combineAdaptive{_qualnameWorkhorse}":
+			kind: str = 'allOf' if cells['isAllOf'] else 'anyOf'
+			# The metadata is cached, so it has the predicates in the order of the caller, not `ordered`, which changes as they are reordered.
+			childPredicates: tuple[Callable[..., object], ...] = _cellsOf(cells['sample'])['predicate']
+			return PredicateMetadata(kind, _nodeTypesOfAllOf(childPredicates) if kind == 'allOf' else _nodeTypesOfAnyOf(childPredicates), childPredicates=childPredicates)
+		if qualname == f"IfThis.matchesNoDescendant{_qualnameWorkhorse}":
+			return PredicateMetadata('noDescendant', None, childPredicates=(cells['predicate'],))
+		if 'predicateComposed' in cells:
+			# The `workhorse` only narrows the type of `predicateComposed`, which has the structure.
+			metadataComposed: PredicateMetadata = metadataOfPredicate(cells['predicateComposed'])
+			return dataclasses.replace(metadataComposed, nodeTypes=nodeTypes if nodeTypes is not None else metadataComposed.nodeTypes)
+	return PredicateMetadata('opaque', nodeTypes)
+
+def metadataOfPredicate(predicate: Callable[..., object]) -> PredicateMetadata:
+	"""Read the kind, the candidate `ast.AST` classes, the attribute, and the child predicates of `predicate`.
+
+	`metadataOfPredicate` recognizes the `Be.*` class predicates, the `Be.*.*Is` attribute predicates,
+	`Be.at`, the same predicates of `BeExact`, and the predicates of `IfThis`, including the `IfThis.*`
+	predicates that are composed of those. For any other callable, the kind is `'opaque'` and
+	`nodeTypes` comes from the `TypeIs` or `TypeGuard` `return` annotation, if there is one. For a
+	`Find` query or a `CodeTemplate`, `nodeTypes` is its attribute `nodeTypes`.
+
+	Parameters
+	----------
+	predicate : Callable[..., object]
+		A predicate, such as `Be.Call.funcIs(IfThis.isNameIdentifier('bake'))`.
+
+	Returns
+	-------
+	predicateMetadata : PredicateMetadata
+		The metadata. It is computed once per predicate `object` and then cached.
+
+	Examples
+	--------
+	```python
+		predicateMetadata = metadataOfPredicate(Be.Call.funcIs(IfThis.isNameIdentifier('bake')))
+		predicateMetadata.kind  # 'attribute'
+		predicateMetadata.nodeTypes  # (ast.Call,)
+		predicateMetadata.attributePath  # ('func',)
+		metadataOfPredicate(predicateMetadata.childPredicates[0]).attributePath  # ('id',)
+	```
+	"""
+	try:
+		return _cachePredicate2Metadata[predicate]
+	except KeyError:
+		pass
+	except TypeError:
+		return _readMetadata(predicate)
+	predicateMetadata: PredicateMetadata = _readMetadata(predicate)
+	with suppress(TypeError):
+		_cachePredicate2Metadata[predicate] = predicateMetadata
+	return predicateMetadata
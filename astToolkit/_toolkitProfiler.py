@@ -0,0 +1,152 @@
+"""Measure how often, and for how long, the visitors call each antecedent and action.
+
+`ProfilerOfRules.instrument` replaces `findThis` and `doThat` of a `NodeTourist`, a `NodeChanger`,
+or each rule of a `NodeTouristSuite` or `NodeChangerSuite` with wrappers that count calls and
+matches and accumulate time. A visitor that is not instrumented calls its own functions directly,
+so profiling costs nothing unless it is used.
+"""
+from __future__ import annotations
+
+from astToolkit._toolkitNodeVisitor import NodeChanger, NodeChangerSuite, NodeTourist, NodeTouristSuite
+from astToolkit._toolkitPredicateMetadata import _annotationReturnOf
+from functools import wraps
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+import ast
+import json
+
+if TYPE_CHECKING:
+	from collections.abc import Callable
+	from typing import Any, Final
+
+class _StatisticsRule:
+	__slots__ = ('countFindThis', 'countMatches', 'nanosecondsDoThat', 'nanosecondsFindThis')
+
+	def __init__(self) -> None:
+		self.countFindThis: int = 0
+		self.countMatches: int = 0
+		self.nanosecondsFindThis: int = 0
+		self.nanosecondsDoThat: int = 0
+
+def _identifierOfCallable(callableTarget: Callable[..., object]) -> str:
+	return getattr(callableTarget, '__qualname__', None) or type(callableTarget).__qualname__
+
+class ProfilerOfRules:
+	"""Count the calls and matches of, and the time spent in, `findThis` and `doThat` of each rule.
+
+	A rule is one `(findThis, doThat)` pair of a visitor. The statistics of each rule are aggregated
+	under an identifier, so the same rule in many visitors, or in a visitor used many times, has one
+	entry in the report.
+
+	For each rule, the report has:
+
+	- `countFindThis`: the number of calls to `findThis`. Because of the `nodeTypes` dispatch of the
+		visitors, this is the number of candidate nodes, not the number of nodes in the tree.
+	- `countMatches`: the number of calls for which `findThis` returned `True`, which is the number
+		of calls to `doThat`.
+	- `hitRatio`: `countMatches / countFindThis`, or 0.0 if `findThis` was not called.
+	- `secondsFindThis`, `secondsDoThat`: the cumulative time spent in `findThis` and `doThat`.
+
+	Examples
+	--------
+	Find the slow pass of a pipeline:
+	```python
+		profiler = ProfilerOfRules()
+		listNodeChangers = [profiler.instrument(NodeChanger(findThis, doThat)) for findThis, doThat in listRules]
+		for nodeChanger in listNodeChangers:
+			nodeChanger.visit(kitchenModule)
+		print(profiler.asJSON())
+	```
+	"""
+
+	def __init__(self) -> None:
+		self._dictionaryIdentifier2Statistics: Final[dict[str, _StatisticsRule]] = {}
+
+	def instrument[个: NodeTourist[Any, Any] | NodeChanger[Any, Any] | NodeTouristSuite | NodeChangerSuite](self, visitor: 个, identifierRule: str | None = None) -> 个:
+		"""Replace `findThis` and `doThat` of `visitor` with wrappers that record statistics in this profiler.
+
+		Parameters
+		----------
+		visitor : NodeTourist | NodeChanger | NodeTouristSuite | NodeChangerSuite
+			The visitor to instrument. For a suite, each rule in `listRules` is instrumented.
+		identifierRule : str | None = None
+			The identifier of the rule in the report. If `None`, the identifier is made from the
+			`__qualname__` of `findThis` and `doThat`, for example,
+			`'NodeChanger(IfThis.isNameIdentifier.<locals>.workhorse, Then.replaceWith.<locals>.<lambda>)'`,
+			so pass `identifierRule` to tell apart rules that are made by the same functions. For a
+			suite, the index of each rule is appended to `identifierRule`.
+
+		Returns
+		-------
+		visitor : NodeTourist | NodeChanger | NodeTouristSuite | NodeChangerSuite
+			The same `visitor`, instrumented.
+		"""
+		if isinstance(visitor, (NodeTouristSuite, NodeChangerSuite)):
+			for index, rule in enumerate(visitor.listRules):
+				self.instrument(rule, None if identifierRule is None else f"{identifierRule}[{index}]")
+			return visitor
+		findThis: Callable[[ast.AST], bool] = visitor.findThis
+		doThat: Callable[[Any], Any] = visitor.doThat
+		if identifierRule is None:
+			identifierRule = f"{type(visitor).__name__}({_identifierOfCallable(findThis)}, {_identifierOfCallable(doThat)})"
+		statistics: _StatisticsRule = self._dictionaryIdentifier2Statistics.setdefault(identifierRule, _StatisticsRule())
+
+		# Only the name and the docstring: the wrapper is not `findThis`, so it does not claim the `__qualname__`, `__module__`, or
+		# `__annotations__` of `findThis`.
+		@wraps(findThis, assigned=('__name__', '__doc__'))
+		def findThisProfiled(node: ast.AST) -> bool:
+			timeStart: int = perf_counter_ns()
+			try:
+				isMatch: bool = findThis(node)
+			finally:
+				statistics.nanosecondsFindThis += perf_counter_ns() - timeStart
+				statistics.countFindThis += 1
+			if isMatch:
+				statistics.countMatches += 1
+			return isMatch
+		# A visitor that reuses `findThisProfiled` dispatches on the same classes as `visitor`.
+		findThisProfiled.__annotations__ = {'node': ast.AST, 'return': _annotationReturnOf(visitor.nodeTypes)}
+
+		@wraps(doThat, assigned=('__name__', '__doc__'))
+		def doThatProfiled(node: Any) -> Any:
+			timeStart: int = perf_counter_ns()
+			try:
+				return doThat(node)
+			finally:
+				statistics.nanosecondsDoThat += perf_counter_ns() - timeStart
+
+		visitor.findThis = findThisProfiled
+		visitor.doThat = doThatProfiled
+		return visitor
+
+	def asDict(self) -> dict[str, dict[str, float | int]]:
+		"""Return the statistics of each rule, in the order in which the rules were instrumented.
+
+		Returns
+		-------
+		report : dict[str, dict[str, float | int]]
+			For each rule identifier, `countFindThis`, `countMatches`, `hitRatio`, `secondsFindThis`,
+			and `secondsDoThat`.
+		"""
+		return {identifierRule: {
+				'countFindThis': statistics.countFindThis,
+				'countMatches': statistics.countMatches,
+				'hitRatio': statistics.countMatches / statistics.countFindThis if statistics.countFindThis else 0.0,
+				'secondsFindThis': statistics.nanosecondsFindThis / 1e9,
+				'secondsDoThat': statistics.nanosecondsDoThat / 1e9,
+			} for identifierRule, statistics in self._dictionaryIdentifier2Statistics.items()}
+
+	def asJSON(self, indent: int | None = 1) -> str:
+		"""Return the report of `asDict` as JSON.
+
+		Returns
+		-------
+		report : str
+			The report of `asDict`, as JSON, indented by `indent`.
+		"""
+		return json.dumps(self.asDict(), indent=indent)
+
+	def reset(self) -> None:
+		"""Set the statistics of every rule to 0, but keep the instrumented visitors recording in this profiler."""
+		for statistics in self._dictionaryIdentifier2Statistics.values():
+			statistics.countFindThis = statistics.countMatches = statistics.nanosecondsFindThis = statistics.nanosecondsDoThat = 0
@@ -0,0 +1,376 @@
+"""The scopes of an AST tree, with the names that each scope binds and uses, built in one traversal.
+
+Python decides, for each scope, whether a name is local to the scope, and the compiler resolves each
+use of a name to one scope: the scope that binds the name, an enclosing function that binds it, the
+module, or the builtins. A tool that asks "is this parameter used?" by collecting every `ast.Name` of
+a function with the same identifier answers wrongly when a nested function, a lambda, or a
+comprehension binds the same identifier, and a tool that renames or inlines a name has the same
+problem.
+
+`ScopeAnalysis` traverses the tree once and makes a `Scope` for the module and for each function,
+lambda, class, and comprehension. Each `Scope` has the names that it binds, its free names, its
+`global` and `nonlocal` names, and, for each name that it binds, the definitions of the name and the
+uses that resolve to them. Then removing unused parameters, inlining, and renaming can query the
+`Scope` instead of walking, and copying, the tree.
+"""
+from __future__ import annotations
+
+from astToolkit._toolkitIndex import _IndexRebuiltAfterChange
+from typing import TYPE_CHECKING
+import ast
+import dataclasses
+
+if TYPE_CHECKING:
+	from collections.abc import Iterator
+	from typing import Final
+
+_classesScopeComprehension: Final[tuple[type[ast.AST], ...]] = (ast.DictComp, ast.GeneratorExp, ast.ListComp, ast.SetComp)
+
+@dataclasses.dataclass(eq=False, slots=True)
+class Scope:
+	"""The names of one scope: a module, a function, a lambda, a class, or a comprehension.
+
+	Attributes
+	----------
+	node : ast.AST | None
+		The `ast.Module`, `ast.FunctionDef`, `ast.AsyncFunctionDef`, `ast.Lambda`, `ast.ClassDef`,
+		`ast.ListComp`, `ast.SetComp`, `ast.DictComp`, or `ast.GeneratorExp` of the scope. If the root
+		of the analysis is not an `ast.Module`, the outermost scope, which encloses the root, has no node.
+	parent : Scope | None
+		The enclosing scope, or `None` for the outermost scope.
+	listChildren : list[Scope]
+		The scopes directly inside the scope.
+	setBound : set[str]
+		The names local to the scope: the parameters and the names that the scope assigns, deletes,
+		imports, or defines, without the names of `setGlobal` and `setNonlocal`. A name that the walrus
+		operator, `:=`, assigns in a comprehension is bound in the enclosing function or module.
+	setFree : set[str]
+		The names that the scope, or a scope inside it, uses or assigns, and that an enclosing function
+		binds, as in the `co_freevars` of the compiled code.
+	setGlobal : set[str]
+		The names of the `global` statements of the scope.
+	setNonlocal : set[str]
+		The names of the `nonlocal` statements of the scope.
+	dictionaryIdentifier2Definitions : dict[str, list[ast.AST]]
+		For each name that the scope binds, the nodes that bind it, from the scope or, through
+		`global` and `nonlocal`, from a scope inside it: an `ast.arg`, an `ast.Name` with `ast.Store`,
+		an `ast.alias`, an `ast.FunctionDef`, an `ast.AsyncFunctionDef`, an `ast.ClassDef`, an
+		`ast.ExceptHandler`, a match pattern, or a type parameter.
+	dictionaryIdentifier2Uses : dict[str, list[ast.Name]]
+		For each name that the scope binds, the `ast.Name` nodes, with `ast.Load` or `ast.Del`, that
+		resolve to it, from the scope or from a scope inside it. The target of an `ast.AugAssign`, such
+		as `count` in `count += 1`, is a use and a definition.
+	"""
+
+	node: ast.AST | None
+	parent: Scope | None = dataclasses.field(repr=False)
+	listChildren: list[Scope] = dataclasses.field(default_factory=list["Scope"], repr=False)
+	setBound: set[str] = dataclasses.field(default_factory=set[str])
+	setFree: set[str] = dataclasses.field(default_factory=set[str])
+	setGlobal: set[str] = dataclasses.field(default_factory=set[str])
+	setNonlocal: set[str] = dataclasses.field(default_factory=set[str])
+	dictionaryIdentifier2Definitions: dict[str, list[ast.AST]] = dataclasses.field(default_factory=dict[str, list[ast.AST]], repr=False)
+	dictionaryIdentifier2Uses: dict[str, list[ast.Name]] = dataclasses.field(default_factory=dict[str, list[ast.Name]], repr=False)
+
+	def isUsed(self, identifier: str) -> bool:
+		"""Whether any `ast.Name` resolves to the binding of `identifier` in the scope.
+
+		Returns
+		-------
+		isUsed : bool
+			`True` if at least one `ast.Name` resolves to the binding of `identifier` in the scope.
+		"""
+		return bool(self.dictionaryIdentifier2Uses.get(identifier))
+
+class ScopeAnalysis(_IndexRebuiltAfterChange):
+	"""The `Scope` of the module and of each function, lambda, class, and comprehension of an AST tree.
+
+	`ScopeAnalysis` traverses the tree once, with an explicit stack, and records the scope of each
+	node that binds or uses a name. Then, without another traversal of the tree, it resolves each
+	name as the compiler does:
+
+	- A function, a lambda, a class, and a comprehension each have a scope. The decorators, the
+		default values, the annotations, and the bases are in the enclosing scope, and so is the
+		iterable of the first `for` of a comprehension.
+	- A name that a scope binds, anywhere in the scope, is local to the scope, unless the scope
+		declares it `global` or `nonlocal`.
+	- Any other name resolves to the nearest enclosing function, lambda, or comprehension that binds
+		it, skipping classes, then to the module. A name that nothing binds, such as `len`, resolves to
+		no scope.
+	- A type parameter, such as `T` in `def bake[T](flour: T)`, is bound in the scope of its function
+		or class, not in a scope of its own. So, unlike `symtable`, a use of a type parameter of a class
+		in a method, such as `T` in `return T` in a method `get` of `class Box[T]`, skips the class and
+		resolves to no scope.
+
+	The def-use chains are at the level of the scope, as the compiler decides whether a name is local:
+	each definition of a name in a scope reaches each use of the name that resolves to the scope,
+	whatever the order of the statements.
+
+	The analysis is built when it is created, and it is rebuilt, at the next query, after
+	`invalidate`. Like `NodeClassIndex`, a `ScopeAnalysis` can `watch` a `NodeChanger`. A `Scope`
+	from before a rebuild is not updated.
+
+	Parameters
+	----------
+	root : ast.AST
+		The root of the tree to analyze, usually an `ast.Module`. If `root` is a function, the
+		function is in the outermost scope, so the free names of the function resolve to no scope.
+
+	Examples
+	--------
+	```python
+		scopeAnalysis = ScopeAnalysis(kitchenModule)
+		scopeBake = scopeAnalysis.scopeOf(FunctionDefBake)
+		listParametersUnused = [ast_arg.arg for ast_arg in FunctionDefBake.args.args if not scopeBake.isUsed(ast_arg.arg)]
+		listUsesFlour = scopeAnalysis.usesOf(FunctionDefBake.args.args[0])
+	```
+
+	References
+	----------
+	[1] Execution model: Resolution of names - Python documentation
+		https://docs.python.org/3/reference/executionmodel.html#resolution-of-names
+	[2] symtable - Python documentation
+		https://docs.python.org/3/library/symtable.html
+	"""
+
+	def __init__(self, root: ast.AST) -> None:
+		super().__init__(root)
+		self.scopeRoot: Scope = Scope(None, None)
+		self._dictionaryNode2Scope: Final[dict[ast.AST, Scope]] = {}
+		self._dictionaryNode2Binding: Final[dict[ast.AST, tuple[str, Scope | None]]] = {}
+		self._rebuildIfStale()
+
+	def _newScope(self, node: ast.AST, parent: Scope) -> Scope:
+		scope = Scope(node, parent)
+		parent.listChildren.append(scope)
+		self._dictionaryNode2Scope[node] = scope
+		return scope
+
+	def _build(self) -> None:
+		self._dictionaryNode2Scope.clear()
+		self._dictionaryNode2Binding.clear()
+		self.scopeRoot = scopeRoot = Scope(None, None)
+		if isinstance(self.root, ast.Module):
+			scopeRoot.node = self.root
+			self._dictionaryNode2Scope[self.root] = scopeRoot
+		# Each occurrence is a node, its identifier, the scope in which it is written, and whether it binds the identifier.
+		listOccurrences: list[tuple[ast.AST, str, Scope, bool]] = []
+		stack: list[tuple[ast.AST, Scope]] = [(self.root, scopeRoot)]
+		while stack:
+			node, scope = stack.pop()
+			listChildren: list[tuple[ast.AST, Scope]] = []
+			if isinstance(node, ast.Name):
+				isDefinition: bool = isinstance(node.ctx, ast.Store)
+				# `del x` makes `x` local to the scope, as an assignment does, but it is a use, not a definition.
+				if not isinstance(node.ctx, ast.Load):
+					scope.setBound.add(node.id)
+				listOccurrences.append((node, node.id, scope, isDefinition))
+				continue
+			if isinstance(node, (ast.AsyncFunctionDef, ast.ClassDef, ast.FunctionDef)):
+				scope.setBound.add(node.name)
+				listOccurrences.append((node, node.name, scope, True))
+				scopeInner: Scope = self._newScope(node, scope)
+				listChildren.extend((decorator, scope) for decorator in node.decorator_list)
+				listChildren.extend((typeParameter, scopeInner) for typeParameter in node.type_params)
+				if isinstance(node, ast.ClassDef):
+					listChildren.extend((base, scope) for base in node.bases)
+					listChildren.extend((keyword, scope) for keyword in node.keywords)
+				else:
+					listChildren.extend(self._childrenOfArguments(node.args, scope, scopeInner, listOccurrences))
+					if node.returns is not None:
+						listChildren.append((node.returns, scope))
+				listChildren.extend((statement, scopeInner) for statement in node.body)
+			elif isinstance(node, ast.Lambda):
+				scopeInner = self._newScope(node, scope)
+				listChildren.extend(self._childrenOfArguments(node.args, scope, scopeInner, listOccurrences))
+				listChildren.append((node.body, scopeInner))
+			elif isinstance(node, _classesScopeComprehension):
+				scopeInner = self._newScope(node, scope)
+				if isinstance(node, ast.DictComp):
+					listChildren.extend(((node.key, scopeInner), (node.value, scopeInner)))
+				else:
+					listChildren.append((node.elt, scopeInner))  # pyright: ignore[reportAttributeAccessIssue]
+				for position, comprehension in enumerate(node.generators):  # pyright: ignore[reportAttributeAccessIssue]
+					listChildren.extend(((comprehension.target, scopeInner), (comprehension.iter, scope if position == 0 else scopeInner)))
+					listChildren.extend((test, scopeInner) for test in comprehension.ifs)
+			elif isinstance(node, ast.NamedExpr):
+				scopeTarget: Scope = scope
+				while isinstance(scopeTarget.node, _classesScopeComprehension) and scopeTarget.parent is not None:
+					scopeTarget = scopeTarget.parent
+				listChildren.extend(((node.target, scopeTarget), (node.value, scope)))
+			elif isinstance(node, ast.Global):
+				scope.setGlobal.update(node.names)
+			elif isinstance(node, ast.Nonlocal):
+				scope.setNonlocal.update(node.names)
+			else:
+				identifierBound: str | None = None
+				if isinstance(node, ast.alias):
+					# `import os.path` binds `os`.
+					identifierBound = node.asname or node.name.partition('.')[0]
+					if identifierBound == '*':
+						identifierBound = None
+				elif isinstance(node, (ast.ExceptHandler, ast.MatchAs, ast.MatchStar, ast.ParamSpec, ast.TypeVar, ast.TypeVarTuple)):
+					identifierBound = node.name
+				elif isinstance(node, ast.MatchMapping):
+					identifierBound = node.rest
+				elif isinstance(node, ast.AugAssign) and isinstance(node.target, ast.Name):
+					listOccurrences.append((node.target, node.target.id, scope, False))
+				if identifierBound is not None:
+					scope.setBound.add(identifierBound)
+					listOccurrences.append((node, identifierBound, scope, True))
+				listChildren.extend((child, scope) for child in ast.iter_child_nodes(node))
+			stack.extend(reversed(listChildren))
+
+		for scope in self._iterScopes():
+			scope.setBound -= scope.setGlobal | scope.setNonlocal
+		# Resolve the definitions first: a definition in a function, through `global`, binds the name in the module.
+		for node, identifier, scope, isDefinition in sorted(listOccurrences, key=lambda occurrence: not occurrence[3]):
+			scopeBinding: Scope | None = self._resolve(identifier, scope)
+			self._dictionaryNode2Binding[node] = (identifier, scopeBinding)
+			if scopeBinding is None:
+				continue
+			if isDefinition:
+				scopeBinding.setBound.add(identifier)
+				scopeBinding.dictionaryIdentifier2Definitions.setdefault(identifier, []).append(node)
+			else:
+				scopeBinding.dictionaryIdentifier2Uses.setdefault(identifier, []).append(node)  # pyright: ignore[reportArgumentType]
+			self._addFree(identifier, scope, scopeBinding)
+		# A `nonlocal` statement makes the name free, even if the scope neither uses nor assigns it.
+		for scope in self._iterScopes():
+			for identifier in scope.setNonlocal:
+				self._addFree(identifier, scope, self._resolve(identifier, scope))
+
+	def _addFree(self, identifier: str, scope: Scope, scopeBinding: Scope | None) -> None:
+		if scopeBinding is None or scopeBinding is self.scopeRoot:
+			return
+		scopeFree: Scope | None = scope
+		while scopeFree is not None and scopeFree is not scopeBinding:
+			scopeFree.setFree.add(identifier)
+			scopeFree = scopeFree.parent
+
+	@staticmethod
+	def _childrenOfArguments(argumentSpecification: ast.arguments, scopeOuter: Scope, scopeInner: Scope
+			, listOccurrences: list[tuple[ast.AST, str, Scope, bool]]) -> list[tuple[ast.AST, Scope]]:
+		listChildren: list[tuple[ast.AST, Scope]] = [(default, scopeOuter) for default in (*argumentSpecification.defaults, *argumentSpecification.kw_defaults) if default is not None]
+		for ast_arg in (*argumentSpecification.posonlyargs, *argumentSpecification.args, argumentSpecification.vararg
+				, *argumentSpecification.kwonlyargs, argumentSpecification.kwarg):
+			if ast_arg is None:
+				continue
+			scopeInner.setBound.add(ast_arg.arg)
+			listOccurrences.append((ast_arg, ast_arg.arg, scopeInner, True))
+			if ast_arg.annotation is not None:
+				listChildren.append((ast_arg.annotation, scopeOuter))
+		return listChildren
+
+	def _resolve(self, identifier: str, scope: Scope) -> Scope | None:
+		scopeRoot: Scope = self.scopeRoot
+		if identifier in scope.setGlobal:
+			return scopeRoot
+		if identifier in scope.setBound:
+			return scope
+		isNonlocal: bool = identifier in scope.setNonlocal
+		scopeEnclosing: Scope | None = scope.parent
+		while scopeEnclosing is not None:
+			if scopeEnclosing is scopeRoot:
+				return scopeRoot if identifier in scopeRoot.setBound and not isNonlocal else None
+			# A class does not enclose the scopes inside it.
+			if not isinstance(scopeEnclosing.node, ast.ClassDef):
+				if identifier in scopeEnclosing.setGlobal:
+					return None if isNonlocal else scopeRoot
+				if identifier in scopeEnclosing.setBound:
+					return scopeEnclosing
+			scopeEnclosing = scopeEnclosing.parent
+		return None
+
+	def _iterScopes(self) -> Iterator[Scope]:
+		stack: list[Scope] = [self.scopeRoot]
+		while stack:
+			scope: Scope = stack.pop()
+			yield scope
+			stack.extend(reversed(scope.listChildren))
+
+	def scopes(self) -> list[Scope]:
+		"""Return every scope, from the outermost scope, each before the scopes inside it.
+
+		Returns
+		-------
+		listScopes : list[Scope]
+			Every scope of the tree, in pre-order.
+		"""
+		self._rebuildIfStale()
+		return list(self._iterScopes())
+
+	def scopeOf(self, node: ast.AST) -> Scope:
+		"""Return the `Scope` of `node`, which is an `ast.Module`, a function, a lambda, a class, or a comprehension of the tree.
+
+		Returns
+		-------
+		scope : Scope
+			The scope of `node`.
+
+		Raises
+		------
+		ValueError
+			If `node` does not have a scope in the tree.
+		"""
+		self._rebuildIfStale()
+		try:
+			return self._dictionaryNode2Scope[node]
+		except KeyError as 拦message:
+			message: str = f"I received {node = }, but it is not a module, function, lambda, class, or comprehension of the tree."
+			raise ValueError(message) from 拦message
+
+	def bindingOf(self, node: ast.AST) -> Scope | None:
+		"""Return the scope whose binding `node` defines or uses, or `None` if no scope binds it, as for `len`.
+
+		Parameters
+		----------
+		node : ast.AST
+			An `ast.Name`, or a node in `Scope.dictionaryIdentifier2Definitions`, such as an `ast.arg`.
+
+		Returns
+		-------
+		scopeBinding : Scope | None
+			The scope that binds the name of `node`, or `None` if no scope binds it.
+
+		Raises
+		------
+		ValueError
+			If `node` does not define or use a name in the tree.
+		"""
+		self._rebuildIfStale()
+		try:
+			return self._dictionaryNode2Binding[node][1]
+		except KeyError as 拦message:
+			message: str = f"I received {node = }, but it does not define or use a name in the tree."
+			raise ValueError(message) from 拦message
+
+	def definitionsOf(self, node: ast.AST) -> list[ast.AST]:
+		"""Return the definitions of the binding that `node` defines or uses, as `bindingOf`.
+
+		If `node` does not define or use a name in the tree, `definitionsOf` raises `ValueError`.
+
+		Returns
+		-------
+		listDefinitions : list[ast.AST]
+			The definitions of the binding, or an empty `list` if no scope binds the name.
+		"""
+		scopeBinding: Scope | None = self.bindingOf(node)
+		if scopeBinding is None:
+			return []
+		return list(scopeBinding.dictionaryIdentifier2Definitions.get(self._dictionaryNode2Binding[node][0], []))
+
+	def usesOf(self, node: ast.AST) -> list[ast.Name]:
+		"""Return the uses of the binding that `node` defines or uses, as `bindingOf`.
+
+		If `node` does not define or use a name in the tree, `usesOf` raises `ValueError`.
+
+		Returns
+		-------
+		listUses : list[ast.Name]
+			The uses of the binding, or an empty `list` if no scope binds the name.
+		"""
+		scopeBinding: Scope | None = self.bindingOf(node)
+		if scopeBinding is None:
+			return []
+		return list(scopeBinding.dictionaryIdentifier2Uses.get(self._dictionaryNode2Binding[node][0], []))
@@ -0,0 +1,198 @@
+"""Hash and compare `ast.AST` trees by structure, without unparsing them.
+
+Two trees are structurally equal if their nodes have the same classes and the same field values, in
+the same shape. Positions, such as `lineno` and `col_offset`, are attributes, not fields, so they are
+ignored; and, optionally, `ctx` (***c***on***t***e***x***t), which distinguishes `ast.Load`, `ast.Store`, and
+`ast.Del` but which `ast.unparse` does not write, is ignored, too. A subclass of an `ast` class, such
+as `Make.Add`, is the same as its `ast` class.
+
+The structural hash is a Merkle-style hash: the hash of a node combines the class of the node and
+the hashes of its fields, so `StructuralHasher` computes the hash of every node of a tree in one
+post-order traversal. Structurally equal trees have equal hashes; trees with equal hashes are
+almost always structurally equal, and `areStructurallyEqual` decides. Like `hash()` of a `str`, a
+structural hash is only meaningful within one process.
+"""
+from __future__ import annotations
+
+from typing import cast, TYPE_CHECKING
+import ast
+
+if TYPE_CHECKING:
+	from typing import Final
+
+_dictionaryClass2ClassStructural: Final[dict[type[ast.AST], type[ast.AST]]] = {}
+
+def _classStructural(classNode: type[ast.AST]) -> type[ast.AST]:
+	try:
+		return _dictionaryClass2ClassStructural[classNode]
+	except KeyError:
+		classStructural: type[ast.AST] = next((classBase for classBase in classNode.__mro__ if classBase.__module__ == 'ast'), classNode)
+		return _dictionaryClass2ClassStructural.setdefault(classNode, classStructural)
+
+def _isEqualValue(valueA: object, valueB: object) -> bool:
+	if type(valueA) is not type(valueB):
+		return False
+	if isinstance(valueA, (float, complex)):
+		# `repr` tells apart `0.0` and `-0.0`, and `nan` equals `nan`, as in the source code.
+		return repr(valueA) == repr(valueB)
+	return bool(valueA == valueB)
+
+def _hashValue(value: object) -> int:
+	if isinstance(value, (float, complex)):
+		return hash((type(value), repr(value)))
+	try:
+		return hash((type(value), value))
+	except TypeError:
+		return hash((type(value), repr(value)))
+
+def areStructurallyEqual(nodeA: ast.AST, nodeB: ast.AST, *, ignoreContext: bool = False) -> bool:
+	"""Whether `nodeA` and `nodeB` are trees with the same structure and the same values.
+
+	`areStructurallyEqual` compares, with an explicit stack, the class and each field of each pair of
+	nodes, and it returns `False` at the first difference, so comparing two different trees is
+	usually fast.
+
+	Parameters
+	----------
+	nodeA : ast.AST
+		A tree.
+	nodeB : ast.AST
+		A tree.
+	ignoreContext : bool = False
+		If `True`, ignore the `ctx` field, so `x` in `x = 1` equals `x` in `print(x)`.
+
+	Returns
+	-------
+	isEqual : bool
+		`True` if the trees are structurally equal. Positions are ignored.
+	"""
+	stack: list[tuple[object, object]] = [(nodeA, nodeB)]
+	while stack:
+		valueA, valueB = stack.pop()
+		if valueA is valueB:
+			continue
+		if isinstance(valueA, ast.AST):
+			if not isinstance(valueB, ast.AST) or _classStructural(type(valueA)) is not _classStructural(type(valueB)):
+				return False
+			# Push in reverse, so the fields are compared in order, and a difference in the class of a child, which is common, is found early.
+			for fieldName in reversed(valueA._fields):
+				if ignoreContext and fieldName == 'ctx':
+					continue
+				stack.append((getattr(valueA, fieldName, None), getattr(valueB, fieldName, None)))
+		elif isinstance(valueA, list):
+			if not isinstance(valueB, list) or len(valueA) != len(valueB):  # pyright: ignore[reportUnknownArgumentType]
+				return False
+			stack.extend(reversed(list(zip(valueA, valueB, strict=True))))  # pyright: ignore[reportUnknownArgumentType]
+		elif not _isEqualValue(valueA, valueB):
+			return False
+	return True
+
+class StructuralHasher:
+	"""Compute, and remember, the structural hash of each node of one or more trees.
+
+	`hashOf` computes the hash of a node and of each of its descendants in one post-order traversal,
+	and it remembers each hash, so after `hashOf(root)`, the hash of any node of the tree costs one
+	`dict` lookup. Use a `StructuralHasher` to find, among many nodes, the nodes that are structurally
+	equal to some other node, for example, to group duplicate expressions.
+
+	A `StructuralHasher` is a snapshot: it does not know when a tree changes. After changing a tree,
+	call `clear` or create a new `StructuralHasher`.
+
+	Parameters
+	----------
+	ignoreContext : bool = False
+		If `True`, ignore the `ctx` field.
+
+	Examples
+	--------
+	Group the structurally equal expressions of a module:
+	```python
+		structuralHasher = StructuralHasher(ignoreContext=True)
+		dictionaryHash2Expressions: dict[int, list[ast.expr]] = {}
+		for node in ast.walk(kitchenModule):
+			if isinstance(node, ast.expr):
+				dictionaryHash2Expressions.setdefault(structuralHasher.hashOf(node), []).append(node)
+	```
+	"""
+
+	def __init__(self, *, ignoreContext: bool = False) -> None:
+		self.ignoreContext: Final[bool] = ignoreContext
+		self._dictionaryNode2Hash: Final[dict[ast.AST, int]] = {}
+
+	def _hashFields(self, node: ast.AST) -> int:
+		dictionaryNode2Hash: dict[ast.AST, int] = self._dictionaryNode2Hash
+		listHashes: list[object] = [_classStructural(type(node))]
+		for fieldName in node._fields:
+			if self.ignoreContext and fieldName == 'ctx':
+				continue
+			value: object = getattr(node, fieldName, None)
+			if isinstance(value, ast.AST):
+				listHashes.append(dictionaryNode2Hash[value])
+			elif isinstance(value, list):
+				listItems: list[object] = cast('list[object]', value)
+				listHashes.append(hash(tuple(dictionaryNode2Hash[item] if isinstance(item, ast.AST) else _hashValue(item) for item in listItems)))
+			else:
+				listHashes.append(_hashValue(value))
+		return hash(tuple(listHashes))
+
+	def hashOf(self, node: ast.AST) -> int:
+		"""Return the structural hash of `node`.
+
+		Parameters
+		----------
+		node : ast.AST
+			The root of a tree.
+
+		Returns
+		-------
+		hashStructural : int
+			A hash that is equal for structurally equal trees.
+		"""
+		dictionaryNode2Hash: dict[ast.AST, int] = self._dictionaryNode2Hash
+		try:
+			return dictionaryNode2Hash[node]
+		except KeyError:
+			pass
+		stack: list[tuple[ast.AST, bool]] = [(node, False)]
+		while stack:
+			nodeCurrent, isChildrenHashed = stack.pop()
+			if isChildrenHashed:
+				dictionaryNode2Hash[nodeCurrent] = self._hashFields(nodeCurrent)
+			elif nodeCurrent not in dictionaryNode2Hash:
+				stack.append((nodeCurrent, True))
+				stack.extend((child, False) for child in ast.iter_child_nodes(nodeCurrent))
+		return dictionaryNode2Hash[node]
+
+	def isEqual(self, nodeA: ast.AST, nodeB: ast.AST) -> bool:
+		"""Whether `nodeA` and `nodeB` are structurally equal, comparing the remembered hashes first.
+
+		Returns
+		-------
+		isEqual : bool
+			`True` if `nodeA` and `nodeB` are structurally equal.
+		"""
+		return self.hashOf(nodeA) == self.hashOf(nodeB) and areStructurallyEqual(nodeA, nodeB, ignoreContext=self.ignoreContext)
+
+	def clear(self) -> None:
+		"""Forget every remembered hash."""
+		self._dictionaryNode2Hash.clear()
+
+def structuralHash(node: ast.AST, *, ignoreContext: bool = False) -> int:
+	"""Return the structural hash of `node`, which is equal for structurally equal trees.
+
+	To hash many nodes of the same tree, use one `StructuralHasher`, which remembers the hash of each
+	node.
+
+	Parameters
+	----------
+	node : ast.AST
+		The root of a tree.
+	ignoreContext : bool = False
+		If `True`, ignore the `ctx` field.
+
+	Returns
+	-------
+	hashStructural : int
+		The hash. Positions are ignored.
+	"""
+	return StructuralHasher(ignoreContext=ignoreContext).hashOf(node)
@@ -0,0 +1,138 @@
+"""A cache of `ast.unparse`, keyed on the identity of the node.
+
+`ast.unparse(node)` costs O(size of the subtree of `node`), and a predicate that compares code, such as
+`IfThis.unparseIs`, unparses each node it checks. A tool that checks the same tree many times, such as
+`unparseFindReplace` with many mappings, unparses the same subtrees again and again. `UnparseCache`
+keeps the code of each node that it unparsed, so a subtree costs one `ast.unparse` until it changes.
+
+A change to a node changes the code of the node and the code of each of its ancestors.
+`UnparseCache` records the parent of each node in the subtrees it unparsed, so `invalidate(node)`
+discards the code of `node`, of its descendants, and of its ancestors, and keeps the code of the rest
+of the tree. `watch` connects the cache to a `NodeChanger` or a `NodeChangerSuite`, which calls
+`invalidate` with the node that it visited, after each `visit` that changes the tree.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+import ast
+
+if TYPE_CHECKING:
+	from astToolkit._toolkitNodeVisitor import NodeChanger, NodeChangerSuite
+	from typing import Any, Final
+
+class UnparseCache:
+	"""The `ast.unparse` code of each node, computed once per node until the node changes.
+
+	The cache is keyed on the identity of the node, not on its structure, and it keeps a reference to
+	each node in it, so discard the cache, or call `clear`, when the tree is no longer needed. The code
+	of a node does not depend on its position, so moving a node without changing it does not change
+	its code.
+
+	The cache cannot see changes to the tree. After a `NodeChanger` changes the tree, `watch` calls
+	`invalidate` for you; after any other change, call `invalidate` with the changed node, or `clear`.
+
+	Examples
+	--------
+	```python
+		unparseCache = UnparseCache()
+		for nodeFind, nodeReplace in dictionaryFindReplace.items():
+			unparseCache.watch(NodeChanger(IfThis.unparseIs(nodeFind, unparseCache=unparseCache), Then.replaceWith(nodeReplace))).visit(kitchenModule)
+	```
+	"""
+
+	def __init__(self) -> None:
+		self._dictionaryNode2Text: Final[dict[ast.AST, str]] = {}
+		self._dictionaryNode2Parent: Final[dict[ast.AST, ast.AST]] = {}
+
+	def __len__(self) -> int:
+		"""The number of nodes whose code is in the cache.
+
+		Returns
+		-------
+		countNodes : int
+			The number of nodes whose code is in the cache.
+		"""
+		return len(self._dictionaryNode2Text)
+
+	def __contains__(self, node: object) -> bool:
+		"""Whether the code of `node` is in the cache.
+
+		Returns
+		-------
+		isCached : bool
+			`True` if the code of `node` is in the cache.
+		"""
+		return node in self._dictionaryNode2Text
+
+	def unparse(self, node: ast.AST) -> str:
+		"""Return `ast.unparse(node)`, from the cache if possible.
+
+		Parameters
+		----------
+		node : ast.AST
+			The node to unparse.
+
+		Returns
+		-------
+		text : str
+			The code of `node`.
+		"""
+		try:
+			return self._dictionaryNode2Text[node]
+		except KeyError:
+			pass
+		text: str = ast.unparse(node)
+		self._dictionaryNode2Text[node] = text
+		dictionaryNode2Parent: dict[ast.AST, ast.AST] = self._dictionaryNode2Parent
+		stack: list[ast.AST] = [node]
+		while stack:
+			parent: ast.AST = stack.pop()
+			for child in ast.iter_child_nodes(parent):
+				dictionaryNode2Parent[child] = parent
+				stack.append(child)
+		return text
+
+	def invalidate(self, node: ast.AST | None = None) -> None:
+		"""Discard the code of `node`, of its descendants, and of its ancestors; if `node` is `None`, discard everything.
+
+		Parameters
+		----------
+		node : ast.AST | None = None
+			The node that changed, or whose descendants changed. The signature lets `invalidate` be a
+			callback of `NodeChanger`.
+		"""
+		if node is None:
+			self.clear()
+			return
+		dictionaryNode2Text: dict[ast.AST, str] = self._dictionaryNode2Text
+		dictionaryNode2Parent: dict[ast.AST, ast.AST] = self._dictionaryNode2Parent
+		ancestor: ast.AST | None = dictionaryNode2Parent.get(node)
+		while ancestor is not None:
+			dictionaryNode2Text.pop(ancestor, None)
+			ancestor = dictionaryNode2Parent.get(ancestor)
+		# A descendant might have been replaced, so its parent is recorded again when an ancestor is unparsed again.
+		for descendant in ast.walk(node):
+			dictionaryNode2Text.pop(descendant, None)
+			if descendant is not node:
+				dictionaryNode2Parent.pop(descendant, None)
+
+	def clear(self) -> None:
+		"""Discard the code and the parent of every node."""
+		self._dictionaryNode2Text.clear()
+		self._dictionaryNode2Parent.clear()
+
+	def watch[个: NodeChanger[Any, Any] | NodeChangerSuite](self, nodeChanger: 个) -> 个:
+		"""Call `invalidate` with the visited node after each `visit` of `nodeChanger` that changes the tree.
+
+		Parameters
+		----------
+		nodeChanger : NodeChanger | NodeChangerSuite
+			The transformer to watch.
+
+		Returns
+		-------
+		nodeChanger : NodeChanger | NodeChangerSuite
+			The same `nodeChanger`.
+		"""
+		nodeChanger.listCallbacksChanged.append(self.invalidate)
+		return nodeChanger
@@ -10,7 +10,8 @@ complex code optimizations and transformations. The module includes five key fun
 	definitions within a module, enabling efficient access to specific function definitions.
 
 2. inlineFunctionDef: Performs function inlining by recursively substituting function calls with their
-	implementation bodies, creating self-contained functions without external dependencies.
+	implementation bodies, creating self-contained functions without external dependencies. Inliner does the same
+	for any number of functions of one module, and analyzes the module once.
 
 3. removeUnusedParameters: Optimizes function signatures by analyzing and removing unused parameters,
 	updating the function signature, return statements, and type annotations accordingly.
@@ -27,7 +28,7 @@ code transformations while maintaining semantic integrity and performance charac
 from __future__ import annotations
 
 from astToolkit._namespaceUncertainty import (
-	inlineFunctionDef as inlineFunctionDef, makeDictionaryAsyncFunctionDef as makeDictionaryAsyncFunctionDef,
+	inlineFunctionDef as inlineFunctionDef, Inliner as Inliner, makeDictionaryAsyncFunctionDef as makeDictionaryAsyncFunctionDef,
 	makeDictionaryClassDef as makeDictionaryClassDef, makeDictionaryFunctionDef as makeDictionaryFunctionDef,
 	makeDictionaryMosDef as makeDictionaryMosDef, pythonCode2ast_expr as pythonCode2ast_expr, removeUnusedParameters as removeUnusedParameters,
 	unjoinBinOP as unjoinBinOP, unparseFindReplace as unparseFindReplace, write_astModule as write_astModule)
@@ -0,0 +1,35 @@
+"""Compare the predicates of `Be` with the same predicates of `BeExact`.
+
+Run from the repository root:
+
+	python benchmarks/benchmarkBeExact.py
+"""
+# ruff: noqa: T201
+from __future__ import annotations
+
+from astToolkit import Be, BeExact, IfThis, packageSettings
+from benchmarkPredicateCompiler import nanosecondsPerCall, nanosecondsPerNode
+from collections.abc import Callable
+from typing import Any
+import ast
+
+def benchmark() -> None:
+	astModule: ast.Module = ast.parse((packageSettings.pathPackage / '_toolMake.py').read_text(encoding='utf-8'))
+	listNodes: list[ast.AST] = list(ast.walk(astModule))
+	listComparisons: list[tuple[str, Callable[[type[Be]], Callable[[ast.AST], Any]]]] = [
+		("Name", lambda be: be.Name),
+		("Add", lambda be: be.Add),
+		("expr", lambda be: be.expr),
+		("stmt", lambda be: be.stmt),
+		("Call.func.Name.id == 'TypeVar'", lambda be: be.Call.funcIs(be.Name.idIs(IfThis.isIdentifier('TypeVar')))),
+	]
+	print(f"{len(listNodes)} nodes")
+	for identifier, buildPredicate in listComparisons:
+		predicateBe: Callable[[ast.AST], Any] = buildPredicate(Be)
+		predicateExact: Callable[[ast.AST], Any] = buildPredicate(BeExact)
+		print(identifier)
+		print(f"\tcall on every node   Be {nanosecondsPerCall(predicateBe, listNodes, 20):7.1f} ns   BeExact {nanosecondsPerCall(predicateExact, listNodes, 20):7.1f} ns")
+		print(f"\tNodeTourist per node Be {nanosecondsPerNode(astModule, predicateBe, 20):7.1f} ns   BeExact {nanosecondsPerNode(astModule, predicateExact, 20):7.1f} ns")
+
+if __name__ == '__main__':
+	benchmark()
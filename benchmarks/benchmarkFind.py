@@ -0,0 +1,31 @@
+"""Compare hand-composed `Be` chains with the same predicates written as `Find` queries.
+
+Run from the repository root:
+
+	python benchmarks/benchmarkFind.py
+"""
+# ruff: noqa: T201
+from __future__ import annotations
+
+from astToolkit import Be, Find, IfThis, packageSettings
+from benchmarkPredicateCompiler import nanosecondsPerCall, nanosecondsPerNode
+from collections.abc import Callable
+from typing import Any
+import ast
+
+def benchmark() -> None:
+	astModule: ast.Module = ast.parse((packageSettings.pathPackage / '_toolMake.py').read_text(encoding='utf-8'))
+	listNodes: list[ast.AST] = list(ast.walk(astModule))
+	listComparisons: list[tuple[str, Callable[[ast.AST], Any], Find]] = [
+		("Assign.targets[0].Name.id == 'T'", Be.Assign.targetsIs(Be.at(0, Be.Name.idIs(IfThis.isIdentifier('T')))), Find.Assign.targets.at(0).Name.id.equal('T')),
+		("Call.func.Attribute.value.Name.id == 'ast'", Be.Call.funcIs(Be.Attribute.valueIs(Be.Name.idIs(IfThis.isIdentifier('ast')))), Find.Call.func.Attribute.value.Name.id.equal('ast')),
+		("Return.value.Call", Be.Return.valueIs(Be.Call), Find.Return.value.Call),
+	]
+	print(f"{len(listNodes)} nodes")
+	for identifier, predicateBe, find in listComparisons:
+		print(identifier)
+		print(f"\tcall on every node   Be {nanosecondsPerCall(predicateBe, listNodes, 20):7.1f} ns   Find {nanosecondsPerCall(find, listNodes, 20):7.1f} ns   Find.predicate {nanosecondsPerCall(find.predicate, listNodes, 20):7.1f} ns")
+		print(f"\tNodeTourist per node Be {nanosecondsPerNode(astModule, predicateBe, 20):7.1f} ns   Find {nanosecondsPerNode(astModule, find, 20):7.1f} ns   Find.predicate {nanosecondsPerNode(astModule, find.predicate, 20):7.1f} ns")
+
+if __name__ == '__main__':
+	benchmark()
@@ -0,0 +1,40 @@
+"""Compare `inlineFunctionDef`, once per target, with one `Inliner` for every target.
+
+Run from the repository root:
+
+	python benchmarks/benchmarkInliner.py
+"""
+# ruff: noqa: T201
+from __future__ import annotations
+
+from astToolkit.transformationTools import inlineFunctionDef, Inliner
+import ast
+import time
+
+def makeSource(countHelpers: int, countTargets: int) -> str:
+	listLines: list[str] = ["def helper0(a):\n\tb = a + 1\n\treturn b\n"]
+	listLines.extend(f"def helper{index}(a):\n\tb = helper{index - 1}(a) + {index}\n\treturn b\n" for index in range(1, countHelpers))
+	listLines.extend(f"def target{index}(a):\n\tc = helper{index % countHelpers}(a)\n\treturn c\n" for index in range(countTargets))
+	return "".join(listLines)
+
+def benchmark() -> None:
+	countHelpers, countTargets = 40, 60
+	source: str = makeSource(countHelpers, countTargets)
+	listIdentifiers: list[str] = [f"target{index}" for index in range(countTargets)]
+	print(f"{countHelpers} chained helpers, {countTargets} targets")
+
+	astModule: ast.Module = ast.parse(source)
+	timeStart: float = time.perf_counter()
+	for identifier in listIdentifiers:
+		inlineFunctionDef(identifier, astModule)
+	print(f"\tinlineFunctionDef per target {time.perf_counter() - timeStart:7.3f} s")
+
+	astModule = ast.parse(source)
+	timeStart = time.perf_counter()
+	inliner = Inliner(astModule)
+	for identifier in listIdentifiers:
+		inliner.inline(identifier)
+	print(f"\tone Inliner                  {time.perf_counter() - timeStart:7.3f} s")
+
+if __name__ == '__main__':
+	benchmark()
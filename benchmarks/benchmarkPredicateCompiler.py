@@ -0,0 +1,55 @@
+"""Compare composed `Be` and `IfThis` predicates with the same predicates compiled by `compilePredicate`.
+
+Also compare `IfThis.isAllOf` with `IfThis.isAllOfAdaptive` when the predicates are in a slow order.
+
+Run from the repository root:
+
+	python benchmarks/benchmarkPredicateCompiler.py
+"""
+# ruff: noqa: T201
+from __future__ import annotations
+
+from astToolkit import Be, compilePredicate, IfThis, NodeTourist, packageSettings, Then
+from collections.abc import Callable
+from typing import Any
+import ast
+import timeit
+
+def nanosecondsPerCall(predicate: Callable[[ast.AST], Any], listNodes: list[ast.AST], number: int) -> float:
+	def callEach() -> None:
+		for node in listNodes:
+			predicate(node)
+	return min(timeit.repeat(callEach, number=number, repeat=5)) / number / len(listNodes) * 1e9
+
+def nanosecondsPerNode(astAST: ast.AST, predicate: Callable[[ast.AST], Any], number: int) -> float:
+	countNodes: int = sum(1 for _node in ast.walk(astAST))
+	nodeTourist = NodeTourist(predicate, Then.extractIt)
+	return min(timeit.repeat(lambda: nodeTourist.captureMatches(astAST), number=number, repeat=5)) / number / countNodes * 1e9
+
+def benchmark() -> None:
+	astModule: ast.Module = ast.parse((packageSettings.pathPackage / '_toolMake.py').read_text(encoding='utf-8'))
+	listNodes: list[ast.AST] = list(ast.walk(astModule))
+	dictionaryPredicates: dict[str, Callable[[ast.AST], Any]] = {
+		"Be.Assign.valueIs(IfThis.isCallIdentifier('TypeVar'))": Be.Assign.valueIs(IfThis.isCallIdentifier('TypeVar')),
+		"IfThis.isCallAttributeNamespaceIdentifier('ast', 'Name')": IfThis.isCallAttributeNamespaceIdentifier('ast', 'Name'),
+		"IfThis.isNestedNameIdentifier('node')": IfThis.isNestedNameIdentifier('node'),
+		"IfThis.isAllOf(Be.Return, Be.Return.valueIs(Be.Call))": IfThis.isAllOf(Be.Return, Be.Return.valueIs(Be.Call)),
+	}
+	print(f"{len(listNodes)} nodes")
+	for identifier, predicate in dictionaryPredicates.items():
+		predicateCompiled: Callable[[ast.AST], Any] = compilePredicate(predicate)
+		print(identifier)
+		print(f"\tcall on every node   closures {nanosecondsPerCall(predicate, listNodes, 20):7.1f} ns   compiled {nanosecondsPerCall(predicateCompiled, listNodes, 20):7.1f} ns")
+		print(f"\tNodeTourist per node closures {nanosecondsPerNode(astModule, predicate, 20):7.1f} ns   compiled {nanosecondsPerNode(astModule, predicateCompiled, 20):7.1f} ns")
+
+def benchmarkAdaptive() -> None:
+	astModule: ast.Module = ast.parse((packageSettings.pathPackage / '_toolMake.py').read_text(encoding='utf-8'))
+	listNodes: list[ast.AST] = list(ast.walk(astModule))
+	# Slow order: the first predicate walks the subtree of the node and is almost always `True`.
+	listPredicates: list[Callable[[ast.AST], Any]] = [IfThis.matchesNoDescendant(Be.Global), Be.expr, IfThis.isNameIdentifier('node')]
+	print("IfThis.isAllOf(IfThis.matchesNoDescendant(Be.Global), Be.expr, IfThis.isNameIdentifier('node'))")
+	print(f"\tcall on every node   isAllOf {nanosecondsPerCall(IfThis.isAllOf(*listPredicates), listNodes, 5):9.1f} ns   isAllOfAdaptive {nanosecondsPerCall(IfThis.isAllOfAdaptive(*listPredicates), listNodes, 5):9.1f} ns")
+
+if __name__ == '__main__':
+	benchmark()
+	benchmarkAdaptive()
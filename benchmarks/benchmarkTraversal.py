@@ -0,0 +1,69 @@
+"""Compare the explicit-stack traversal of `NodeTourist` and `NodeChanger` with recursive `ast.NodeVisitor` and `ast.NodeTransformer`.
+
+Also compare one `NodeTouristSuite` pass with one `NodeTourist` pass per rule.
+
+Run from the repository root:
+
+	python benchmarks/benchmarkTraversal.py
+"""
+# ruff: noqa: T201
+from __future__ import annotations
+
+from astToolkit import Be, Make, NodeChanger, NodeTourist, NodeTouristSuite, packageSettings, Then
+from collections.abc import Callable
+from typing import Any
+import ast
+import timeit
+
+class NodeTouristRecursive(ast.NodeVisitor):
+	def __init__(self, findThis: Callable[[ast.AST], bool], doThat: Callable[[Any], Any]) -> None:
+		self.findThis = findThis
+		self.doThat = doThat
+
+	def visit(self, node: ast.AST) -> None:
+		if self.findThis(node):
+			self.doThat(node)
+		self.generic_visit(node)
+
+class NodeChangerRecursive(ast.NodeTransformer):
+	def __init__(self, findThis: Callable[[ast.AST], bool], doThat: Callable[[Any], Any]) -> None:
+		self.findThis = findThis
+		self.doThat = doThat
+
+	def visit(self, node: ast.AST) -> Any:
+		if self.findThis(node):
+			return self.doThat(node)
+		return super().visit(node)
+
+def nanosecondsPerNode(astAST: ast.AST, visitor: ast.NodeVisitor, number: int) -> float:
+	countNodes: int = sum(1 for _node in ast.walk(astAST))
+	return min(timeit.repeat(lambda: visitor.visit(astAST), number=number, repeat=5)) / number / countNodes * 1e9
+
+def benchmark(identifierTree: str, astAST: ast.AST, number: int) -> None:
+	findThis: Callable[[ast.AST], bool] = Be.Return
+	doThat: Callable[[Any], Any] = Then.extractIt
+	print(f"{identifierTree}: {sum(1 for _node in ast.walk(astAST))} nodes")
+	print(f"\tast.NodeVisitor     {nanosecondsPerNode(astAST, NodeTouristRecursive(findThis, doThat), number):8.1f} ns/node")
+	print(f"\tNodeTourist         {nanosecondsPerNode(astAST, NodeTourist(findThis, doThat), number):8.1f} ns/node")
+	print(f"\tast.NodeTransformer {nanosecondsPerNode(astAST, NodeChangerRecursive(findThis, doThat), number):8.1f} ns/node")
+	print(f"\tNodeChanger         {nanosecondsPerNode(astAST, NodeChanger(findThis, doThat), number):8.1f} ns/node")
+
+def benchmarkSuite(identifierTree: str, astAST: ast.AST, number: int) -> None:
+	listPredicates: list[Callable[[ast.AST], bool]] = [
+		Be.Assign, Be.AnnAssign, Be.Attribute, Be.Call, Be.ClassDef, Be.Constant, Be.FunctionDef, Be.If, Be.Import, Be.ImportFrom,
+		Be.Name, Be.Return, Be.Subscript, Be.arg, Be.keyword]
+	listTourists: list[NodeTourist[Any, Any]] = [NodeTourist(predicate, Then.extractIt) for predicate in listPredicates]
+	suite = NodeTouristSuite([(predicate, Then.extractIt) for predicate in listPredicates])
+	secondsSeparate: float = min(timeit.repeat(lambda: [tourist.visit(astAST) for tourist in listTourists], number=number, repeat=5)) / number
+	secondsFused: float = min(timeit.repeat(lambda: suite.visit(astAST), number=number, repeat=5)) / number
+	print(f"{identifierTree}: {len(listPredicates)} rules")
+	print(f"\tNodeTourist per rule {secondsSeparate * 1e3:8.2f} ms")
+	print(f"\tNodeTouristSuite     {secondsFused * 1e3:8.2f} ms")
+
+if __name__ == '__main__':
+	astModuleWide: ast.Module = ast.parse((packageSettings.pathPackage / '_toolMake.py').read_text(encoding='utf-8'))
+	benchmark('wide: astToolkit/_toolMake.py', astModuleWide, 5)
+	# Deep enough to be slow, but shallow enough that the recursive visitors do not raise `RecursionError`.
+	astExpressionDeep: ast.expr = Make.Add.join([Make.Name(f"ingredient{index}") for index in range(300)])
+	benchmark('deep: Make.Add.join() of 300 Names', astExpressionDeep, 200)
+	benchmarkSuite('wide: astToolkit/_toolMake.py', astModuleWide, 3)
@@ -1,6 +1,6 @@
 """Tests for the IfThis class predicates using parametrized tests and DRY principles."""
 # pyright: standard
-from astToolkit import Be, IfThis, Make
+from astToolkit import Be, IfThis, Make, metadataOfPredicate
 from collections.abc import Callable
 from typing import Any
 import ast
@@ -308,3 +308,53 @@ class TestIfThisAdvancedUsageScenarios:
 		# Should fail if any condition doesn't match
 		functionDifferentName = Make.FunctionDef(name="functionAlternate", body=[Make.Pass()])
 		assert predicateComplexCombination(functionDifferentName) is False
+
+class TestIfThisAdaptiveCombinators:
+	"""Test suite for isAllOfAdaptive and isAnyOfAdaptive."""
+
+	@staticmethod
+	def listNodesKitchen() -> list[ast.AST]:
+		return list(ast.walk(ast.parse("def bake(flour, sugar):\n\tdough = mix(flour, sugar)\n\treturn dough.rise(sugar)\n" * 20)))
+
+	@pytest.mark.parametrize("combinator,combinatorAdaptive", [(IfThis.isAllOf, IfThis.isAllOfAdaptive), (IfThis.isAnyOf, IfThis.isAnyOfAdaptive)])
+	def testSameResultsAsStaticOrder(self, combinator: Callable[..., Callable[[ast.AST], bool]], combinatorAdaptive: Callable[..., Callable[[ast.AST], bool]]) -> None:
+		"""Test the adaptive combinator returns what the combinator returns, on every call, while it reorders."""
+		listPredicates: list[Callable[[ast.AST], bool]] = [Be.expr, IfThis.isNameIdentifier("sugar"), Be.Name.ctxIs(Be.Load), IfThis.matchesNoDescendant(Be.Call)]
+		predicate = combinator(*listPredicates)
+		predicateAdaptive = combinatorAdaptive(*listPredicates, intervalSample=2, countSamplesPerReorder=4)
+		for node in self.listNodesKitchen():
+			assert predicateAdaptive(node) is predicate(node)
+
+	def testReordersSelectivePredicateFirst(self) -> None:
+		"""Test a cheap predicate that is usually `False` moves ahead of an expensive predicate that is usually `True`."""
+		listCalled: list[ast.AST] = []
+		def isGlobal(node: ast.AST) -> bool:
+			listCalled.append(node)
+			return isinstance(node, ast.Global)
+		predicateExpensive = IfThis.matchesNoDescendant(isGlobal)
+		predicateRare = IfThis.isNameIdentifier("flour")
+		predicateAdaptive = IfThis.isAllOfAdaptive(predicateExpensive, predicateRare, intervalSample=4, countSamplesPerReorder=8)
+		for node in self.listNodesKitchen():
+			predicateAdaptive(node)
+		listCalled.clear()
+		for node in self.listNodesKitchen():
+			predicateAdaptive(node)
+		countCalledAdaptive: int = len(listCalled)
+		listCalled.clear()
+		predicateStatic = IfThis.isAllOf(predicateExpensive, predicateRare)
+		for node in self.listNodesKitchen():
+			predicateStatic(node)
+		assert countCalledAdaptive < len(listCalled) / 2
+		assert metadataOfPredicate(predicateAdaptive).childPredicates == (predicateExpensive, predicateRare)
+
+	def testOtherPredicateIsBarrier(self) -> None:
+		"""Test a predicate that is not from `Be` or `IfThis` keeps the predicates before it before it."""
+		listCalledOnNonName: list[ast.AST] = []
+		def readsIdentifier(node: ast.AST) -> bool:
+			if not isinstance(node, ast.Name):
+				listCalledOnNonName.append(node)
+			return node.id == "sugar"  # pyright: ignore[reportAttributeAccessIssue]
+		predicateAdaptive = IfThis.isAllOfAdaptive(Be.AST, Be.Name, readsIdentifier, intervalSample=1, countSamplesPerReorder=2)
+		listFound = [node for node in self.listNodesKitchen() if predicateAdaptive(node)]
+		assert listFound
+		assert listCalledOnNonName == []
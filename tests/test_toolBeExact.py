@@ -0,0 +1,53 @@
+"""Tests for BeExact."""
+# pyright: standard
+from astToolkit import Be, BeExact, compilePredicate, IfThis, Make, metadataOfPredicate, NodeTourist, Then
+from collections.abc import Callable
+from typing import Any
+import ast
+import pytest
+
+class NameSubclassed(ast.Name):
+	pass
+
+listIdentifiersBe: list[str] = sorted(identifier for identifier in vars(Be) if not identifier.startswith('_') and identifier != 'at')
+
+listNodes: list[object] = [ast.AST.__new__(getattr(ast, identifier)) for identifier in listIdentifiersBe if not getattr(ast, identifier).__subclasses__()]
+listNodes.extend([ast.Constant(1), Make.Add(), Make.And(), NameSubclassed('cake'), None, 'Name', 1, [ast.Name('cake')]])
+
+class TestBeExact:
+	"""Test suite for the equivalence of BeExact and Be."""
+
+	@pytest.mark.parametrize("identifier", listIdentifiersBe)
+	def testSameAsBe(self, identifier: str) -> None:
+		"""Test each class predicate is `True` for the same objects as the predicate of `Be`."""
+		predicateBe: Callable[[Any], Any] = getattr(Be, identifier)
+		predicateExact: Callable[[Any], Any] = getattr(BeExact, identifier)
+		assert [predicateExact(node) for node in listNodes] == [predicateBe(node) for node in listNodes]
+
+	@pytest.mark.parametrize(("buildPredicates", "source"), [
+		(lambda be: be.Name.idIs(IfThis.isIdentifier('cake')), 'cake + pie'),
+		(lambda be: be.Call.funcIs(be.Attribute.attrIs(IfThis.isIdentifier('bake'))), 'oven.bake(cake)'),
+		(lambda be: be.Assign.targetsIs(be.at(0, be.Name)), 'cake = pie = 1'),
+		(lambda be: be.BinOp.opIs(be.Add), 'cake + pie - 1'),
+	])
+	def testAttributePredicatesSameAsBe(self, buildPredicates: Callable[[type[Be]], Callable[[ast.AST], Any]], source: str) -> None:
+		"""Test attribute predicates match the same nodes as the predicates of `Be`."""
+		astModule = ast.parse(source)
+		listExpected = NodeTourist(buildPredicates(Be), Then.extractIt).captureMatches(astModule)
+		assert listExpected
+		assert NodeTourist(buildPredicates(BeExact), Then.extractIt).captureMatches(astModule) == listExpected
+
+	def testSubclassDefinedLater(self) -> None:
+		"""Test a node of a subclass defined after import matches through `isinstance`."""
+		class AddLater(ast.Add):
+			pass
+		assert BeExact.Add(AddLater())
+		assert BeExact.operator(AddLater())
+		assert not BeExact.Sub(AddLater())
+
+	def testMetadata(self) -> None:
+		"""Test `metadataOfPredicate` reads `BeExact` predicates as it reads `Be` predicates."""
+		assert metadataOfPredicate(BeExact.Name) == metadataOfPredicate(Be.Name)
+		predicateMetadata = metadataOfPredicate(BeExact.Name.idIs(IfThis.isIdentifier('cake')))
+		assert (predicateMetadata.kind, predicateMetadata.nodeTypes, predicateMetadata.attributePath) == ('attribute', (ast.Name,), ('id',))
+		assert compilePredicate(BeExact.Name.idIs(IfThis.isIdentifier('cake')))(ast.Name('cake'))
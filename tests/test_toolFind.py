@@ -0,0 +1,110 @@
+"""Tests for Find."""
+# pyright: standard
+from astToolkit import Be, Find, IfThis, Make, metadataOfPredicate, NodeTourist, Then
+from astToolkit._toolFind import _dictionaryShape2Factory
+from astToolkit._toolkitNodeVisitor import nodeTypesOfPredicate
+from collections.abc import Callable
+from typing import Any
+import ast
+import pytest
+
+sourceBakery: str = '''
+x = 1
+x, y = 2, 3
+oven = np.zeros(3)
+def bake(flour, sugar=2, *rest, crust=None):
+	dough = flour.mix(sugar)[0]
+	if dough:
+		return
+	return bake(dough, crust=crust)
+def rise():
+	return x
+'''
+
+listPairsFindBe: list[tuple[Find, Callable[[ast.AST], Any]]] = [
+	(Find.Name, Be.Name),
+	(Find.Assign.targets.at(0).Name.id.equal('x'), Be.Assign.targetsIs(Be.at(0, Be.Name.idIs(IfThis.isIdentifier('x'))))),
+	(Find.Assign.targets.at(0).Tuple, Be.Assign.targetsIs(Be.at(0, Be.Tuple))),
+	(Find.Assign.value.Call.func.Attribute.attr.equal('zeros'), Be.Assign.valueIs(Be.Call.funcIs(Be.Attribute.attrIs(IfThis.isIdentifier('zeros'))))),
+	(Find.Call.func.Name.id.equal('bake'), IfThis.isCallIdentifier('bake')),
+	(Find.arg.arg.equal('sugar'), IfThis.is_argIdentifier('sugar')),
+	(Find.keyword.arg.equal('crust'), IfThis.is_keywordIdentifier('crust')),
+	(Find.Return.value, Be.Return.valueIs(lambda value: value is not None)),
+	(Find.FunctionDef.body.any.Return.value.Name, Be.FunctionDef.bodyIs(lambda body: any(Be.Return.valueIs(Be.Name)(statement) for statement in body))),
+	(Find.FunctionDef.body.all.Return, Be.FunctionDef.bodyIs(lambda body: all(Be.Return(statement) for statement in body))),
+	(Find.expr.Name, Be.Name),
+]
+
+@pytest.fixture
+def astModuleBakery() -> ast.Module:
+	return ast.parse(sourceBakery)
+
+class TestFind:
+	"""Test suite for the paths, compiled predicates, and node classes of `Find` queries."""
+
+	@pytest.mark.parametrize(("find", "predicate"), listPairsFindBe, ids=[repr(find) for find, _predicate in listPairsFindBe])
+	def testEquivalentToBe(self, find: Find, predicate: Callable[[ast.AST], Any], astModuleBakery: ast.Module) -> None:
+		"""Test the query has the same truth value as the equivalent `Be` chain for every node."""
+		listNodes = list(ast.walk(astModuleBakery))
+		assert [bool(find(node)) for node in listNodes] == [bool(predicate(node)) for node in listNodes]
+
+	def testAtMissingElement(self) -> None:
+		"""Test `at` is `False`, not an error, if the `list` has no such element."""
+		assert not Find.Return.value.Tuple.elts.at(3)(ast.parse('return 1, 2').body[0])
+		assert Find.Return.value.Tuple.elts.at(-1).Constant.value.equal(2)(ast.parse('return 1, 2').body[0])
+
+	def testNodeTypes(self) -> None:
+		"""Test the query exposes the classes at the start of the path, for the visitors."""
+		assert Find.Assign.targets.at(0).Name.nodeTypes == (ast.Assign,)
+		assert Find.expr.Name.id.nodeTypes == (ast.Name,)
+		assert Find.Name.Call.nodeTypes == ()
+		assert nodeTypesOfPredicate(Find.Call.func) == (ast.Call,)
+		assert nodeTypesOfPredicate(Find.Call.func.predicate) == (ast.Call,)
+		assert metadataOfPredicate(Find.Call).kind == 'opaque'
+
+	def testVisitorAndCombinators(self, astModuleBakery: ast.Module) -> None:
+		"""Test a query is `findThis` of a visitor and an antecedent of `IfThis.isAllOf`."""
+		listIdentifiers = NodeTourist(Find.FunctionDef.body.any.Return.value.Name.id.equal('x'), Then.extractIt(lambda node: node.name)).captureMatches(astModuleBakery)
+		assert listIdentifiers == ['rise']
+		assert len(NodeTourist(IfThis.isAllOf(Be.Assign, Find.Assign.targets.at(0).Name), Then.extractIt).captureMatches(astModuleBakery)) == 3
+
+	def testCompiledOnceAndCachedByShape(self) -> None:
+		"""Test the compiled predicate is kept, and queries with the same shape share the compiled code."""
+		find = Find.Name.id.equal('x')
+		assert find.predicate is find.predicate
+		assert Find.Name.id.equal('y').predicate.__code__ is find.predicate.__code__
+		assert (('class', None), ('attribute', 'id'), ('equal', None)) in _dictionaryShape2Factory
+
+	def testFieldBeforeClassWins(self) -> None:
+		"""Test a name that is both a field of the preceding class and a class in `ast` is the field."""
+		assert Find.keyword.arg.listSteps[-1] == ('attribute', 'arg')
+		assert Find.Subscript.slice.listSteps[-1] == ('attribute', 'slice')
+		assert Find.arguments.args.at(0).arg.listSteps[-1] == ('class', ast.arg)
+
+	def testAttributeOfPositionWithoutPosition(self) -> None:
+		"""Test an attribute of the position, such as `lineno`, is `None` for a node without a position, and is read for a node with one."""
+		assert not Find.Name.lineno.equal(1)(Make.Name('x'))
+		assert not Find.Name.lineno(Make.Name('x'))
+		assert Find.Name.lineno.equal(1)(ast.parse('x').body[0].value)
+		assert Find.Expr.value.Name.end_col_offset.equal(1)(ast.parse('x').body[0])
+
+	@pytest.mark.parametrize("buildFind", [
+		lambda: Find.id,
+		lambda: Find.Name.attr,
+		lambda: Find.Name.notAnything,
+		lambda: Find.Name.id.equal('x').Name,
+	], ids=['fieldWithoutClass', 'fieldOfOtherClass', 'unknownIdentifier', 'stepAfterEqual'])
+	def testInvalidPath(self, buildFind: Callable[[], Find]) -> None:
+		"""Test an invalid step raises `AttributeError` when the query is built."""
+		with pytest.raises(AttributeError):
+			buildFind()
+
+	def testRepr(self) -> None:
+		"""Test the representation of a query is its path."""
+		assert repr(Find.Assign.targets.at(0).Name.id.equal('x')) == "Find.Assign.targets.at(0).Name.id.equal('x')"
+		assert repr(Find.FunctionDef.body.any.Return) == 'Find.FunctionDef.body.any.Return'
+
+	def testVisitorCallsCompiledPredicate(self) -> None:
+		"""Test a visitor replaces the query with its compiled function."""
+		find = Find.Name.id.equal('x')
+		assert NodeTourist(find, Then.extractIt).findThis is find.predicate
@@ -0,0 +1,50 @@
+"""Tests for mapPathFilenames and rewritePathFilenames."""
+# pyright: standard
+from astToolkit import Be, DOT, IfThis, Make, mapPathFilenames, NodeChanger, NodeTourist, rewritePathFilenames, Then
+from pathlib import Path
+import ast
+import pytest
+
+def identifiersFunctionDef(astModule: ast.Module) -> list[str]:
+	return NodeTourist(Be.FunctionDef, DOT.name).captureMatches(astModule)
+
+def renameFlourToRye(astModule: ast.Module) -> None:
+	NodeChanger(IfThis.isNameIdentifier("flour"), Then.replaceWith(Make.Name("rye"))).visit(astModule)
+
+@pytest.fixture
+def listPathFilenamesKitchen(tmp_path: Path) -> list[Path]:
+	listPathFilenames: list[Path] = []
+	for index in range(13):
+		pathFilename = tmp_path / f"recipe{index}.py"
+		pathFilename.write_text(f"def bake{index}(flour):\n\treturn flour * {index}\n\ndef serve{index}():\n\tpass\n", encoding="utf-8")
+		listPathFilenames.append(pathFilename)
+	return listPathFilenames
+
+class TestMapPathFilenames:
+	"""Test suite for running an action on many modules in parallel processes."""
+
+	@pytest.mark.parametrize("maxWorkers,chunksize", [(None, None), (1, None), (2, 1), (3, 5)])
+	def testResultsInOrderOfPaths(self, listPathFilenamesKitchen: list[Path], maxWorkers: int | None, chunksize: int | None) -> None:
+		"""Test mapPathFilenames returns one result per path, in the order of the paths."""
+		listResults = mapPathFilenames(identifiersFunctionDef, listPathFilenamesKitchen, maxWorkers=maxWorkers, chunksize=chunksize)
+		assert listResults == [[f"bake{index}", f"serve{index}"] for index in range(13)]
+
+	def testEmpty(self) -> None:
+		"""Test mapPathFilenames with no paths returns an empty list."""
+		assert mapPathFilenames(identifiersFunctionDef, []) == []
+
+	def testSyntaxErrorPropagates(self, tmp_path: Path) -> None:
+		"""Test an exception in a worker is raised to the caller."""
+		pathFilename = tmp_path / "burnt.py"
+		pathFilename.write_text("def burnt(:\n", encoding="utf-8")
+		with pytest.raises(SyntaxError):
+			mapPathFilenames(identifiersFunctionDef, [pathFilename])
+
+class TestRewritePathFilenames:
+	"""Test suite for rewriting many modules in parallel processes."""
+
+	def testRewrittenSource(self, listPathFilenamesKitchen: list[Path]) -> None:
+		"""Test rewritePathFilenames returns the changed source of each file without writing the file."""
+		listPythonSource = rewritePathFilenames(renameFlourToRye, listPathFilenamesKitchen, maxWorkers=2)
+		assert listPythonSource[7] == "def bake7(flour):\n    return rye * 7\n\ndef serve7():\n    pass"
+		assert "flour" in listPathFilenamesKitchen[7].read_text(encoding="utf-8")
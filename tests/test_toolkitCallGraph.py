@@ -0,0 +1,58 @@
+"""Tests for CallGraph."""
+# pyright: standard
+from astToolkit import CallGraph
+import ast
+import pytest
+
+sourceKitchen: str = '''
+def bake(flour):
+	dough = knead(flour)
+	cake = rise(dough) + frost(dough)
+	return cake
+def knead(flour):
+	return fold(flour)
+def fold(flour):
+	return knead(flour[1:]) if flour else flour
+def rise(dough):
+	def wait(minutes):
+		return proof(minutes)
+	return wait(dough)
+def proof(minutes):
+	return minutes.oven.proof()
+def frost(cake):
+	return frost(cake[1:]) + decorate(cake)
+def decorate(cake):
+	return cake
+'''
+
+@pytest.fixture
+def callGraphKitchen() -> CallGraph:
+	return CallGraph(ast.parse(sourceKitchen))
+
+class TestCallGraph:
+	"""Test suite for the callees, the recursive functions, and the order of CallGraph."""
+
+	def testCalleesOf(self, callGraphKitchen: CallGraph) -> None:
+		"""Test the callees are the functions of the module called by name, including from nested functions, in the order of their first call."""
+		assert callGraphKitchen.calleesOf('bake') == ('knead', 'rise', 'frost')
+		assert callGraphKitchen.calleesOf('rise') == ('proof', 'wait')
+		assert callGraphKitchen.calleesOf('proof') == ()
+
+	def testRecursive(self, callGraphKitchen: CallGraph) -> None:
+		"""Test the functions in a cycle, or that call themselves, are recursive."""
+		assert callGraphKitchen.setRecursive == {'knead', 'fold', 'frost'}
+		assert {frozenset(component) for component in callGraphKitchen.listComponents if len(component) > 1} == {frozenset({'knead', 'fold'})}
+
+	def testComponentsCalleesFirst(self, callGraphKitchen: CallGraph) -> None:
+		"""Test each strongly connected component comes after the components that it calls."""
+		dictionaryPosition = {identifier: position for position, component in enumerate(callGraphKitchen.listComponents) for identifier in component}
+		for identifier, callees in callGraphKitchen.dictionaryIdentifier2Callees.items():
+			assert all(dictionaryPosition[callee] <= dictionaryPosition[identifier] for callee in callees)
+
+	def testOrderInlining(self, callGraphKitchen: CallGraph) -> None:
+		"""Test the order skips recursive functions and the functions that only they call, and puts callees first."""
+		listOrder = callGraphKitchen.orderInlining('bake')
+		assert set(listOrder) == {'rise', 'wait', 'proof'}
+		assert listOrder.index('proof') < listOrder.index('wait') < listOrder.index('rise')
+		assert callGraphKitchen.reachableFrom('bake') == {'knead', 'fold', 'rise', 'wait', 'proof', 'frost', 'decorate'}
+		assert callGraphKitchen.reachableFrom('knead') == {'knead', 'fold'}
@@ -0,0 +1,109 @@
+"""Tests for CodeTemplate."""
+# pyright: standard
+from astToolkit import Be, CodeTemplate, Make, metadataOfPredicate, NodeChanger, NodeTourist, Then
+from typing import Any
+import ast
+import pytest
+
+sourceBakery: str = '''
+dough = flour + 2 * flour
+crust = flour + 2 * sugar
+icing = bake(1) + sugar * bake(1)
+count = count + 1
+def ident(cake):
+	return cake
+def other(cake):
+	return pie
+'''
+
+@pytest.fixture
+def astModuleBakery() -> ast.Module:
+	return ast.parse(sourceBakery)
+
+def unparseBindings(bindings: dict[str, Any] | None) -> dict[str, str] | None:
+	if bindings is None:
+		return None
+	return {placeholder: value if isinstance(value, str) else ast.unparse(value) for placeholder, value in bindings.items()}
+
+class TestCodeTemplate:
+	"""Test suite for matching, binding, and substituting templates."""
+
+	def testRepeatedPlaceholderMustBeEqual(self, astModuleBakery: ast.Module) -> None:
+		"""Test a placeholder that appears twice matches only structurally equal nodes."""
+		codeTemplate = CodeTemplate('$a + $b * $a')
+		listBindings = NodeTourist(codeTemplate, lambda node: unparseBindings(codeTemplate.bindingsOf(node))).captureMatches(astModuleBakery)
+		assert listBindings == [{'a': 'flour', 'b': '2'}, {'a': 'bake(1)', 'b': 'sugar'}]
+
+	@pytest.mark.parametrize(("template", "source", "expected"), [
+		('$x = $x + 1', 'count = count + 1', {'x': 'count'}),
+		('$x = $x + 1', 'count = other + 1', None),
+		('$_ + $_', 'a + b', {}),
+		('$f($_, key=$k)', 'sorted(items, key=len)', {'f': 'sorted', 'k': 'len'}),
+		('$f($_, key=$k)', 'sorted(items, reverse=True)', None),
+		('self.$attr', 'self.cake', {'attr': 'cake'}),
+		('1', '1.0', None),
+		('$a', 'anything(at=all)', {'a': 'anything(at=all)'}),
+	])
+	def testBindingsOf(self, template: str, source: str, expected: dict[str, str] | None) -> None:
+		"""Test the bindings of expression, identifier, and wildcard placeholders."""
+		node = ast.parse(source).body[0]
+		codeTemplate = CodeTemplate(template)
+		if isinstance(codeTemplate.astTemplate, ast.expr):
+			node = node.value
+		assert unparseBindings(codeTemplate.bindingsOf(node)) == expected
+		assert codeTemplate(node) is (expected is not None)
+
+	def testStatementTemplate(self, astModuleBakery: ast.Module) -> None:
+		"""Test a statement template with identifier placeholders, in a `list` of statements."""
+		codeTemplate = CodeTemplate('''
+			def $name($parameter):
+				return $parameter
+		''')
+		assert NodeTourist(codeTemplate, codeTemplate.bindingsOf).captureMatches(astModuleBakery) == [{'name': 'ident', 'parameter': 'cake'}]
+
+	def testStatementPlaceholder(self) -> None:
+		"""Test a statement placeholder matches any one statement."""
+		codeTemplate = CodeTemplate('while $test:\n\t$step')
+		whileStatement = ast.parse('while going:\n\tstep += 1').body[0]
+		assert unparseBindings(codeTemplate.bindingsOf(whileStatement)) == {'test': 'going', 'step': 'step += 1'}
+		assert not codeTemplate(ast.parse('while going:\n\tstep += 1\n\tstep -= 1').body[0])
+
+	def testNodeTypes(self) -> None:
+		"""Test the visitors dispatch on the class of the root of the template."""
+		assert CodeTemplate('$a + $b').nodeTypes == (ast.BinOp,)
+		assert CodeTemplate('$a').nodeTypes is None
+		assert metadataOfPredicate(CodeTemplate('return $a')).nodeTypes == (ast.Return,)
+		codeTemplate = CodeTemplate('$a + $b')
+		assert NodeTourist(codeTemplate, Then.extractIt).findThis is codeTemplate.predicate
+
+	def testSubclassOfTemplateClassMatches(self) -> None:
+		"""Test a node made by `Make` matches the template."""
+		assert CodeTemplate('$a + 1')(Make.BinOp(Make.Name('cake'), Make.Add(), Make.Constant(1)))
+
+	def testSubstitute(self) -> None:
+		"""Test placeholders are filled with copies, identifiers, and lists of statements."""
+		cake = Make.Name('cake')
+		astAST = CodeTemplate('$target = $value * $value').substitute(target='pie', value=cake)
+		assert ast.unparse(astAST) == 'pie = cake * cake'
+		assert isinstance(astAST.targets[0].ctx, ast.Store)
+		assert astAST.value.left is not cake
+		astAST = CodeTemplate('def $name():\n\t$body').substitute({'name': Make.Name('bake'), 'body': [Make.Pass(), Make.Return()]})
+		assert ast.unparse(astAST) == 'def bake():\n    pass\n    return'
+
+	def testReplaceWith(self, astModuleBakery: ast.Module) -> None:
+		"""Test the action fills the replacement with the bindings of each match."""
+		codeTemplate = CodeTemplate('$a + $b * $a')
+		NodeChanger(codeTemplate, codeTemplate.replaceWith('$a * (1 + $b)')).visit(astModuleBakery)
+		listValues = [ast.unparse(node.value) for node in astModuleBakery.body if Be.Assign(node)]
+		assert listValues == ['flour * (1 + 2)', 'flour + 2 * sugar', 'bake(1) * (1 + sugar)', 'count + 1']
+
+	@pytest.mark.parametrize("template", ['$a +', 'a = 1\nb = 2'])
+	def testInvalidTemplate(self, template: str) -> None:
+		"""Test a template that is not one expression or statement raises `ValueError`."""
+		with pytest.raises(ValueError):  # noqa: PT011
+			CodeTemplate(template)
+
+	def testSubstituteMissingPlaceholder(self) -> None:
+		"""Test substituting without the value of a placeholder raises `ValueError`."""
+		with pytest.raises(ValueError, match=r'\$b'):
+			CodeTemplate('$a + $b').substitute(a='cake')
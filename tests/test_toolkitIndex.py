@@ -0,0 +1,231 @@
+"""Tests for TreeIndex, DescendantMatchIndex, NodeClassIndex, and IdentifierIndex."""
+# pyright: standard
+from astToolkit import (
+	Be, DescendantMatchIndex, IdentifierIndex, IfThis, Make, NodeChanger, NodeChangerSuite, NodeClassIndex, NodeTourist, Then, TreeIndex)
+from astToolkit._toolkitIndex import _IndexRebuiltAfterChange
+from functools import reduce
+from typing import Any
+import ast
+import pytest
+
+sourcePantry: str = '''
+def stock(shelf):
+	for jar in shelf:
+		if jar.empty:
+			refill(jar)
+	return shelf
+	print("unreachable")
+'''
+
+@pytest.fixture
+def astModulePantry() -> ast.Module:
+	return ast.parse(sourcePantry)
+
+class TestTreeIndex:
+	"""Test suite for the parent, path, and sibling queries of TreeIndex."""
+
+	def testParentFieldNameIndex(self, astModulePantry: ast.Module) -> None:
+		"""Test parentOf, fieldNameOf, and indexOf agree with the tree."""
+		treeIndex = TreeIndex(astModulePantry)
+		functionDef = astModulePantry.body[0]
+		assert isinstance(functionDef, ast.FunctionDef)
+		forStatement = functionDef.body[0]
+		assert treeIndex.parentOf(forStatement) is functionDef
+		assert treeIndex.fieldNameOf(forStatement) == "body"
+		assert treeIndex.indexOf(forStatement) == 0
+		assert isinstance(forStatement, ast.For)
+		assert treeIndex.indexOf(forStatement.iter) is None
+		assert treeIndex.parentOf(astModulePantry) is None
+		assert treeIndex.fieldNameOf(astModulePantry) is None
+
+	def testEveryNodeIsIndexed(self, astModulePantry: ast.Module) -> None:
+		"""Test every node with one place in the tree has the parent that `ast.iter_child_nodes` reports."""
+		treeIndex = TreeIndex(astModulePantry)
+		for node in ast.walk(astModulePantry):
+			assert node in treeIndex
+			for child in ast.iter_child_nodes(node):
+				if not isinstance(child, (ast.expr_context, ast.operator)):
+					assert treeIndex.parentOf(child) is node
+
+	def testPathToAndAncestors(self, astModulePantry: ast.Module) -> None:
+		"""Test pathTo leads from the root to the node and ancestors ends with the root."""
+		treeIndex = TreeIndex(astModulePantry)
+		callRefill = NodeTourist(IfThis.isCallIdentifier("refill"), Then.extractIt).captureFirstMatch(astModulePantry)
+		assert callRefill is not None
+		listSteps = treeIndex.pathTo(callRefill)
+		assert listSteps == [("body", 0), ("body", 0), ("body", 0), ("body", 0), ("value", None)]
+		def followStep(node: Any, step: tuple[str, int | None]) -> Any:
+			fieldName, index = step
+			return getattr(node, fieldName) if index is None else getattr(node, fieldName)[index]
+		assert reduce(followStep, listSteps, astModulePantry) is callRefill
+		listAncestors = list(treeIndex.ancestors(callRefill))
+		assert [type(node) for node in listAncestors] == [ast.Expr, ast.If, ast.For, ast.FunctionDef, ast.Module]
+		assert treeIndex.pathTo(astModulePantry) == []
+
+	def testSiblings(self, astModulePantry: ast.Module) -> None:
+		"""Test siblings are the other items of the same `list` field."""
+		treeIndex = TreeIndex(astModulePantry)
+		returnStatement = NodeTourist(Be.Return, Then.extractIt).captureFirstMatch(astModulePantry)
+		assert returnStatement is not None
+		listSiblings = treeIndex.siblings(returnStatement)
+		assert [type(node) for node in listSiblings] == [ast.For, ast.Expr]
+		index = treeIndex.indexOf(returnStatement)
+		assert index is not None
+		assert ast.unparse(listSiblings[index]) == "print('unreachable')"
+		assert treeIndex.siblings(returnStatement.value) == []  # pyright: ignore[reportArgumentType]
+
+	def testHasAncestor(self, astModulePantry: ast.Module) -> None:
+		"""Test hasAncestor makes a predicate usable as `findThis`."""
+		treeIndex = TreeIndex(astModulePantry)
+		listIdentifiers = NodeTourist(IfThis.isAllOf(Be.Name, treeIndex.hasAncestor(Be.If)), Then.extractIt).captureMatches(astModulePantry)
+		assert [name.id for name in listIdentifiers] == ["jar", "refill", "jar"]
+		assert not treeIndex.hasAncestor(Be.Module)(Make.Name("jar"))
+
+	def testNodeNotInTree(self, astModulePantry: ast.Module) -> None:
+		"""Test a node that is not in the tree raises ValueError."""
+		with pytest.raises(ValueError, match="not in the tree"):
+			TreeIndex(astModulePantry).parentOf(Make.Name("jar"))
+
+sourceNestedCalls: str = '''
+bake(bake(flour), mix(bake(sugar, bake(salt))))
+mix(water)
+'''
+
+class TestDescendantMatchIndex:
+	"""Test suite for the bottom-up descendant-match queries of DescendantMatchIndex."""
+
+	@pytest.mark.parametrize("identifier", ["bake", "mix", "knead"])
+	def testSameAnswersAsIfThis(self, identifier: str) -> None:
+		"""Test the index answers as `IfThis.matchesNoDescendant` and `IfThis.matchesMeButNotAnyDescendant` for every node."""
+		astModule = ast.parse(sourceNestedCalls)
+		predicate = IfThis.isCallIdentifier(identifier)
+		descendantMatchIndex = DescendantMatchIndex(predicate)
+		for node in ast.walk(astModule):
+			assert descendantMatchIndex.matchesNoDescendant(node) == IfThis.matchesNoDescendant(predicate)(node)
+			assert descendantMatchIndex.matchesMeButNotAnyDescendant(node) == IfThis.matchesMeButNotAnyDescendant(predicate)(node)
+
+	def testInnermostMatches(self) -> None:
+		"""Test `matchesMeButNotAnyDescendant` as `findThis` finds the innermost calls."""
+		astModule = ast.parse(sourceNestedCalls)
+		descendantMatchIndex = DescendantMatchIndex(IfThis.isCallIdentifier("bake"))
+		listInnermost = NodeTourist(descendantMatchIndex.matchesMeButNotAnyDescendant, Then.extractIt).captureMatches(astModule)
+		assert [ast.unparse(node) for node in listInnermost] == ["bake(flour)", "bake(salt)"]
+
+	def testPredicateCalledOncePerNode(self) -> None:
+		"""Test the predicate is called at most once per node, however many nodes are asked about."""
+		astModule = ast.parse(sourceNestedCalls)
+		listCalled: list[ast.AST] = []
+		def predicateCounting(node: ast.AST) -> bool:
+			listCalled.append(node)
+			return isinstance(node, ast.Call)
+		descendantMatchIndex = DescendantMatchIndex(predicateCounting)
+		for node in ast.walk(astModule):
+			descendantMatchIndex.hasMatchingDescendant(node)
+		assert len(listCalled) == len({id(node) for node in listCalled})
+
+class TestNodeClassIndex:
+	"""Test suite for the per-class queries and the invalidation of NodeClassIndex."""
+
+	@pytest.mark.parametrize("nodeTypes", [ast.Name, ast.stmt, ast.expr, (ast.Call, ast.Return), (ast.expr, ast.Name), ast.Global, ast.AST])
+	def testNodesOfSameAsNodeTourist(self, nodeTypes: type[ast.AST] | tuple[type[ast.AST], ...], astModulePantry: ast.Module) -> None:
+		"""Test `nodesOf` returns the nodes that `NodeTourist` captures, in the same order."""
+		listExpected = NodeTourist(lambda node: isinstance(node, nodeTypes), Then.extractIt).captureMatches(astModulePantry)
+		assert NodeClassIndex(astModulePantry).nodesOf(nodeTypes) == listExpected
+
+	def testIterMatchesCallsOnlyCandidates(self, astModulePantry: ast.Module) -> None:
+		"""Test `iterMatches` calls `findThis` only on the nodes of the classes it can match."""
+		nodeClassIndex = NodeClassIndex(astModulePantry)
+		listCalled: list[ast.AST] = []
+		predicate = IfThis.isCallIdentifier('refill')
+		def findThis(node: ast.AST) -> bool:
+			listCalled.append(node)
+			return predicate(node)
+		findThis.__annotations__ = predicate.__annotations__
+		assert [ast.unparse(node) for node in nodeClassIndex.iterMatches(findThis)] == ['refill(jar)']
+		assert all(isinstance(node, ast.Call) for node in listCalled)
+		assert list(nodeClassIndex.iterMatches(lambda node: isinstance(node, ast.Return))) == nodeClassIndex.nodesOf(ast.Return)
+
+	@pytest.mark.parametrize("factoryNodeChanger", [
+		lambda: NodeChanger(Be.Expr, Then.removeIt),
+		lambda: NodeChangerSuite([(Be.Expr, Then.removeIt)]),
+	], ids=['NodeChanger', 'NodeChangerSuite'])
+	def testWatchRebuildsAfterChange(self, factoryNodeChanger: Any, astModulePantry: ast.Module) -> None:
+		"""Test a watched transformer makes the index rebuild itself, and a transformer that changes nothing does not."""
+		nodeClassIndex = NodeClassIndex(astModulePantry)
+		assert len(nodeClassIndex.nodesOf(ast.Expr)) == 2
+		nodeChanger = nodeClassIndex.watch(factoryNodeChanger())
+		nodeChanger.visit(astModulePantry)
+		assert nodeClassIndex.isStale
+		assert nodeClassIndex.nodesOf(ast.Expr) == []
+		assert nodeClassIndex.nodesOf(ast.Call) == []
+		nodeChanger.visit(astModulePantry)
+		assert not nodeClassIndex.isStale
+
+	def testSubclassWithoutBuildFailsWhenCreated(self, astModulePantry: ast.Module) -> None:
+		"""Test a subclass of the index base that does not implement `_build` cannot be created."""
+		class IndexWithoutBuild(_IndexRebuiltAfterChange):
+			pass
+		with pytest.raises(TypeError, match="_build"):
+			IndexWithoutBuild(astModulePantry)  # pyright: ignore[reportAbstractUsage]
+
+sourceKitchen: str = '''
+import os.path, numpy as np
+from oven import *
+def bake(flour, *, sugar):
+	dough = flour + mix(flour, sugar=sugar)
+	del dough
+	return bake(oven.flour, sugar=sugar)
+class flour:
+	pass
+'''
+
+class TestIdentifierIndex:
+	"""Test suite for the per-identifier, per-role queries of IdentifierIndex."""
+
+	@pytest.mark.parametrize(("identifier", "roles", "expected"), [
+		('flour', None, ['arg', 'load', 'load', 'attribute', 'def']),
+		('flour', ('load', 'arg'), ['arg', 'load', 'load']),
+		('sugar', 'keyword', ['keyword', 'keyword']),
+		('dough', None, ['store', 'del']),
+		('bake', None, ['def', 'call', 'load']),
+		('os', 'import', ['import']),
+		('np', None, ['import']),
+		('numpy', None, []),
+		('*', None, []),
+	])
+	def testNodesOf(self, identifier: str, roles: Any, expected: list[str]) -> None:
+		"""Test `nodesOf` returns the nodes of each role in document order."""
+		identifierIndex = IdentifierIndex(ast.parse(sourceKitchen))
+		dictionaryClass2Role = {ast.arg: 'arg', ast.Attribute: 'attribute', ast.Call: 'call', ast.FunctionDef: 'def', ast.ClassDef: 'def', ast.keyword: 'keyword', ast.alias: 'import'}
+		def roleOf(node: ast.AST) -> str:
+			if isinstance(node, ast.Name):
+				return {ast.Load: 'load', ast.Store: 'store', ast.Del: 'del'}[type(node.ctx)]
+			return dictionaryClass2Role[type(node)]
+		assert [roleOf(node) for node in identifierIndex.nodesOf(identifier, roles)] == expected
+
+	def testSameAsIfThis(self) -> None:
+		"""Test the nodes of a role are the nodes that the equivalent `IfThis` predicate matches."""
+		astModule = ast.parse(sourceKitchen)
+		identifierIndex = IdentifierIndex(astModule)
+		assert identifierIndex.nodesOf('bake', 'call') == NodeTourist(IfThis.isCallIdentifier('bake'), Then.extractIt).captureMatches(astModule)
+		assert identifierIndex.nodesOf('sugar', 'arg') == NodeTourist(IfThis.is_argIdentifier('sugar'), Then.extractIt).captureMatches(astModule)
+
+	def testIdentifiersOf(self) -> None:
+		"""Test `identifiersOf` and `in` report the identifiers of the tree."""
+		identifierIndex = IdentifierIndex(ast.parse(sourceKitchen))
+		assert identifierIndex.identifiersOf('def') == {'bake', 'flour'}
+		assert identifierIndex.identifiersOf(('store', 'del')) == {'dough'}
+		assert 'mix' in identifierIndex
+		assert 'pie' not in identifierIndex
+
+	def testWatchRebuildsAfterChange(self) -> None:
+		"""Test a watched transformer makes the index rebuild itself."""
+		astModule = ast.parse(sourceKitchen)
+		identifierIndex = IdentifierIndex(astModule)
+		identifierIndex.watch(NodeChanger(Be.Delete, Then.removeIt)).visit(astModule)
+		assert identifierIndex.nodesOf('dough', 'del') == []
+
+	def testUnknownRole(self) -> None:
+		"""Test an unknown role raises `ValueError`."""
+		with pytest.raises(ValueError, match='parameter'):
+			IdentifierIndex(ast.parse(sourceKitchen)).nodesOf('flour', 'parameter')
@@ -0,0 +1,390 @@
+"""Tests for NodeTourist and NodeChanger using parametrized tests and DRY principles."""
+# pyright: standard
+from astToolkit import (
+	Be, DOT, extractFunctionDef, Grab, IfThis, Make, NodeChanger, NodeChangerSuite, NodeTourist, NodeTouristSuite, StopTraversal,
+	Then, walkPostOrder, walkPreOrder)
+from astToolkit._toolkitNodeVisitor import nodeTypesOfPredicate
+from collections.abc import Callable
+from itertools import islice
+from typing import Any
+import ast
+import pytest
+
+sourceKitchen: str = '''
+def bakeBread(flour, water):
+	dough = mix(flour, water)
+	return knead(dough) + 13
+
+def boilWater(water):
+	return heat(water, 89)
+
+class Oven:
+	def preheat(self, temperature):
+		return self.dial(temperature + 233)
+'''
+
+class TestNodeTypesOfPredicate:
+	"""Test suite for inferring candidate node classes from predicate annotations."""
+
+	@pytest.mark.parametrize("predicate,nodeTypesExpected", [
+		(Be.FunctionDef, (ast.FunctionDef,)),
+		(Be.Add, (ast.Add,)),
+		(Be.expr, (ast.expr,)),
+		(Be.Assign.valueIs(IfThis.isCallIdentifier("mix")), (ast.Assign,)),
+		(IfThis.isCallIdentifier("heat"), (ast.Call,)),
+		(IfThis.isNestedNameIdentifier("water"), (ast.Attribute, ast.Name, ast.Starred, ast.Subscript)),
+		(IfThis.isAllOf(Be.expr, Be.Name, IfThis.matchesNoDescendant(Be.Call)), (ast.Name,)),
+		(IfThis.isAllOf(Be.Name, Be.Call), ()),
+		(IfThis.isAnyOf(Be.Return, IfThis.isCallIdentifier("heat")), (ast.Call, ast.Return)),
+		(IfThis.matchesMeButNotAnyDescendant(Be.Call), (ast.Call,)),
+	])
+	def testNodeTypesFromTypeIs(self, predicate: Callable[[ast.AST], bool], nodeTypesExpected: tuple[type[ast.AST], ...]) -> None:
+		"""Test the `TypeIs` target of `Be` and `IfThis` predicates, and of their combinations, is recognized."""
+		assert nodeTypesOfPredicate(predicate) == nodeTypesExpected
+
+	@pytest.mark.parametrize("predicate", [
+		lambda node: isinstance(node, ast.Name),
+		IfThis.isAnyOf(Be.Name, lambda node: isinstance(node, ast.Call)),
+		IfThis.matchesNoDescendant(Be.Name),
+	])
+	def testNodeTypesUnknown(self, predicate: Callable[[ast.AST], bool]) -> None:
+		"""Test predicates without an `ast.AST` `TypeIs` target are called on every node."""
+		assert nodeTypesOfPredicate(predicate) is None
+
+class TestTypeDispatch:
+	"""Test suite for skipping `findThis` on node classes that cannot match."""
+
+	@staticmethod
+	def countingPredicate(predicate: Callable[[ast.AST], bool], listCalled: list[ast.AST]) -> Callable[[ast.AST], bool]:
+		def workhorse(node: ast.AST) -> bool:
+			listCalled.append(node)
+			return predicate(node)
+		return workhorse
+
+	def testNodeTouristCallsPredicateOnlyOnCandidates(self) -> None:
+		"""Test NodeTourist with `nodeTypes` never calls `findThis` on other classes."""
+		listCalled: list[ast.AST] = []
+		listFound: list[Any] = []
+		NodeTourist(self.countingPredicate(Be.FunctionDef, listCalled), Then.appendTo(listFound), nodeTypes=ast.FunctionDef).visit(ast.parse(sourceKitchen))
+		assert [node.name for node in listFound] == ["bakeBread", "boilWater", "preheat"]
+		assert all(isinstance(node, ast.FunctionDef) for node in listCalled)
+
+	@pytest.mark.parametrize("predicate", [
+		Be.Call,
+		IfThis.isCallIdentifier("heat"),
+		Be.Return.valueIs(Be.BinOp),
+		Be.Name,
+		Be.stmt,
+	])
+	def testNodeTouristSameMatchesAsFullScan(self, predicate: Callable[[ast.AST], bool]) -> None:
+		"""Test dispatch finds the same nodes, in the same order, as calling `findThis` on every node."""
+		astModule = ast.parse(sourceKitchen)
+		listDispatched: list[Any] = []
+		NodeTourist(predicate, Then.appendTo(listDispatched)).visit(astModule)
+		listExhaustive: list[ast.AST] = [node for node in ast.walk(astModule) if predicate(node)]
+		assert sorted(map(id, listDispatched)) == sorted(map(id, listExhaustive))
+
+	def testSubclassOfNodeClassIsCandidate(self) -> None:
+		"""Test instances of subclasses, such as `Make.Add`, are matched by `Be.Add`."""
+		binOp = Make.BinOp(Make.Name("flour"), Make.Add(), Make.Name("water"))
+		assert NodeTourist(Be.Add, Then.extractIt).captureLastMatch(binOp) is binOp.op
+
+	def testNodeChangerWithNodeTypes(self) -> None:
+		"""Test NodeChanger with `nodeTypes` transforms only candidate nodes."""
+		listCalled: list[ast.AST] = []
+		astModule = ast.parse(sourceKitchen)
+		NodeChanger(self.countingPredicate(IfThis.isConstant_value(89), listCalled), Then.replaceWith(Make.Constant(144)), nodeTypes=[ast.Constant]).visit(astModule)
+		assert "heat(water, 144)" in ast.unparse(astModule)
+		assert all(isinstance(node, ast.Constant) for node in listCalled)
+
+class NodeTouristRecursive(ast.NodeVisitor):
+	"""The recursive antecedent-action visitor that `NodeTourist` must be equivalent to."""
+
+	def __init__(self, findThis: Callable[[ast.AST], bool], doThat: Callable[[Any], Any]) -> None:
+		self.findThis = findThis
+		self.doThat = doThat
+
+	def visit(self, node: ast.AST) -> None:
+		if self.findThis(node):
+			self.doThat(node)
+		self.generic_visit(node)
+
+class NodeChangerRecursive(ast.NodeTransformer):
+	"""The recursive antecedent-action transformer that `NodeChanger` must be equivalent to."""
+
+	def __init__(self, findThis: Callable[[ast.AST], bool], doThat: Callable[[Any], Any]) -> None:
+		self.findThis = findThis
+		self.doThat = doThat
+
+	def visit(self, node: ast.AST) -> Any:
+		if self.findThis(node):
+			return self.doThat(node)
+		return super().visit(node)
+
+class TestIterativeTraversal:
+	"""Test suite for the explicit-stack traversal engine."""
+
+	@pytest.mark.parametrize("predicate", [Be.Name, Be.Call, Be.stmt, Be.expr_context, lambda _node: True])
+	def testNodeTouristMatchOrder(self, predicate: Callable[[ast.AST], bool]) -> None:
+		"""Test NodeTourist matches nodes in the same order as the recursive visitor."""
+		astModule = ast.parse(sourceKitchen)
+		listIterative: list[Any] = []
+		listRecursive: list[Any] = []
+		NodeTourist(predicate, Then.appendTo(listIterative)).visit(astModule)
+		NodeTouristRecursive(predicate, Then.appendTo(listRecursive)).visit(astModule)
+		assert listIterative == listRecursive
+
+	@pytest.mark.parametrize("findThis,factoryDoThat", [
+		(Be.Return, lambda: Then.removeIt),
+		(Be.Expr, lambda: Then.insertThisAbove([Make.Pass()])),
+		(Be.Assign, lambda: Then.insertThisBelow([Make.Pass(), Make.Break()])),
+		(IfThis.isNameIdentifier("water"), lambda: Then.replaceWith(Make.Name("milk"))),
+		(Be.Constant, lambda: Then.replaceWith(Make.Constant(610))),
+		(Be.Return.valueIs(Be.BinOp), lambda: Then.replaceWith([])),
+	])
+	def testNodeChangerSameResult(self, findThis: Callable[[ast.AST], bool], factoryDoThat: Callable[[], Callable[[Any], Any]]) -> None:
+		"""Test NodeChanger transforms trees identically to the recursive transformer."""
+		astModuleIterative = ast.parse(sourceKitchen)
+		astModuleRecursive = ast.parse(sourceKitchen)
+		NodeChanger(findThis, factoryDoThat()).visit(astModuleIterative)
+		NodeChangerRecursive(findThis, factoryDoThat()).visit(astModuleRecursive)
+		assert ast.dump(astModuleIterative) == ast.dump(astModuleRecursive)
+
+	def testDeepTreeDoesNotRecurse(self) -> None:
+		"""Test trees deeper than the recursion limit are traversed."""
+		countNames: int = 5000
+		deepExpression = Make.Add.join([Make.Name(f"ingredient{index}") for index in range(countNames)])
+		listFound: list[Any] = []
+		NodeTourist(Be.Name, Then.appendTo(listFound)).visit(deepExpression)
+		assert len(listFound) == countNames
+		assert listFound[0].id == "ingredient0"
+		NodeChanger(Be.Add, Then.replaceWith(Make.Mult())).visit(deepExpression)
+		assert NodeTourist(Be.Add, Then.extractIt).captureLastMatch(deepExpression) is None
+
+	def testWalkPostOrder(self) -> None:
+		"""Test walkPostOrder yields each child before its parent."""
+		binOp = Make.BinOp(Make.Name("flour"), Make.Add(), Make.Constant(13))
+		assert list(walkPostOrder(binOp)) == [binOp.left.ctx, binOp.left, binOp.op, binOp.right, binOp]
+		assert list(walkPreOrder(binOp)) == [binOp, binOp.left, binOp.left.ctx, binOp.op, binOp.right]
+
+class TestEarlyExit:
+	"""Test suite for captureFirstMatch, captureMatches, and StopTraversal."""
+
+	def testCaptureFirstMatch(self) -> None:
+		"""Test captureFirstMatch returns the first match in pre-order and stops."""
+		listCalled: list[ast.AST] = []
+		predicate = TestTypeDispatch.countingPredicate(Be.FunctionDef, listCalled)
+		functionDef = NodeTourist(predicate, Then.extractIt, nodeTypes=ast.FunctionDef).captureFirstMatch(ast.parse(sourceKitchen))
+		assert isinstance(functionDef, ast.FunctionDef)
+		assert functionDef.name == "bakeBread"
+		assert len(listCalled) == 1
+
+	def testCaptureFirstMatchNoMatch(self) -> None:
+		"""Test captureFirstMatch returns `None` when nothing matches."""
+		assert NodeTourist(Be.While, Then.extractIt).captureFirstMatch(ast.parse(sourceKitchen)) is None
+
+	@pytest.mark.parametrize("limit,listExpected", [
+		(None, ["bakeBread", "boilWater", "preheat"]),
+		(0, []),
+		(1, ["bakeBread"]),
+		(2, ["bakeBread", "boilWater"]),
+		(8, ["bakeBread", "boilWater", "preheat"]),
+	])
+	def testCaptureMatchesLimit(self, limit: int | None, listExpected: list[str]) -> None:
+		"""Test captureMatches returns at most `limit` results in traversal order."""
+		assert NodeTourist(Be.FunctionDef, DOT.name).captureMatches(ast.parse(sourceKitchen), limit=limit) == listExpected
+
+	def testStopTraversalFromAction(self) -> None:
+		"""Test an action that raises StopTraversal ends the traversal without an exception."""
+		listFound: list[Any] = []
+		tourist = NodeTourist(Be.Return, Grab.andDoAllOf([Then.appendTo(listFound), Then.stopTraversal]))
+		tourist.visit(ast.parse(sourceKitchen))
+		assert len(listFound) == 1
+		with pytest.raises(StopTraversal):
+			Then.stopTraversal(listFound[0])
+
+	def testIterMatchesIsLazy(self) -> None:
+		"""Test iterMatches visits nodes only as results are requested."""
+		listCalled: list[ast.AST] = []
+		iteratorNames = NodeTourist(TestTypeDispatch.countingPredicate(Be.FunctionDef, listCalled), DOT.name, nodeTypes=ast.FunctionDef).iterMatches(ast.parse(sourceKitchen))
+		assert listCalled == []
+		assert next(iteratorNames) == "bakeBread"
+		assert len(listCalled) == 1
+		assert list(iteratorNames) == ["boilWater", "preheat"]
+		assert len(listCalled) == 3
+
+	def testIterMatchesIslice(self) -> None:
+		"""Test iterMatches yields the same results as captureMatches and works with `itertools.islice`."""
+		astModule = ast.parse(sourceKitchen)
+		tourist = NodeTourist(Be.Name, DOT.id)
+		assert list(tourist.iterMatches(astModule)) == tourist.captureMatches(astModule)
+		assert list(islice(tourist.iterMatches(astModule), 2)) == ["dough", "mix"]
+		assert tourist.nodeCaptured == "mix"
+
+	def testIterMatchesStopTraversal(self) -> None:
+		"""Test iterMatches ends when the action raises StopTraversal."""
+		tourist = NodeTourist(Be.Return, Grab.andDoAllOf([DOT.value, Then.stopTraversal]))
+		assert list(tourist.iterMatches(ast.parse(sourceKitchen))) == []
+
+	@pytest.mark.parametrize("identifier", ["bakeBread", "preheat"])
+	def testExtractFunctionDefFirst(self, identifier: str) -> None:
+		"""Test extractFunctionDef finds the first function with `identifier`."""
+		astModule = ast.parse(sourceKitchen + f"\ndef {identifier}():\n\tpass\n")
+		functionDef = extractFunctionDef(astModule, identifier)
+		assert functionDef is not None
+		assert len(functionDef.args.args) > 0
+
+sourcePantry: str = '''
+flour = 1
+def stock():
+	sugar = 2
+	def refill():
+		salt = 3
+	return lambda: (yeast := 4)
+class Shelf:
+	honey = 5
+'''
+
+class TestPruning:
+	"""Test suite for `pruneIf` and `maxDepth`."""
+
+	pruneScopes: Callable[[ast.AST], bool] = staticmethod(IfThis.isAnyOf(Be.FunctionDef, Be.ClassDef, Be.Lambda))
+
+	def testNodeTouristPruneIf(self) -> None:
+		"""Test NodeTourist does not descend into pruned subtrees, but does test pruned nodes."""
+		astModule = ast.parse(sourcePantry)
+		listNames: list[Any] = NodeTourist(Be.Name, DOT.id, pruneIf=self.pruneScopes).captureMatches(astModule)
+		assert listNames == ["flour"]
+		listDefs: list[Any] = NodeTourist(Be.FunctionDef, DOT.name, pruneIf=self.pruneScopes).captureMatches(astModule)
+		assert listDefs == ["stock"]
+
+	def testPruneIfIsNotAppliedToRoot(self) -> None:
+		"""Test `pruneIf` does not prune the node passed to `visit`."""
+		functionDef = extractFunctionDef(ast.parse(sourcePantry), "stock")
+		assert functionDef is not None
+		assert NodeTourist(Be.Name, DOT.id, pruneIf=self.pruneScopes).captureMatches(functionDef) == ["sugar"]
+
+	@pytest.mark.parametrize("maxDepth,countExpected", [(-1, 0), (0, 1), (1, 4), (2, 11), (None, sum(1 for _node in ast.walk(ast.parse(sourcePantry))))])
+	def testNodeTouristMaxDepth(self, maxDepth: int | None, countExpected: int) -> None:
+		"""Test NodeTourist visits only nodes no deeper than `maxDepth`."""
+		astModule = ast.parse(sourcePantry)
+		assert len(NodeTourist(lambda _node: True, Then.extractIt, maxDepth=maxDepth).captureMatches(astModule)) == countExpected
+		assert len(list(walkPreOrder(astModule, maxDepth=maxDepth))) == countExpected
+
+	def testNodeChangerPruneIf(self) -> None:
+		"""Test NodeChanger does not change nodes inside pruned subtrees."""
+		astModule = ast.parse(sourcePantry)
+		NodeChanger(Be.Constant, Then.replaceWith(Make.Constant(0)), pruneIf=Be.FunctionDef).visit(astModule)
+		assert sorted(node.value for node in ast.walk(astModule) if isinstance(node, ast.Constant)) == [0, 0, 2, 3, 4]
+
+	def testNodeChangerMaxDepth(self) -> None:
+		"""Test NodeChanger does not change nodes deeper than `maxDepth`."""
+		astModule = ast.parse(sourcePantry)
+		NodeChanger(Be.Constant, Then.replaceWith(Make.Constant(0)), maxDepth=2).visit(astModule)
+		assert sorted(node.value for node in ast.walk(astModule) if isinstance(node, ast.Constant)) == [0, 2, 3, 4, 5]
+
+	def testSuiteRejectsPruning(self) -> None:
+		"""Test the suites raise ValueError for a rule with `pruneIf`."""
+		with pytest.raises(ValueError, match="pruneIf"):
+			NodeTouristSuite([NodeTourist(Be.Name, Then.extractIt, pruneIf=Be.Lambda)])
+		with pytest.raises(ValueError, match="pruneIf"):
+			NodeChangerSuite([NodeChanger(Be.Name, Then.extractIt, maxDepth=3)])
+
+class ListRecordingAssignments(list[Any]):
+	"""A `list` that records each assignment to its items."""
+
+	def __init__(self, iterable: list[Any]) -> None:
+		super().__init__(iterable)
+		self.countAssignments: int = 0
+
+	def __setitem__(self, index: Any, value: Any) -> None:
+		self.countAssignments += 1
+		super().__setitem__(index, value)
+
+class TestChangeTracking:
+	"""Test suite for `countReplacements`, `changed`, and no-op avoidance in NodeChanger."""
+
+	@pytest.mark.parametrize("findThis,countExpected", [(Be.While, 0), (Be.FunctionDef, 3), (IfThis.isNameIdentifier("water"), 2), (Be.Constant, 3)])
+	def testCountReplacements(self, findThis: Callable[[ast.AST], bool], countExpected: int) -> None:
+		"""Test NodeChanger counts the nodes to which it applies `doThat`."""
+		nodeChanger = NodeChanger(findThis, Then.extractIt)
+		nodeChanger.visit(ast.parse(sourceKitchen))
+		assert nodeChanger.countReplacements == countExpected
+		assert nodeChanger.changed is (countExpected > 0)
+		nodeChanger.visit(Make.Pass())
+		assert nodeChanger.countReplacements == 0
+
+	def testUnchangedListIsNotRebuilt(self) -> None:
+		"""Test NodeChanger does not assign to a `list` field unless an item of the `list` is replaced."""
+		astModule = ast.parse(sourceKitchen)
+		astModule.body = ListRecordingAssignments(astModule.body)
+		NodeChanger(IfThis.isNameIdentifier("water"), Then.extractIt).visit(astModule)
+		assert astModule.body.countAssignments == 0
+		NodeChanger(Be.ClassDef, Then.removeIt).visit(astModule)
+		assert astModule.body.countAssignments == 1
+		assert len(astModule.body) == 2
+
+	def testNodeChangerSuiteCountReplacements(self) -> None:
+		"""Test NodeChangerSuite counts the replacements of every rule, including the rules applied to replacements."""
+		suite = NodeChangerSuite([
+			(Be.Return, lambda _return: Make.Expr(Make.Name("water"))),
+			(IfThis.isNameIdentifier("water"), Then.replaceWith(Make.Name("milk"))),
+		])
+		suite.visit(ast.parse(sourceKitchen))
+		assert suite.countReplacements == 7
+		assert suite.changed
+
+class TestSuite:
+	"""Test suite for NodeTouristSuite and NodeChangerSuite."""
+
+	def testNodeTouristSuiteSameAsSeparatePasses(self) -> None:
+		"""Test each rule of NodeTouristSuite matches the same nodes, in the same order, as a separate NodeTourist."""
+		astModule = ast.parse(sourceKitchen)
+		listPredicates: list[Callable[[ast.AST], bool]] = [Be.FunctionDef, Be.Name, IfThis.isCallIdentifier("heat"), Be.expr, lambda _node: True]
+		listsFused: list[list[Any]] = [[] for _predicate in listPredicates]
+		NodeTouristSuite([(predicate, Then.appendTo(listFound)) for predicate, listFound in zip(listPredicates, listsFused, strict=True)]).visit(astModule)
+		for predicate, listFused in zip(listPredicates, listsFused, strict=True):
+			listSeparate: list[Any] = []
+			NodeTourist(predicate, Then.appendTo(listSeparate)).visit(astModule)
+			assert listFused == listSeparate
+
+	def testNodeTouristSuiteDispatch(self) -> None:
+		"""Test NodeTouristSuite calls `findThis` of each rule only on candidate classes."""
+		listCalled: list[ast.AST] = []
+		suite = NodeTouristSuite([
+			NodeTourist(TestTypeDispatch.countingPredicate(Be.Return, listCalled), DOT.value, nodeTypes=ast.Return),
+			(Be.FunctionDef, DOT.name),
+		])
+		valueLast, nameLast = suite.captureLastMatches(ast.parse(sourceKitchen))
+		assert isinstance(valueLast, ast.Call)
+		assert nameLast == "preheat"
+		assert len(listCalled) == 3
+		assert all(isinstance(node, ast.Return) for node in listCalled)
+
+	def testNodeTouristSuiteStopTraversalStopsOneRule(self) -> None:
+		"""Test StopTraversal from one rule does not stop the other rules."""
+		listReturn: list[Any] = []
+		listName: list[Any] = []
+		NodeTouristSuite([
+			(Be.Return, Grab.andDoAllOf([Then.appendTo(listReturn), Then.stopTraversal])),
+			(Be.Name, Then.appendTo(listName)),
+		]).visit(ast.parse(sourceKitchen))
+		assert len(listReturn) == 1
+		assert listName[-1].id == "temperature"
+
+	@pytest.mark.parametrize("factoryRules", [
+		lambda: [(IfThis.isNameIdentifier("water"), Then.replaceWith(Make.Name("milk"))), (Be.Return, Then.removeIt)],
+		lambda: [(IfThis.isConstant_value(89), Then.replaceWith(Make.Constant(13))), (IfThis.isConstant_value(13), Then.replaceWith(Make.Constant(144)))],
+		lambda: [(Be.Return, Then.replaceWith(Make.Expr(Make.Name("water")))), (IfThis.isNameIdentifier("water"), Then.replaceWith(Make.Name("milk")))],
+		lambda: [(IfThis.isNameIdentifier("water"), Then.replaceWith(Make.Name("milk"))), (Be.Call, Then.replaceWith(Make.Constant(None)))],
+		lambda: [(Be.Assign, Then.insertThisAbove([Make.Pass()])), (Be.Pass, Then.insertThisBelow([Make.Break()])), (Be.Break, Then.removeIt)],
+		lambda: [(Be.Add, Then.replaceWith(Make.Mult())), (Be.FunctionDef, Grab.nameAttribute(Then.replaceWith("cook"))), (Be.Mult, Then.replaceWith(Make.Sub()))],
+	])
+	def testNodeChangerSuiteSameAsSeparatePasses(self, factoryRules: Callable[[], list[tuple[Callable[[ast.AST], bool], Callable[[Any], Any]]]]) -> None:
+		"""Test NodeChangerSuite transforms trees identically to separate NodeChanger passes."""
+		astModuleFused = ast.parse(sourceKitchen)
+		astModuleSeparate = ast.parse(sourceKitchen)
+		NodeChangerSuite(factoryRules()).visit(astModuleFused)
+		for findThis, doThat in factoryRules():
+			NodeChanger(findThis, doThat).visit(astModuleSeparate)
+		assert ast.dump(astModuleFused) == ast.dump(astModuleSeparate)
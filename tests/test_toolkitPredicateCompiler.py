@@ -0,0 +1,99 @@
+"""Tests for compilePredicate."""
+# pyright: standard
+from astToolkit import Be, compilePredicate, IfThis, NodeTourist, Then
+from astToolkit._toolkitNodeVisitor import nodeTypesOfPredicate
+from astToolkit._toolkitPredicateCompiler import _dictionaryShape2Factory
+from collections.abc import Callable
+from typing import Any
+import ast
+import pytest
+
+sourceBakery: str = '''
+import numpy as np
+from typing import TypeVar
+T = TypeVar('T')
+oven = np.zeros(3)
+if not np.isfinite:
+	bake(*flour, **sugar)
+def bake(flour, sugar=2, *rest, crust=None):
+	dough = flour.mix(sugar)[0]
+	dough.rise = not dough.rise
+	cake = bake.dough.rise(dough, crust=crust)
+	return cake
+class Bakery(Shop):
+	bread: int = 0
+	bread, roll = bake(bread), roll
+'''
+
+listPredicates: list[Callable[[ast.AST], Any]] = [
+	Be.Name,
+	Be.expr,
+	Be.Assign.valueIs(IfThis.isCallIdentifier('TypeVar')),
+	Be.Assign.targetsIs(Be.at(0, Be.Name.idIs(IfThis.isIdentifier('T')))),
+	Be.Assign.targetsIs(Be.at(0, Be.Tuple)),
+	IfThis.is_argIdentifier('sugar'),
+	IfThis.is_keywordIdentifier('crust'),
+	IfThis.isAttributeIdentifier('dough'),
+	IfThis.isAttributeIdentifier('bake'),
+	IfThis.isAttributeNamespaceIdentifier('np', 'zeros'),
+	IfThis.isCallAttributeNamespaceIdentifier('np', 'zeros'),
+	IfThis.isClassDefIdentifier('Bakery'),
+	IfThis.isConstant_value(0),
+	IfThis.isFunctionDefIdentifier('bake'),
+	IfThis.isIfUnaryNotAttributeNamespaceIdentifier('np', 'isfinite'),
+	IfThis.isNestedNameIdentifier('dough'),
+	IfThis.isStarredIdentifier('flour'),
+	IfThis.isSubscriptIdentifier('flour'),
+	IfThis.isUnaryNotAttributeNamespaceIdentifier('dough', 'rise'),
+	IfThis.isAllOf(Be.expr, Be.Name, Be.Name.ctxIs(Be.Store)),
+	IfThis.isAnyOf(Be.Return, Be.AnnAssign.targetIs(Be.Name), IfThis.isAllOf()),
+	IfThis.isAllOf(IfThis.isAnyOf(Be.Name, Be.Attribute), Be.Attribute.attrIs(lambda attr: attr.startswith('r'))),
+	IfThis.matchesMeButNotAnyDescendant(Be.Call),
+	IfThis.isAllOf(Be.Name, Be.Call),
+]
+
+@pytest.fixture
+def astModuleBakery() -> ast.Module:
+	return ast.parse(sourceBakery)
+
+class TestCompilePredicate:
+	"""Test suite for the equivalence, caching, and annotations of compiled predicates."""
+
+	@pytest.mark.parametrize("predicate", listPredicates)
+	def testEquivalent(self, predicate: Callable[[ast.AST], Any], astModuleBakery: ast.Module) -> None:
+		"""Test the compiled predicate has the same truth value as the predicate for every node."""
+		predicateCompiled = compilePredicate(predicate)
+		listNodes = list(ast.walk(astModuleBakery))
+		assert [bool(predicateCompiled(node)) for node in listNodes] == [bool(predicate(node)) for node in listNodes]
+
+	@pytest.mark.parametrize("predicate", listPredicates)
+	def testNodeTypesPreserved(self, predicate: Callable[[ast.AST], Any]) -> None:
+		"""Test the compiled predicate has the `TypeIs` classes of the predicate, so visitors dispatch the same way."""
+		assert nodeTypesOfPredicate(compilePredicate(predicate)) == nodeTypesOfPredicate(predicate)
+
+	def testFlattened(self) -> None:
+		"""Test a chain of `Be` attribute predicates becomes one function that calls nothing else."""
+		predicateCompiled = compilePredicate(Be.Assign.valueIs(IfThis.isCallIdentifier('TypeVar')))
+		assert not any(callable(cell.cell_contents) and not isinstance(cell.cell_contents, type) for cell in predicateCompiled.__closure__ or ())
+
+	def testCachedByStructure(self) -> None:
+		"""Test predicates with the same structure but different values share the compiled code."""
+		predicateFlour = compilePredicate(IfThis.isCallAttributeNamespaceIdentifier('np', 'zeros'))
+		countFactories = len(_dictionaryShape2Factory)
+		predicateSugar = compilePredicate(IfThis.isCallAttributeNamespaceIdentifier('numpy', 'ones'))
+		assert len(_dictionaryShape2Factory) == countFactories
+		assert predicateFlour.__code__ is predicateSugar.__code__
+		assert predicateFlour is not predicateSugar
+
+	def testRecursive(self, astModuleBakery: ast.Module) -> None:
+		"""Test a predicate that refers to itself compiles into a function that calls itself."""
+		predicateCompiled = compilePredicate(IfThis.isNestedNameIdentifier('bake'))
+		assert 'predicateCompiled' in predicateCompiled.__code__.co_freevars
+		listFound = NodeTourist(predicateCompiled, Then.extractIt).captureMatches(astModuleBakery)
+		assert 'bake.dough.rise' in [ast.unparse(node) for node in listFound]
+
+	def testUnrecognized(self) -> None:
+		"""Test a predicate that is not composed of `Be` and `IfThis` predicates is returned as is."""
+		def isEmptyReturn(node: ast.AST) -> bool:
+			return isinstance(node, ast.Return) and node.value is None
+		assert compilePredicate(isEmptyReturn) is isEmptyReturn
@@ -0,0 +1,68 @@
+"""Tests for metadataOfPredicate."""
+# pyright: standard
+from astToolkit import Be, IfThis, metadataOfPredicate, NodeTourist, PredicateMetadata, Then
+from collections.abc import Callable
+from functools import wraps
+import ast
+import pytest
+
+class TestMetadataOfPredicate:
+	"""Test suite for reading the structure of `Be` and `IfThis` predicates."""
+
+	@pytest.mark.parametrize("predicate,kindExpected,nodeTypesExpected,attributePathExpected", [
+		(Be.Name, 'isinstance', (ast.Name,), ()),
+		(Be.Add, 'isinstance', (ast.Add,), ()),
+		(Be.Call.funcIs(Be.Name), 'attribute', (ast.Call,), ('func',)),
+		(IfThis.isNameIdentifier("flour"), 'attribute', (ast.Name,), ('id',)),
+		(Be.at(0, Be.Name), 'index', None, (0,)),
+		(IfThis.isIdentifier("flour"), 'equal', None, ()),
+		(IfThis.isAllOf(Be.stmt, Be.Return), 'allOf', (ast.Return,), ()),
+		(IfThis.isAnyOf(Be.Return, Be.Yield), 'anyOf', (ast.Return, ast.Yield), ()),
+		(IfThis.matchesNoDescendant(Be.Call), 'noDescendant', None, ()),
+		(IfThis.isAttributeNamespaceIdentifier("np", "zeros"), 'allOf', (ast.Attribute,), ()),
+		(IfThis.isNestedNameIdentifier("flour"), 'anyOf', (ast.Attribute, ast.Name, ast.Starred, ast.Subscript), ()),
+		(lambda node: isinstance(node, ast.Name), 'opaque', None, ()),
+	])
+	def testKindNodeTypesAttributePath(self, predicate: Callable[..., object], kindExpected: str, nodeTypesExpected: tuple[type[ast.AST], ...] | None, attributePathExpected: tuple[str | int, ...]) -> None:
+		"""Test the kind, the candidate classes, and the attribute of each kind of predicate."""
+		predicateMetadata = metadataOfPredicate(predicate)
+		assert isinstance(predicateMetadata, PredicateMetadata)
+		assert predicateMetadata.kind == kindExpected
+		assert predicateMetadata.nodeTypes == nodeTypesExpected
+		assert predicateMetadata.attributePath == attributePathExpected
+
+	def testChildPredicatesChain(self) -> None:
+		"""Test following the child predicates reads the whole attribute path of a chain."""
+		predicate: Callable[..., object] = Be.Assign.valueIs(IfThis.isCallIdentifier("bake"))
+		listAttributePath: list[str | int] = []
+		predicateMetadata = metadataOfPredicate(predicate)
+		while predicateMetadata.kind == 'attribute':
+			listAttributePath.extend(predicateMetadata.attributePath)
+			predicateMetadata = metadataOfPredicate(predicateMetadata.childPredicates[0])
+		assert listAttributePath == ['value', 'func', 'id']
+		assert predicateMetadata.kind == 'equal'
+		assert predicateMetadata.value == "bake"
+
+	def testChildPredicatesOfCombination(self) -> None:
+		"""Test `isAllOf` and `isAnyOf` expose the predicates they combine, in order."""
+		listPredicates: list[Callable[[ast.AST], bool]] = [Be.Name, Be.Name.ctxIs(Be.Store)]
+		assert list(metadataOfPredicate(IfThis.isAllOf(*listPredicates)).childPredicates) == listPredicates
+
+	@pytest.mark.parametrize("predicateWrapped", [IfThis.isAllOf(Be.Name, IfThis.isNameIdentifier("flour")), IfThis.isIdentifier("flour"), Be.Call.funcIs(Be.Name)])
+	def testWrapperIsOpaque(self, predicateWrapped: Callable[[ast.AST], bool]) -> None:
+		"""Test a `functools.wraps` wrapper, which copies the module and the name of a predicate, is opaque, and a visitor calls it."""
+		listCalled: list[ast.AST] = []
+		@wraps(predicateWrapped)
+		def logged(node: ast.AST) -> bool:
+			listCalled.append(node)
+			return predicateWrapped(node)
+
+		assert metadataOfPredicate(logged).kind == 'opaque'
+		astModule = ast.parse("flour(flour)")
+		assert NodeTourist(logged, Then.extractIt).captureMatches(astModule) == NodeTourist(predicateWrapped, Then.extractIt).captureMatches(astModule)
+		assert listCalled
+
+	def testCached(self) -> None:
+		"""Test the metadata of a predicate is computed once."""
+		predicate = IfThis.isCallIdentifier("bake")
+		assert metadataOfPredicate(predicate) is metadataOfPredicate(predicate)
@@ -0,0 +1,66 @@
+"""Tests for ProfilerOfRules."""
+# pyright: standard
+from astToolkit import Be, DOT, IfThis, Make, NodeChanger, NodeTourist, NodeTouristSuite, ProfilerOfRules, Then
+from typing import Any
+import ast
+import json
+
+sourceKitchen: str = '''
+def bakeBread(flour, water):
+	dough = mix(flour, water)
+	return knead(dough) + 13
+
+def boilWater(water):
+	return heat(water, 89)
+'''
+
+class TestProfilerOfRules:
+	"""Test suite for counting and timing `findThis` and `doThat`."""
+
+	def testCountsAndHitRatio(self) -> None:
+		"""Test the counts are the candidate nodes and the matches of each rule."""
+		profiler = ProfilerOfRules()
+		astModule = ast.parse(sourceKitchen)
+		listNames: list[Any] = profiler.instrument(NodeTourist(Be.FunctionDef, DOT.name), "functions").captureMatches(astModule)
+		assert listNames == ["bakeBread", "boilWater"]
+		profiler.instrument(NodeChanger(IfThis.isNameIdentifier("water"), Then.replaceWith(Make.Name("milk"))), "water").visit(astModule)
+		report = profiler.asDict()
+		assert list(report) == ["functions", "water"]
+		assert report["functions"]["countFindThis"] == 2
+		assert report["functions"]["countMatches"] == 2
+		assert report["functions"]["hitRatio"] == 1.0
+		countNames: int = sum(1 for node in ast.walk(ast.parse(sourceKitchen)) if isinstance(node, ast.Name))
+		assert report["water"]["countFindThis"] == countNames
+		assert report["water"]["countMatches"] == 2
+		assert report["water"]["hitRatio"] == 2 / countNames
+		assert report["water"]["secondsFindThis"] > 0
+
+	def testAggregatesSameIdentifier(self) -> None:
+		"""Test rules with the same identifier share one entry, and reset sets the entry to 0."""
+		profiler = ProfilerOfRules()
+		for _pass in range(3):
+			profiler.instrument(NodeTourist(Be.Return, Then.extractIt)).visit(ast.parse(sourceKitchen))
+		(identifierRule, statistics), = profiler.asDict().items()
+		assert identifierRule.startswith("NodeTourist(")
+		assert statistics["countMatches"] == 6
+		profiler.reset()
+		assert profiler.asDict()[identifierRule]["countMatches"] == 0
+
+	def testInstrumentSuite(self) -> None:
+		"""Test each rule of a suite has its own entry and the dispatch by node class is kept."""
+		profiler = ProfilerOfRules()
+		suite = profiler.instrument(NodeTouristSuite([(Be.Return, Then.extractIt), (Be.Call, Then.extractIt)]), "kitchen")
+		suite.visit(ast.parse(sourceKitchen))
+		report = json.loads(profiler.asJSON())
+		assert report["kitchen[0]"]["countFindThis"] == 2
+		assert report["kitchen[1]"]["countMatches"] == 3
+
+	def testReuseInstrumentedPredicate(self) -> None:
+		"""Test an instrumented `findThis` can be the `findThis` of another visitor, which keeps the dispatch by node class."""
+		profiler = ProfilerOfRules()
+		findThis = profiler.instrument(NodeTourist(IfThis.isAnyOf(Be.Name, Be.Call), Then.extractIt), "names and calls").findThis
+		nodeTourist = NodeTourist(findThis, Then.extractIt)
+		assert set(nodeTourist.nodeTypes or ()) == {ast.Name, ast.Call}
+		listFound = nodeTourist.captureMatches(ast.parse(sourceKitchen))
+		assert len(listFound) == sum(1 for node in ast.walk(ast.parse(sourceKitchen)) if isinstance(node, (ast.Name, ast.Call)))
+		assert profiler.asDict()["names and calls"]["countMatches"] == len(listFound)
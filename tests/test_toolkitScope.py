@@ -0,0 +1,130 @@
+"""Tests for ScopeAnalysis."""
+# pyright: standard
+from astToolkit import Be, Make, NodeChanger, ScopeAnalysis, Then
+import ast
+import pytest
+import symtable
+
+sourceKitchen: str = '''
+import os.path
+oven = 350
+def bake(flour, sugar=oven, *, eggs):
+	cake = [flour for flour in sugar]
+	icing = lambda sugar: sugar + flour
+	def frost(layer):
+		nonlocal cake
+		cake = cake + layer
+		return len(icing)
+	class Tray:
+		flour = eggs
+		def slide(self):
+			return flour
+	if (total := len(cake)) > 0:
+		del total
+	return frost(cake)
+def fry():
+	global oven
+	oven += 1
+	return [crumb := piece for piece in os.path.sep]
+'''
+
+@pytest.fixture
+def scopeAnalysisKitchen() -> ScopeAnalysis:
+	return ScopeAnalysis(ast.parse(sourceKitchen))
+
+def functionDefOf(scopeAnalysis: ScopeAnalysis, identifier: str) -> ast.AST:
+	return next(node for node in ast.walk(scopeAnalysis.root) if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and node.name == identifier)
+
+class TestScopeAnalysis:
+	"""Test suite for the scopes, the bound and free names, and the def-use chains of ScopeAnalysis."""
+
+	def testBoundAndFree(self, scopeAnalysisKitchen: ScopeAnalysis) -> None:
+		"""Test the bound and free names of functions, classes, and the module, with `global` and `nonlocal`."""
+		scopeBake = scopeAnalysisKitchen.scopeOf(functionDefOf(scopeAnalysisKitchen, 'bake'))
+		scopeFrost = scopeAnalysisKitchen.scopeOf(functionDefOf(scopeAnalysisKitchen, 'frost'))
+		scopeTray = scopeAnalysisKitchen.scopeOf(functionDefOf(scopeAnalysisKitchen, 'Tray'))
+		scopeFry = scopeAnalysisKitchen.scopeOf(functionDefOf(scopeAnalysisKitchen, 'fry'))
+		assert scopeBake.setBound == {'flour', 'sugar', 'eggs', 'cake', 'icing', 'frost', 'Tray', 'total'}
+		assert scopeFrost.setBound == {'layer'} and scopeFrost.setNonlocal == {'cake'} and scopeFrost.setFree == {'cake', 'icing'}
+		assert scopeTray.setBound == {'flour', 'slide'} and scopeTray.setFree == {'eggs', 'flour'}
+		assert scopeFry.setBound == {'crumb'} and scopeFry.setGlobal == {'oven'}
+		assert scopeAnalysisKitchen.scopeRoot.setBound == {'os', 'oven', 'bake', 'fry'}
+
+	@pytest.mark.parametrize("identifier", ['bake', 'frost', 'slide', 'fry'])
+	def testAgreesWithSymtable(self, scopeAnalysisKitchen: ScopeAnalysis, identifier: str) -> None:
+		"""Test the bound and free names of each function agree with `symtable`, apart from the names of comprehensions, which `symtable` inlines."""
+		scope = scopeAnalysisKitchen.scopeOf(functionDefOf(scopeAnalysisKitchen, identifier))
+		stack = [symtable.symtable(sourceKitchen, '<kitchen>', 'exec')]
+		while stack:
+			table = stack.pop()
+			if table.get_name() == identifier and isinstance(table, symtable.Function):
+				break
+			stack.extend(table.get_children())
+		setComprehension = {identifierBound for child in scope.listChildren if Be.ListComp(child.node) for identifierBound in child.setBound}
+		assert set(table.get_locals()) | setComprehension == scope.setBound | setComprehension
+		assert set(table.get_frees()) == scope.setFree
+
+	def testDelBindsLocally(self) -> None:
+		"""Test `del` makes the name local to the scope, as `symtable` does, and the `del` is a use of the local name."""
+		source = 'x = 1\ndef f():\n\tdel x\n'
+		scopeAnalysis = ScopeAnalysis(ast.parse(source))
+		FunctionDef = functionDefOf(scopeAnalysis, 'f')
+		table = symtable.symtable(source, '<del>', 'exec').get_children()[0]
+		assert set(table.get_locals()) == scopeAnalysis.scopeOf(FunctionDef).setBound == {'x'}
+		nameDel = FunctionDef.body[0].targets[0]
+		assert scopeAnalysis.bindingOf(nameDel) is scopeAnalysis.scopeOf(FunctionDef)
+		assert scopeAnalysis.usesOf(nameDel) == [nameDel]
+		assert scopeAnalysis.scopeRoot.dictionaryIdentifier2Uses.get('x', []) == []
+
+	def testDefUseChains(self, scopeAnalysisKitchen: ScopeAnalysis) -> None:
+		"""Test each use resolves to the nearest binding, skipping classes, and comprehensions and lambdas shadow parameters."""
+		FunctionDefBake = functionDefOf(scopeAnalysisKitchen, 'bake')
+		scopeBake = scopeAnalysisKitchen.scopeOf(FunctionDefBake)
+		ast_argFlour = FunctionDefBake.args.args[0]
+		listUsesFlour = scopeAnalysisKitchen.usesOf(ast_argFlour)
+		assert [(node.lineno, node.col_offset) for node in listUsesFlour] == [(6, 31), (14, 10)]
+		assert scopeAnalysisKitchen.definitionsOf(listUsesFlour[1]) == [ast_argFlour]
+		assert [node.lineno for node in scopeBake.dictionaryIdentifier2Uses['sugar']] == [5]
+		assert [node.lineno for node in scopeBake.dictionaryIdentifier2Definitions['cake']] == [5, 9]
+		assert [node.lineno for node in scopeBake.dictionaryIdentifier2Uses['total']] == [16]
+		assert scopeAnalysisKitchen.bindingOf(FunctionDefBake.args.defaults[0]) is scopeAnalysisKitchen.scopeRoot
+
+	def testAugAssignAndBuiltins(self, scopeAnalysisKitchen: ScopeAnalysis) -> None:
+		"""Test the target of `+=` is a definition and a use, and a builtin resolves to no scope."""
+		listDefinitionsOven = scopeAnalysisKitchen.scopeRoot.dictionaryIdentifier2Definitions['oven']
+		assert [node.lineno for node in listDefinitionsOven] == [3, 20]
+		assert listDefinitionsOven[1] in scopeAnalysisKitchen.usesOf(listDefinitionsOven[0])
+		nameLen = next(node for node in ast.walk(scopeAnalysisKitchen.root) if isinstance(node, ast.Name) and node.id == 'len')
+		assert scopeAnalysisKitchen.bindingOf(nameLen) is None
+		assert scopeAnalysisKitchen.usesOf(nameLen) == []
+
+	def testClassTypeParameterInMethodResolvesToNoScope(self) -> None:
+		"""Test a use of a type parameter of a class in a method resolves to no scope, while `symtable` makes it free in the method."""
+		source = 'class Box[T]:\n\tdef get(self):\n\t\treturn T\n'
+		scopeAnalysis = ScopeAnalysis(ast.parse(source))
+		nameT = next(node for node in ast.walk(scopeAnalysis.root) if isinstance(node, ast.Name) and node.id == 'T')
+		assert scopeAnalysis.bindingOf(nameT) is None
+		assert scopeAnalysis.scopeOf(functionDefOf(scopeAnalysis, 'Box')).setBound == {'T', 'get'}
+		assert scopeAnalysis.scopeOf(functionDefOf(scopeAnalysis, 'get')).setFree == set()
+		stack = [symtable.symtable(source, '<box>', 'exec')]
+		while stack:
+			table = stack.pop()
+			if table.get_name() == 'get' and isinstance(table, symtable.Function):
+				break
+			stack.extend(table.get_children())
+		assert table.get_frees() == ('T',)
+
+	def testRebuildAfterWatchedChange(self) -> None:
+		"""Test the analysis is rebuilt after a watched `NodeChanger` changes the tree."""
+		astModule = ast.parse('def bake(flour):\n\tpass\n')
+		scopeAnalysis = ScopeAnalysis(astModule)
+		assert not scopeAnalysis.scopeOf(astModule.body[0]).isUsed('flour')
+		scopeAnalysis.watch(NodeChanger(Be.Pass, Then.replaceWith(Make.Expr(Make.Name('flour'))))).visit(astModule)
+		assert scopeAnalysis.scopeOf(astModule.body[0]).isUsed('flour')
+
+	def testNotInTree(self, scopeAnalysisKitchen: ScopeAnalysis) -> None:
+		"""Test a node without a scope, or without a name, raises `ValueError`."""
+		with pytest.raises(ValueError, match='not a module'):
+			scopeAnalysisKitchen.scopeOf(Make.Pass())
+		with pytest.raises(ValueError, match='does not define or use'):
+			scopeAnalysisKitchen.bindingOf(Make.Name('cake'))
@@ -0,0 +1,78 @@
+"""Tests for structural hashing and structural equality."""
+# pyright: standard
+from astToolkit import areStructurallyEqual, IfThis, Make, StructuralHasher, structuralHash
+import ast
+import pytest
+
+class TestStructuralEquality:
+	"""Test suite for areStructurallyEqual and structuralHash."""
+
+	@pytest.mark.parametrize("sourceA,sourceB,ignoreContext,isEqualExpected", [
+		("flour + sugar", "flour + sugar", False, True),
+		("flour + sugar", "(flour)   +   sugar", False, True),
+		("flour + sugar", "flour - sugar", False, False),
+		("flour + sugar", "flour + salt", False, False),
+		("bake(flour, 2)", "bake(flour, 2.0)", False, False),
+		("bake(flour, 1)", "bake(flour, True)", False, False),
+		("bake(0.0)", "bake(-0.0)", False, False),
+		("[flour, sugar]", "[flour, sugar, salt]", False, False),
+		("def bake(flour): return flour", "def bake(flour):\n\treturn flour", False, True),
+	])
+	def testEqualityAndHash(self, sourceA: str, sourceB: str, ignoreContext: bool, isEqualExpected: bool) -> None:
+		"""Test structurally equal trees are equal and have equal hashes, and positions are ignored."""
+		nodeA = ast.parse(sourceA)
+		nodeB = ast.parse(sourceB)
+		assert areStructurallyEqual(nodeA, nodeB, ignoreContext=ignoreContext) is isEqualExpected
+		if isEqualExpected:
+			assert structuralHash(nodeA, ignoreContext=ignoreContext) == structuralHash(nodeB, ignoreContext=ignoreContext)
+
+	def testIgnoreContext(self) -> None:
+		"""Test `ctx` distinguishes trees unless it is ignored."""
+		nameLoad = Make.Name("dough")
+		nameStore = Make.Name("dough", context=Make.Store())
+		assert not areStructurallyEqual(nameLoad, nameStore)
+		assert areStructurallyEqual(nameLoad, nameStore, ignoreContext=True)
+		assert structuralHash(nameLoad, ignoreContext=True) == structuralHash(nameStore, ignoreContext=True)
+
+	def testSubclassOfNodeClass(self) -> None:
+		"""Test `Make.Add`, a subclass of `ast.Add`, equals `ast.Add`."""
+		binOpMake = Make.BinOp(Make.Name("flour"), Make.Add(), Make.Name("sugar"))
+		binOpParsed = ast.parse("flour + sugar", mode="eval").body
+		assert areStructurallyEqual(binOpMake, binOpParsed)
+		assert structuralHash(binOpMake) == structuralHash(binOpParsed)
+
+	def testDeepTree(self) -> None:
+		"""Test a tree deeper than the recursion limit."""
+		nodeA = ast.parse("+".join(["flour"] * 5000), mode="eval")
+		nodeB = ast.parse("+".join(["flour"] * 5000), mode="eval")
+		assert areStructurallyEqual(nodeA, nodeB)
+		assert structuralHash(nodeA) == structuralHash(nodeB)
+
+class TestStructuralHasher:
+	"""Test suite for the memoized hashes of StructuralHasher."""
+
+	def testHashOfEveryNodeInOnePass(self) -> None:
+		"""Test hashing the root remembers the hash of every node, and the hashes agree with structuralHash."""
+		astModule = ast.parse("dough = mix(flour, sugar)\ncake = mix(flour, sugar)")
+		structuralHasher = StructuralHasher()
+		structuralHasher.hashOf(astModule)
+		for node in ast.walk(astModule):
+			assert node in structuralHasher._dictionaryNode2Hash
+			assert structuralHasher.hashOf(node) == structuralHash(node)
+
+	def testIsEqualFindsDuplicates(self) -> None:
+		"""Test isEqual groups the duplicate expressions of a module."""
+		astModule = ast.parse("dough = mix(flour, sugar)\ncake = mix(flour, sugar)\nbread = mix(flour, salt)")
+		structuralHasher = StructuralHasher(ignoreContext=True)
+		listCalls = [node for node in ast.walk(astModule) if isinstance(node, ast.Call)]
+		assert structuralHasher.isEqual(listCalls[0], listCalls[1])
+		assert not structuralHasher.isEqual(listCalls[0], listCalls[2])
+
+	@pytest.mark.parametrize("nodeFirst,nodeSecond,isEqualExpected", [
+		(Make.Name("dough"), Make.Name("dough", context=Make.Store()), True),
+		(Make.Constant(233), Make.Constant(89), False),
+		(Make.Constant(-1), Make.UnaryOp(Make.USub(), Make.Constant(1)), False),
+	])
+	def testUnparseIsStructural(self, nodeFirst: ast.AST, nodeSecond: ast.AST, isEqualExpected: bool) -> None:
+		"""Test unparseIs with `structural=True` compares structure, ignoring `ctx`."""
+		assert IfThis.unparseIs(nodeFirst, structural=True)(nodeSecond) is isEqualExpected
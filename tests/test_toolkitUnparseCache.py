@@ -0,0 +1,90 @@
+"""Tests for UnparseCache."""
+# pyright: standard
+from astToolkit import Be, IfThis, Make, NodeChanger, NodeTourist, Then, UnparseCache
+from typing import Any
+import ast
+import pytest
+
+sourceBakery: str = '''
+def bake(flour):
+	dough = mix(flour, 2)
+	return dough
+def rise(dough):
+	return dough * 2
+'''
+
+@pytest.fixture
+def astModuleBakery() -> ast.Module:
+	return ast.parse(sourceBakery)
+
+class TestUnparseCache:
+	"""Test suite for caching and invalidating the code of nodes."""
+
+	def testUnparseOncePerNode(self, astModuleBakery: ast.Module, monkeypatch: pytest.MonkeyPatch) -> None:
+		"""Test each node is unparsed once, however many predicates check it."""
+		listUnparsed: list[ast.AST] = []
+		unparse = ast.unparse
+		def unparseCounted(node: ast.AST) -> str:
+			listUnparsed.append(node)
+			return unparse(node)
+		unparseCache = UnparseCache()
+		listReferences = [ast.parse(source).body[0].value for source in ('dough', 'flour', 'dough * 2')]
+		listExpected = [NodeTourist(IfThis.unparseIs(reference), Then.extractIt).captureMatches(astModuleBakery) for reference in listReferences]
+		listPredicates = [IfThis.unparseIs(reference, unparseCache=unparseCache) for reference in listReferences]
+		monkeypatch.setattr(ast, 'unparse', unparseCounted)
+		assert [NodeTourist(predicate, Then.extractIt).captureMatches(astModuleBakery) for predicate in listPredicates] == listExpected
+		assert len(listUnparsed) == len({id(node) for node in listUnparsed}) == len(unparseCache)
+
+	def testWatchInvalidatesAncestorsAndDescendants(self, astModuleBakery: ast.Module) -> None:
+		"""Test a watched `NodeChanger` discards the code of the visited node, its ancestors, and its descendants, and keeps the rest."""
+		functionBake, functionRise = astModuleBakery.body
+		unparseCache = UnparseCache()
+		for node in ast.walk(astModuleBakery):
+			unparseCache.unparse(node)
+		returnRise: Any = functionRise.body[0]
+		unparseCache.watch(NodeChanger(Be.BinOp, Then.replaceWith(Make.Name('pie')))).visit(returnRise)
+		assert returnRise not in unparseCache
+		assert functionRise not in unparseCache
+		assert astModuleBakery not in unparseCache
+		assert functionBake in unparseCache
+		assert unparseCache.unparse(astModuleBakery) == ast.unparse(astModuleBakery)
+		assert unparseCache.unparse(functionRise).endswith('return pie')
+
+	def testUnchangedTreeKeepsCode(self, astModuleBakery: ast.Module) -> None:
+		"""Test a watched `NodeChanger` that changes nothing discards nothing."""
+		unparseCache = UnparseCache()
+		unparseCache.unparse(astModuleBakery)
+		unparseCache.watch(NodeChanger(Be.Global, Then.removeIt)).visit(astModuleBakery)
+		assert astModuleBakery in unparseCache
+
+	def testInvalidateAfterReunparse(self, astModuleBakery: ast.Module) -> None:
+		"""Test the parents of new nodes are recorded when an ancestor is unparsed again."""
+		unparseCache = UnparseCache()
+		unparseCache.unparse(astModuleBakery)
+		functionRise: Any = astModuleBakery.body[1]
+		returnNew = Make.Return(Make.Name('cake'))
+		functionRise.body[0] = returnNew
+		unparseCache.invalidate(functionRise)
+		assert 'return cake' in unparseCache.unparse(astModuleBakery)
+		returnNew.value = Make.Name('pie')
+		unparseCache.invalidate(returnNew)
+		assert astModuleBakery not in unparseCache
+		assert 'return pie' in unparseCache.unparse(astModuleBakery)
+		unparseCache.invalidate()
+		assert len(unparseCache) == 0
+
+	def testUnparseIsPrecomputesReference(self, monkeypatch: pytest.MonkeyPatch) -> None:
+		"""Test `unparseIs` unparses the reference once, when it makes the predicate."""
+		listUnparsed: list[ast.AST] = []
+		unparse = ast.unparse
+		def unparseCounted(node: ast.AST) -> str:
+			listUnparsed.append(node)
+			return unparse(node)
+		monkeypatch.setattr(ast, 'unparse', unparseCounted)
+		reference = Make.Name('dough')
+		predicate = IfThis.unparseIs(reference)
+		nodeName = Make.Name('dough')
+		assert predicate(nodeName)
+		assert not predicate(Make.Name('flour'))
+		assert listUnparsed.count(reference) == 1
+		assert len(listUnparsed) == 3
@@ -2,7 +2,7 @@
 # pyright: standard
 from astToolkit import Make
 from astToolkit.transformationTools import (
-	inlineFunctionDef, makeDictionaryAsyncFunctionDef, makeDictionaryClassDef, makeDictionaryFunctionDef,
+	inlineFunctionDef, Inliner, makeDictionaryAsyncFunctionDef, makeDictionaryClassDef, makeDictionaryFunctionDef,
 	makeDictionaryMosDef, pythonCode2ast_expr, removeUnusedParameters, unjoinBinOP, unparseFindReplace, write_astModule)
 from io import StringIO
 from pathlib import Path
@@ -130,6 +130,127 @@ class TestInlineFunctionDef:
 		assert resultFunctionDef.name == "functionStandalone", \
 			"inlineFunctionDef: should preserve function name"
 
+	def testInlineFunctionDefChainedHelpers(self) -> None:
+		"""Test inlineFunctionDef substitutes the helpers of the called functions once, and changes the called functions."""
+		astModule = ast.parse("""
+def leaf(a):
+	return a + 1
+def middle(a):
+	b = leaf(a)
+	return b
+def top(a):
+	c = middle(a)
+	return c
+def target(a):
+	d = top(a)
+	return d
+""")
+
+		resultFunctionDef = inlineFunctionDef("target", astModule)
+
+		assert ast.unparse(resultFunctionDef).splitlines()[1:] == ["    b = leaf(a)", "    return d"], \
+			"inlineFunctionDef: should substitute the helpers of the called functions in one pass"
+		assert ast.unparse(astModule.body[2]).splitlines()[1:] == ["    b = leaf(a)", "    return c"], \
+			"inlineFunctionDef: should substitute the helpers into the called functions of astModule"
+		assert ast.unparse(astModule.body[1]).splitlines()[1:] == ["    b = leaf(a)", "    return b"], \
+			"inlineFunctionDef: should not change the functions that the target does not call"
+
+	def testInlineFunctionDefMutualRecursion(self) -> None:
+		"""Test inlineFunctionDef inlines the functions of a cycle that does not include the target once."""
+		astModule = ast.parse("""
+def ping(n):
+	return pong(n) + 1
+def pong(n):
+	return ping(n) * 2
+def target(n):
+	return ping(n)
+""")
+
+		resultFunctionDef = inlineFunctionDef("target", astModule)
+
+		assert ast.unparse(resultFunctionDef.body[0]) == "return ping(n) * 2 + 1", \
+			"inlineFunctionDef: should inline each function of the cycle once"
+		assert ast.unparse(astModule.body[0].body[0]) == "return ping(n) * 2 + 1", \
+			"inlineFunctionDef: should substitute the helpers into the called functions of astModule"
+
+	def testInlineFunctionDefCallsBackToTarget(self) -> None:
+		"""Test inlineFunctionDef returns a finite tree if a called function calls the target."""
+		astModule = ast.parse("""
+def countdown(n):
+	return countdown(n - 1)
+def ping(n):
+	return target(n)
+def double(n):
+	return n * 2
+def target(n):
+	return countdown(n) + ping(n) + double(n)
+""")
+
+		resultFunctionDef = inlineFunctionDef("target", astModule)
+
+		assert ast.unparse(resultFunctionDef.body[0]) == "return countdown(n - 1) + (countdown(n) + ping(n) + double(n)) + n * 2", \
+			"inlineFunctionDef: should inline each called function once"
+
+
+sourceInlinerKitchen: str = """
+def measure(a):
+	return a * 2
+def mix(a):
+	b = measure(a)
+	return b
+def bake(a):
+	c = mix(a)
+	return c
+def fry(a):
+	d = measure(a) + 1
+	return d
+def steam(a):
+	return steam(a - 1) + mix(a)
+"""
+
+class TestInliner:
+	"""Test suite for Inliner class."""
+
+	@pytest.mark.parametrize("identifierToInline", ["bake", "fry", "steam", "mix", "measure"])
+	def testInlineMatchesInlineFunctionDef(self, identifierToInline: str) -> None:
+		"""Test Inliner.inline returns the same code as inlineFunctionDef, after inlining other targets first."""
+		inliner = Inliner(ast.parse(sourceInlinerKitchen))
+		for identifierBefore in ["bake", "fry", "steam"]:
+			inliner.inline(identifierBefore)
+
+		assert ast.unparse(inliner.inline(identifierToInline)) == ast.unparse(inlineFunctionDef(identifierToInline, ast.parse(sourceInlinerKitchen))), \
+			"Inliner.inline: should match inlineFunctionDef"
+
+	def testInlineReturnsIndependentCopies(self) -> None:
+		"""Test Inliner.inline does not change the module, and each result is a new tree."""
+		astModule = ast.parse(sourceInlinerKitchen)
+		inliner = Inliner(astModule)
+
+		FunctionDefFirst = inliner.inline("bake")
+		FunctionDefFirst.body.clear()
+		FunctionDefSecond = inliner.inline("bake")
+
+		assert ast.unparse(FunctionDefSecond).splitlines()[1:] == ["    b = a * 2", "    return c"], \
+			"Inliner.inline: should not share nodes between results"
+		assert ast.unparse(astModule) == ast.unparse(ast.parse(sourceInlinerKitchen)), \
+			"Inliner.inline: should not change astModule"
+
+	def testInlineInPlaceChangesTarget(self) -> None:
+		"""Test Inliner.inlineInPlace changes and returns the target of astModule, as inlineFunctionDef does."""
+		astModule = ast.parse(sourceInlinerKitchen)
+		FunctionDefBake = astModule.body[2]
+
+		resultFunctionDef = Inliner(astModule).inlineInPlace("bake")
+
+		assert resultFunctionDef is FunctionDefBake, \
+			"Inliner.inlineInPlace: should return the ast.FunctionDef of astModule"
+		assert ast.unparse(resultFunctionDef) == ast.unparse(inlineFunctionDef("bake", ast.parse(sourceInlinerKitchen))), \
+			"Inliner.inlineInPlace: should match inlineFunctionDef"
+
+	def testInlineMissingIdentifier(self) -> None:
+		"""Test Inliner.inline raises ValueError for missing identifier."""
+		with pytest.raises(ValueError, match="unable to find"):
+			Inliner(ast.parse(sourceInlinerKitchen)).inline("functionNonexistent")
 
 class TestPythonCode2ASTExpr:
 	"""Test suite for pythonCode2ast_expr function."""
@@ -201,6 +322,25 @@ class TestRemoveUnusedParameters:
 		assert countParametersResult == countParametersOriginal, \
 			"removeUnusedParameters: should preserve all used parameters"
 
+	def testRemoveUnusedParametersScoping(self) -> None:
+		"""Test removeUnusedParameters ignores names that a nested function, a lambda, or a comprehension binds, and keeps the defaults aligned."""
+		FunctionDef = ast.parse("""
+def bake(flour, sugar, eggs=1, milk=2, *, butter=3, salt):
+	def frost(sugar):
+		sugar = sugar + 1
+	crumbs = [flour for flour in range(3)]
+	icing = lambda milk: milk
+	total = eggs + salt
+	return flour
+""").body[0]
+
+		resultFunctionDef = removeUnusedParameters(FunctionDef)
+
+		assert ast.unparse(resultFunctionDef.args) == "eggs=1, *, salt", \
+			"removeUnusedParameters: should keep only the parameters that the function references"
+		assert ast.unparse(resultFunctionDef.body[0].args) == "sugar", \
+			"removeUnusedParameters: should not remove the parameters of a nested function"
+
 
 class TestUnjoinBinOP:
 	"""Test suite for unjoinBinOP function."""
@@ -284,6 +424,104 @@ class TestUnparseFindReplace:
 		assert "377" in codeUnparsed, \
 			"unparseFindReplace: should preserve original value when no match"
 
+	def testUnparseFindReplaceChained(self) -> None:
+		"""Test unparseFindReplace repeats passes until chained replacements are complete."""
+		treeOriginal = Make.Module([Make.Expr(Make.Call(Make.Name("alpha"), [Make.Name("beta")]))])
+		mappingReplacements: dict[ast.AST, ast.AST] = {
+			Make.Name("gamma"): Make.Constant(610),
+			Make.Name("beta"): Make.Name("gamma"),
+			Make.Name("alpha"): Make.Name("beta"),
+		}
+
+		treeResult = unparseFindReplace(treeOriginal, mappingReplacements)
+
+		assert ast.unparse(treeResult) == "610(610)", \
+			"unparseFindReplace: should apply replacements created by other replacements"
+		assert ast.unparse(treeOriginal) == "alpha(beta)", \
+			"unparseFindReplace: should not modify astTree"
+
+	def testUnparseFindReplaceTextualNoOp(self) -> None:
+		"""Test unparseFindReplace terminates when a replacement does not change the text."""
+		treeOriginal = Make.Module([Make.Expr(Make.Name("variableGamma"))])
+		mappingReplacements: dict[ast.AST, ast.AST] = {
+			Make.Name("variableGamma"): Make.Name("variableGamma", context=Make.Store()),
+		}
+
+		treeResult = unparseFindReplace(treeOriginal, mappingReplacements)
+
+		assert ast.unparse(treeResult) == "variableGamma", \
+			"unparseFindReplace: should stop when the text does not change"
+
+	@pytest.mark.parametrize("structural", [False, True])
+	def testUnparseFindReplaceOutermostMatchWins(self, structural: bool) -> None:
+		"""Test unparseFindReplace replaces the outermost of overlapping matches, whatever the order of the entries."""
+		treeOriginal = ast.parse("f(a, b.attr)")
+		for mappingReplacements in ({ast.parse("a", mode='eval').body: Make.Name("e"), ast.parse("f(a, b.attr)", mode='eval').body: ast.parse("h(c)", mode='eval').body},
+				{ast.parse("f(a, b.attr)", mode='eval').body: ast.parse("h(c)", mode='eval').body, ast.parse("a", mode='eval').body: Make.Name("e")}):
+			assert ast.unparse(unparseFindReplace(treeOriginal, mappingReplacements, structural=structural)) == "h(c)", \
+				"unparseFindReplace: should replace the outermost match"
+
+	def testUnparseFindReplaceFirstEntryWins(self) -> None:
+		"""Test unparseFindReplace applies the first of the entries that match the same node."""
+		mappingReplacements: dict[ast.AST, ast.AST] = {Make.Name("alpha"): Make.Name("beta"), Make.Name("alpha", context=Make.Store()): Make.Name("gamma")}
+
+		assert ast.unparse(unparseFindReplace(ast.parse("alpha"), mappingReplacements)) == "beta", \
+			"unparseFindReplace: should apply the first entry that matches"
+
+	@pytest.mark.parametrize("structural", [False, True])
+	def testUnparseFindReplaceStructural(self, structural: bool) -> None:
+		"""Test unparseFindReplace gives the same result comparing structure or text."""
+		treeOriginal = ast.parse("alpha(beta, alpha.beta)\nbeta = alpha")
+		mappingReplacements: dict[ast.AST, ast.AST] = {
+			Make.Name("beta"): Make.Name("gamma"),
+			Make.Name("alpha"): Make.Constant(610),
+			Make.Name("delta"): Make.Name("delta", context=Make.Store()),
+		}
+
+		treeResult = unparseFindReplace(treeOriginal, mappingReplacements, structural=structural)
+
+		assert ast.unparse(treeResult) == "610(gamma, 610 .beta)\ngamma = 610", \
+			"unparseFindReplace: should replace the same nodes comparing structure or text"
+
+	@pytest.mark.parametrize("structural", [False, True])
+	def testUnparseFindReplaceAncestorOfReplacement(self, structural: bool) -> None:
+		"""Test unparseFindReplace replaces an ancestor that matches only after its descendant is replaced."""
+		treeOriginal = ast.parse("print(bake(alpha))")
+		mappingReplacements: dict[ast.AST, ast.AST] = {
+			ast.parse("bake(beta)").body[0].value: Make.Name("cake"),
+			Make.Name("alpha"): Make.Name("beta"),
+		}
+
+		treeResult = unparseFindReplace(treeOriginal, mappingReplacements, structural=structural)
+
+		assert ast.unparse(treeResult) == "print(cake)", \
+			"unparseFindReplace: should replace a node that matches after a replacement inside it"
+
+	def testUnparseFindReplaceCopiesReplacement(self) -> None:
+		"""Test unparseFindReplace inserts a copy of the replacement at each match, and does not change the replacement."""
+		nodeReplace = Make.Call(Make.Name("beta"))
+		mappingReplacements: dict[ast.AST, ast.AST] = {Make.Name("alpha"): nodeReplace, Make.Name("beta"): Make.Name("gamma")}
+
+		treeResult = unparseFindReplace(ast.parse("alpha + alpha"), mappingReplacements)
+
+		assert ast.unparse(treeResult) == "gamma() + gamma()", \
+			"unparseFindReplace: should replace inside each copy"
+		assert ast.unparse(nodeReplace) == "beta()", \
+			"unparseFindReplace: should not change the replacement in the mapping"
+
+	@pytest.mark.parametrize("structural", [False, True])
+	@pytest.mark.parametrize("mappingSources", [
+		{"alpha": "beta", "beta": "alpha"},
+		{"alpha": "bake(alpha)"},
+		{"alpha": "beta", "bake(beta)": "bake(alpha)"},
+	], ids=["twoCycle", "growing", "throughAncestor"])
+	def testUnparseFindReplaceCycle(self, mappingSources: dict[str, str], structural: bool) -> None:
+		"""Test unparseFindReplace raises `ValueError` instead of replacing forever."""
+		mappingReplacements: dict[ast.AST, ast.AST] = {ast.parse(find).body[0].value: ast.parse(replace).body[0].value for find, replace in mappingSources.items()}  # pyright: ignore[reportAttributeAccessIssue]
+
+		with pytest.raises(ValueError, match="never end"):
+			unparseFindReplace(ast.parse("print(bake(alpha))"), mappingReplacements, structural=structural)
+
 
 class TestWriteASTModule:
 	"""Test suite for write_astModule function."""